@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 
+from app.core.llm.base_llm import LLMFactory
 from app.core.models.api_models import GenerateRequest
 from app.core.services.generate_api import generate_api
 
@@ -16,3 +17,15 @@ async def generate_api_spec_version(request: GenerateRequest):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@api_router.get("/llm/cache/stats")
+async def get_llm_cache_stats():
+    """
+    temperature=0 LLM 호출 응답 캐시 지표를 조회합니다.
+
+    Returns:
+        Dict[str, Any]: 적중/미적중 수, 적중률, 영속 계층 적중 수 등 (캐시를 사용하지 않으면 빈 객체)
+    """
+    response_cache = LLMFactory.get_response_cache()
+    return response_cache.stats() if response_cache else {}
@@ -1,9 +1,10 @@
 import logging
+from typing import Optional, AsyncIterator
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Query
 from fastapi.responses import StreamingResponse
 
-from app.api.dto.diagram_dto import UserChatRequest
+from app.api.dto.diagram_dto import UserChatRequest, ChatResponseList, ChatResponse
 from app.config.config import settings
 from app.core.diagram.component.component_service import ComponentService
 from app.core.diagram.connection.connection_service import ConnectionService
@@ -19,6 +20,7 @@ from app.core.llm.prompt_service import PromptService
 from app.core.services.chat_service import ChatService
 from app.core.services.chat_service_facade import ChatServiceFacade
 from app.core.services.sse_service import SSEService
+from app.core.services.sse_writer import SSEBatchWriter
 from app.infrastructure.http.client.api_client import ApiClient, GlobalFileList, ApiSpec
 
 # 로깅 설정
@@ -32,19 +34,18 @@ chat_router = APIRouter()
 
 # 의존성 주입을 위한 함수
 from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
+from app.infrastructure.mongodb.repository.repository_factory import RepositoryFactory
 
 
 def get_diagram_repository() -> DiagramRepository:
-    from app.infrastructure.mongodb.repository.diagram_repository_impl import DiagramRepositoryImpl
-    return DiagramRepositoryImpl()
+    return RepositoryFactory.get_diagram_repository()
 
 
 from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
 
 
 def get_chat_repository() -> ChatRepository:
-    from app.infrastructure.mongodb.repository.chat_repository_impl import ChatRepositoryImpl
-    return ChatRepositoryImpl()
+    return RepositoryFactory.get_chat_repository()
 
 def get_sse_service() -> SSEService:
     return SSEService()
@@ -62,41 +63,42 @@ def get_chat_service(
         diagram_repository=diagram_repository,
         chat_repository=chat_repository,
         chat_summary_chain=ChatSummaryChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
                 temperature=0,
             )
-        )
+        ),
+        chat_writer=RepositoryFactory.get_chat_writer(),
     )
 
 def get_prompt_service() -> PromptService:
     return PromptService(
         user_chat_chain=UserChatChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4_1,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
                 temperature=0.5,
                 streaming=True,
-                callbacks=[]  # 초기에는 빈 콜백 리스트
             )
         ),
         create_diagram_chain=CreateDiagramComponentChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4_1,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
                 temperature=0,
             )
-        )
+        ),
+        response_cache=RepositoryFactory.get_response_cache(),
     )
 
 def get_component_service() -> ComponentService:
     return ComponentService(
         component_chain=ComponentChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -104,7 +106,7 @@ def get_component_service() -> ComponentService:
             )
         ),
         dto_chain=DtoModelChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -117,7 +119,7 @@ def get_connection_service() -> ConnectionService:
     from app.config.config import settings
     return ConnectionService(
         connection_chain=ConnectionChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -156,42 +158,80 @@ def get_chat_service_facade(
 from app.api.dto.diagram_dto import ChatResponseList
 
 
-@chat_router.get("/projects/{project_id}/apis/{api_id}/chats")
+@chat_router.get("/projects/{project_id}/apis/{api_id}/chats", response_model=ChatResponseList)
 async def get_prompts(
         project_id: str,
         api_id: str,
+        limit: Optional[int] = Query(None, ge=1, le=settings.CHAT_HISTORY_MAX_PAGE_SIZE),
+        cursor: Optional[str] = None,
+        format: str = Query("json", pattern="^(json|ndjson)$"),
         chat_service_facade: ChatServiceFacade = Depends(get_chat_service_facade),
-) -> ChatResponseList:
+):
     """
-    특정 프로젝트와 API의 모든 채팅 기록을 조회합니다.
+    특정 프로젝트와 API의 채팅 기록을 생성 시간 순으로 조회합니다.
+
+    - limit 또는 cursor를 지정하면 limit개(기본 CHAT_HISTORY_PAGE_SIZE)씩 조회하며,
+      응답의 nextCursor를 cursor로 전달하여 다음 페이지를 조회합니다.
+    - 둘 다 지정하지 않으면 전체 기록을 같은 형식으로 반환하되, 커서에서 읽는 대로 응답 본문에 씁니다.
+    - format=ndjson이면 채팅을 한 줄에 하나씩 application/x-ndjson으로 스트리밍합니다.
 
     Args:
         project_id: 프로젝트 ID
         api_id: API ID
+        limit: 페이지 크기
+        cursor: 이전 페이지의 nextCursor
+        format: 응답 형식 (json, ndjson)
         chat_service_facade: ChatService
 
     Returns:
         ChatResponseList: 채팅 기록 목록
     """
-    logger.info(f"채팅 기록 조회 요청: project_id={project_id}, api_id={api_id}")
+    logger.info(f"채팅 기록 조회 요청: project_id={project_id}, api_id={api_id}, limit={limit}, format={format}")
 
     try:
-        # 채팅 서비스를 통해 프롬프트 조회
-        chat_responses = await chat_service_facade.get_prompts(project_id, api_id)
+        if format == "ndjson":
+            chats = chat_service_facade.stream_prompts(project_id, api_id, cursor)
+            return StreamingResponse(_ndjson_chats(chats), media_type="application/x-ndjson")
+
+        if limit is None and cursor is None:
+            chats = chat_service_facade.stream_prompts(project_id, api_id)
+            return StreamingResponse(_json_chat_list(chats), media_type="application/json")
+
+        chat_responses = await chat_service_facade.get_prompt_page(
+            project_id, api_id, cursor, limit or settings.CHAT_HISTORY_PAGE_SIZE
+        )
         logger.info(f"채팅 기록 조회 성공: {len(chat_responses.content)}개의 채팅")
 
         return chat_responses
+    except ValueError as e:
+        logger.warning(f"채팅 기록 조회 실패: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"채팅 기록 조회 중 오류 발생: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 
+async def _ndjson_chats(chats: AsyncIterator[ChatResponse]):
+    """채팅 기록을 한 줄에 하나씩 JSON으로 전달하는 제너레이터"""
+    async for chat in chats:
+        yield chat.model_dump_json(by_alias=True) + "\n"
+
+
+async def _json_chat_list(chats: AsyncIterator[ChatResponse]):
+    """채팅 기록을 ChatResponseList와 같은 JSON 형식으로 나누어 전달하는 제너레이터"""
+    yield '{"content":['
+    separator = ""
+    async for chat in chats:
+        yield separator + chat.model_dump_json(by_alias=True)
+        separator = ","
+    yield '],"nextCursor":null}'
+
+
 @chat_router.post("/projects/{project_id}/apis/{api_id}/chats")
 async def prompt_chat(
         project_id: str,
         api_id: str,
         user_chat_data: UserChatRequest,
-        background_tasks: BackgroundTasks,
         authorization: str = Header(None),
         chat_service_facade: ChatServiceFacade = Depends(get_chat_service_facade),
         sse_service: SSEService = Depends(get_sse_service),
@@ -214,7 +254,6 @@ async def prompt_chat(
         project_id: 프로젝트 ID
         api_id: API ID
         user_chat_data: 사용자 채팅 데이터
-        background_tasks: BackgroundTasks
         sse_service: SSEService
         api_client
         chat_service_facade
@@ -231,22 +270,21 @@ async def prompt_chat(
         global_files: GlobalFileList = await api_client.get_project(project_id=project_id, token=authorization)
 
         # SSE 스트리밍을 위한 응답 큐 생성
-        stream_id, response_queue = sse_service.create_stream()
+        stream_id, response_queue = await sse_service.create_stream()
         logger.info(f"SSE 스트림 생성: stream_id={stream_id}")
 
-        # 채팅 및 다이어그램 처리를 백그라운드 태스크로 실행
+        # 채팅 및 다이어그램 처리를 스트림에 묶인 태스크로 실행 (구독자가 떠나면 취소됨)
         # Agent가 도식화 생성 여부를 판단하고, 필요한 경우 created 이벤트로 diagramId를 제공합니다
-        background_tasks.add_task(
-            chat_service_facade.create_chat,
+        sse_service.run_stream_task(stream_id, response_queue, chat_service_facade.create_chat(
             project_id,
             api_id,
             user_chat_data,
             global_files,
             api_spec,
             response_queue
-        )
+        ))
 
-        logger.info(f"백그라운드 태스크 등록 완료: stream_id={stream_id}")
+        logger.info(f"스트림 태스크 등록 완료: stream_id={stream_id}")
 
         # 스트림 ID 반환
         return {"streamId": stream_id}
@@ -255,50 +293,159 @@ async def prompt_chat(
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
 
+@chat_router.post("/projects/{project_id}/apis/{api_id}/chats/stream")
+async def prompt_chat_stream(
+        project_id: str,
+        api_id: str,
+        user_chat_data: UserChatRequest,
+        authorization: str = Header(None),
+        chat_service_facade: ChatServiceFacade = Depends(get_chat_service_facade),
+        sse_service: SSEService = Depends(get_sse_service),
+        api_client: ApiClient = Depends(get_a_http_client)
+):
+    """
+    프롬프트를 입력하고 같은 요청에서 SSE 응답을 바로 스트리밍 받습니다.
+    /chats 요청 후 /sse/connect/{SSE_Id}에 연결하는 두 단계 흐름을 한 번의 요청으로 처리합니다.
+
+    Args:
+        project_id: 프로젝트 ID
+        api_id: API ID
+        user_chat_data: 사용자 채팅 데이터
+        authorization
+        chat_service_facade
+        sse_service: SSEService
+        api_client
+    Returns:
+        StreamingResponse: 스트리밍 응답 객체
+    """
+    try:
+        api_spec: ApiSpec = await api_client.get_api_spec(api_spec_id=api_id, token=authorization)
+        global_files: GlobalFileList = await api_client.get_project(project_id=project_id, token=authorization)
+
+        stream_id, response_queue = await sse_service.create_stream()
+        logger.info(f"SSE 스트림 생성: stream_id={stream_id}")
+
+        # 응답 스트리밍과 동시에 실행되며, 클라이언트 연결이 끊기면 취소됩니다
+        sse_service.run_stream_task(stream_id, response_queue, chat_service_facade.create_chat(
+            project_id,
+            api_id,
+            user_chat_data,
+            global_files,
+            api_spec,
+            response_queue
+        ))
+    except Exception as e:
+        logger.error(f"채팅 처리 중 오류 발생: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+    logger.info(f"SSE 스트리밍 응답 시작: sse_id={stream_id}")
+    # 연결이 끊기면 /sse/connect/{SSE_Id}에 Last-Event-ID와 함께 다시 연결할 수 있도록 스트림 ID 전달
+    return StreamingResponse(
+        _event_generator(sse_service, stream_id),
+        media_type="text/event-stream",
+        headers={"X-SSE-Stream-Id": stream_id},
+    )
+
+
 @chat_router.get("/sse/connect/{sse_id}")
 async def connect_sse(
         sse_id: str,
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
         sse_service: SSEService = Depends(get_sse_service)
 ):
     """
     SSE 연결을 설정하여 실시간 응답을 스트리밍 받습니다.
+    연결이 끊긴 뒤 Last-Event-ID 헤더와 함께 다시 연결하면 놓친 이벤트부터 이어서 받습니다.
 
     Args:
         sse_id: SSE 연결 ID
+        last_event_id: 이전 연결에서 마지막으로 받은 이벤트 ID
         sse_service: SSEService
 
     Returns:
         StreamingResponse: 스트리밍 응답 객체
     """
     logger.info(f"SSE 연결 요청: sse_id={sse_id}")
-    response_queue = sse_service.get_stream(sse_id)
-
-    import asyncio
-    async def event_generator(queue: asyncio.Queue):
-        try:
-            logger.info(f"SSE 이벤트 생성기 시작: sse_id={sse_id}")
-
-            while True:
-                # 큐에서 데이터 대기
-                data = await queue.get()
-                logger.info(f"{data}")
-
-                # 종료 신호 확인
-                if data is None:
-                    logger.info(f"SSE 스트림 종료: sse_id={sse_id}")
-                    break
-
-                # SSE 형식으로 데이터 전송
-                yield f"{data}\n\n"
-
-        except Exception as e:
-            logger.error(f"SSE 스트리밍 중 오류 발생: {str(e)}", exc_info=True)
-        finally:
-            # 클라이언트 연결 종료 시 정리
-            logger.info(f"SSE 연결 정리: sse_id={sse_id}")
+    if not await sse_service.has_stream(sse_id):
+        logger.warning(f"존재하지 않는 SSE 스트림: sse_id={sse_id}")
+        raise HTTPException(status_code=404, detail=f"스트림을 찾을 수 없습니다: {sse_id}")
+
+    try:
+        resume_from = int(last_event_id) if last_event_id else 0
+    except ValueError:
+        logger.warning(f"잘못된 Last-Event-ID 헤더: {last_event_id}")
+        resume_from = 0
+
+    logger.info(f"SSE 스트리밍 응답 시작: sse_id={sse_id}, last_event_id={resume_from}")
+    return StreamingResponse(_event_generator(sse_service, sse_id, resume_from), media_type="text/event-stream")
+
+
+@chat_router.get("/sse/stats")
+async def get_sse_stats(
+        sse_service: SSEService = Depends(get_sse_service)
+):
+    """
+    SSE 스트림 상태 지표를 조회합니다.
+
+    Args:
+        sse_service: SSEService
 
-            await sse_service.close_stream(response_queue)
-            sse_service.remove_stream(sse_id)
+    Returns:
+        Dict[str, int]: 활성/미연결 스트림 수, 버퍼링된 이벤트 수, 버려진 이벤트 수 등
+    """
+    return sse_service.get_stats()
+
+
+@chat_router.get("/chats/write-behind/stats")
+async def get_chat_write_behind_stats():
+    """
+    채팅 write-behind 저장 지표를 조회합니다.
+
+    Returns:
+        Dict[str, int]: 대기 중인 채팅 수, 저장된 채팅 수, 배치 수, 재시도 수 등 (사용하지 않으면 빈 객체)
+    """
+    chat_writer = RepositoryFactory.get_chat_writer()
+    return chat_writer.stats() if chat_writer else {}
+
+
+@chat_router.get("/chats/response-cache/stats")
+async def get_chat_response_cache_stats():
+    """
+    채팅 응답 캐시 지표를 조회합니다.
 
-    logger.info(f"SSE 스트리밍 응답 시작: sse_id={sse_id}")
-    return StreamingResponse(event_generator(response_queue), media_type="text/event-stream")
+    Returns:
+        Dict[str, int]: 적중/미적중 수, 유사 메시지 적중 수, 만료/제거/무효화 수 등 (사용하지 않으면 빈 객체)
+    """
+    response_cache = RepositoryFactory.get_response_cache()
+    return response_cache.stats() if response_cache else {}
+
+
+async def _event_generator(sse_service: SSEService, sse_id: str, last_event_id: int = 0):
+    """SSE 스트림의 이벤트를 묶음 단위로 응답 본문에 전달하는 제너레이터"""
+    writer = SSEBatchWriter(
+        flush_interval=settings.SSE_FLUSH_INTERVAL_SECONDS,
+        max_batch_bytes=settings.SSE_FLUSH_MAX_BYTES,
+        heartbeat_interval=settings.SSE_HEARTBEAT_SECONDS,
+        max_buffered_events=settings.SSE_WRITER_MAX_BUFFERED_EVENTS,
+    )
+    finished = False
+    try:
+        logger.info(f"SSE 이벤트 생성기 시작: sse_id={sse_id}")
+
+        # 스트림 종료 신호를 받을 때까지 데이터 대기
+        async for chunk in writer.write(sse_service.subscribe(sse_id, last_event_id)):
+            yield chunk
+
+        finished = True
+        logger.info(f"SSE 스트림 종료: sse_id={sse_id}")
+
+    except Exception as e:
+        finished = True
+        logger.error(f"SSE 스트리밍 중 오류 발생: {str(e)}", exc_info=True)
+    finally:
+        if finished:
+            logger.info(f"SSE 연결 정리: sse_id={sse_id}")
+            await sse_service.remove_stream(sse_id)
+        else:
+            # 응답 도중 클라이언트 연결이 끊긴 경우 재연결을 위해 스트림을 유지 (방치되면 reaper가 정리)
+            logger.info(f"SSE 클라이언트 연결 끊김, 재연결 대기: sse_id={sse_id}")
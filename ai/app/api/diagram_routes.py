@@ -1,8 +1,9 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
 
-from app.api.dto.diagram_dto import PositionRequest, DiagramResponse
+from app.api.dto.diagram_dto import PositionRequest, DiagramResponse, ComponentPositionBatchRequest, \
+    ComponentPositionResponse, ComponentPositionListResponse
 from app.config.config import settings
 from app.core.diagram.component.component_service import ComponentService
 from app.core.diagram.connection.connection_service import ConnectionService
@@ -28,19 +29,18 @@ diagram_router = APIRouter()
 
 # 의존성 주입을 위한 함수
 from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
+from app.infrastructure.mongodb.repository.repository_factory import RepositoryFactory
 
 
 def get_diagram_repository() -> DiagramRepository:
-    from app.infrastructure.mongodb.repository.diagram_repository_impl import DiagramRepositoryImpl
-    return DiagramRepositoryImpl()
+    return RepositoryFactory.get_diagram_repository()
 
 
 from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
 
 
 def get_chat_repository() -> ChatRepository:
-    from app.infrastructure.mongodb.repository.chat_repository_impl import ChatRepositoryImpl
-    return ChatRepositoryImpl()
+    return RepositoryFactory.get_chat_repository()
 
 
 def get_diagram_service(
@@ -53,7 +53,7 @@ def get_diagram_service(
 def get_component_service() -> ComponentService:
     return ComponentService(
         component_chain=ComponentChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -61,7 +61,7 @@ def get_component_service() -> ComponentService:
             )
         ),
         dto_chain=DtoModelChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -73,7 +73,7 @@ def get_component_service() -> ComponentService:
 def get_connection_service() -> ConnectionService:
     return ConnectionService(
         connection_chain=ConnectionChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -85,7 +85,7 @@ def get_connection_service() -> ConnectionService:
 def get_prompt_service() -> PromptService:
     return PromptService(
         create_diagram_chain=CreateDiagramComponentChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4_1,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -93,7 +93,7 @@ def get_prompt_service() -> PromptService:
             )
         ),
         user_chat_chain=UserChatChain(
-            LLMFactory.create_llm(
+            LLMFactory.get_llm(
                 model=ModelType.OPENAI_GPT4_1,
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_API_BASE,
@@ -126,13 +126,13 @@ def get_a_http_client():
 ###############################         Controller        ###########################################
 #####################################################################################################
 
-@diagram_router.get("/projects/{project_id}/apis/{api_id}/versions/{version}")
+@diagram_router.get("/projects/{project_id}/apis/{api_id}/versions/{version}", response_model=DiagramResponse)
 async def get_diagram(
         project_id: str,
         api_id: str,
         version: int,
         diagram_service_facade: DiagramFacade = Depends(get_diagram_service_facade),
-) -> DiagramResponse:
+) -> Response:
     """
     특정 프로젝트의 특정 API 버전에 대한 메서드 도식화 데이터를 가져옵니다.
 
@@ -143,10 +143,11 @@ async def get_diagram(
         version: 버전
         diagram_service_facade
     Returns:
-        Diagram: 조회된 도식화 데이터
+        Response: 조회된 도식화 데이터 (DiagramResponse JSON)
     """
-
-    return await diagram_service_facade.get_diagram(project_id, api_id, version)
+    # 서비스에서 이미 DiagramResponse로 직렬화했으므로 응답 모델 검증을 다시 거치지 않음
+    content = await diagram_service_facade.get_diagram(project_id, api_id, version)
+    return Response(content=content, media_type="application/json")
 
 
 @diagram_router.post("/projects/{project_id}/apis/{api_id}/diagrams")
@@ -206,7 +207,7 @@ async def update_component_position(
         component_id: str,
         position_data: PositionRequest,
         diagram_service_facade: DiagramFacade = Depends(get_diagram_service_facade),
-) -> DiagramResponse:
+) -> ComponentPositionResponse:
     """
     도식화에서 특정 컴포넌트의 위치 좌표를 변경합니다.
 
@@ -217,7 +218,7 @@ async def update_component_position(
         position_data: 새 위치 데이터 (x, y 좌표)
         diagram_service_facade: DiagramService
     Returns:
-        Component: 업데이트된 컴포넌트 정보
+        ComponentPositionResponse: 업데이트된 컴포넌트 좌표
     """
     try:
         return await diagram_service_facade.update_component_position(
@@ -227,6 +228,9 @@ async def update_component_position(
             position_data
         )
 
+    except HTTPException:
+        # 컴포넌트를 찾을 수 없는 경우 404 에러
+        raise
     except ValueError as e:
         # 이미 존재하는 다이어그램인 경우 400 에러
         logger.warning(f"다이어그램 생성 실패 (기존 다이어그램 존재): {str(e)}")
@@ -235,3 +239,52 @@ async def update_component_position(
         # 기타 오류는 500 에러
         logger.error(f"다이어그램 생성 중 서버 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@diagram_router.put("/projects/{project_id}/apis/{api_id}/components/positions")
+async def update_component_positions(
+        project_id: str,
+        api_id: str,
+        position_data: ComponentPositionBatchRequest,
+        diagram_service_facade: DiagramFacade = Depends(get_diagram_service_facade),
+) -> ComponentPositionListResponse:
+    """
+    도식화에서 여러 컴포넌트의 위치 좌표를 한 번에 변경합니다.
+
+    Args:
+        project_id: 프로젝트 ID
+        api_id: API ID
+        position_data: 컴포넌트별 새 위치 데이터 목록
+        diagram_service_facade: DiagramService
+    Returns:
+        ComponentPositionListResponse: 업데이트된 컴포넌트 좌표 목록
+    """
+    try:
+        return await diagram_service_facade.update_component_positions(
+            project_id,
+            api_id,
+            position_data
+        )
+
+    except HTTPException:
+        # 컴포넌트를 찾을 수 없는 경우 404 에러 (아무것도 저장되지 않음)
+        raise
+    except ValueError as e:
+        logger.warning(f"컴포넌트 위치 업데이트 실패: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        # 기타 오류는 500 에러
+        logger.error(f"컴포넌트 위치 업데이트 중 서버 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@diagram_router.get("/diagrams/cache/stats")
+async def get_diagram_cache_stats():
+    """
+    최신 다이어그램 캐시 지표를 조회합니다.
+
+    Returns:
+        Dict[str, int]: 적중/미적중 수, 만료/제거/무효화 수, 현재 크기 등 (캐시를 사용하지 않으면 빈 객체)
+    """
+    latest_diagram_cache = RepositoryFactory.get_latest_diagram_cache()
+    return latest_diagram_cache.stats() if latest_diagram_cache else {}
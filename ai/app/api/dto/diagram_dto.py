@@ -80,6 +80,8 @@ class ChatResponse(BaseModel):
 
 class ChatResponseList(BaseModel):
     content: List[ChatResponse] = []
+    # 다음 페이지 조회에 사용할 커서 (마지막 페이지이면 None)
+    nextCursor: Optional[str] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -165,3 +167,31 @@ class DiagramResponse(BaseModel):
 class PositionRequest(BaseModel):
     x: float
     y: float
+
+
+class ComponentPositionRequest(BaseModel):
+    componentId: str
+    x: float
+    y: float
+
+
+class ComponentPositionBatchRequest(BaseModel):
+    positions: List[ComponentPositionRequest] = []
+
+
+class ComponentPositionResponse(BaseModel):
+    componentId: str
+    positionX: float
+    positionY: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
+
+
+class ComponentPositionListResponse(BaseModel):
+    content: List[ComponentPositionResponse] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
@@ -18,6 +18,26 @@ class Settings:
     ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
     OLLAMA_API_URL: str = os.getenv("OLLAMA_API_URL", "")
 
+    # LLM 클라이언트 풀 설정
+    LLM_POOL_MAX_SIZE: int = int(os.getenv("LLM_POOL_MAX_SIZE", "16"))
+    LLM_HTTP_MAX_CONNECTIONS: int = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100"))
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    LLM_HTTP_TIMEOUT_SECONDS: float = float(os.getenv("LLM_HTTP_TIMEOUT_SECONDS", "120"))
+
+    # LLM 단계 병렬 실행 설정
+    LLM_STAGE_MAX_CONCURRENCY: int = int(os.getenv("LLM_STAGE_MAX_CONCURRENCY", "3"))
+    LLM_STAGE_TIMEOUT_SECONDS: float = float(os.getenv("LLM_STAGE_TIMEOUT_SECONDS", "120"))
+
+    # temperature=0 LLM 호출 응답 캐시 설정 (LLM_CACHE_SIZE가 0이면 사용 안 함)
+    LLM_CACHE_SIZE: int = int(os.getenv("LLM_CACHE_SIZE", "512"))
+    LLM_CACHE_TTL_SECONDS: float = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+    # 영속 계층 유형 (none: 워커 메모리만, sqlite: 로컬 파일, mongo: MongoDB 컬렉션)
+    LLM_CACHE_STORE: str = os.getenv("LLM_CACHE_STORE", "none")
+    LLM_CACHE_STORE_MAX_SIZE: int = int(os.getenv("LLM_CACHE_STORE_MAX_SIZE", "10000"))
+    LLM_CACHE_SQLITE_PATH: str = os.getenv("LLM_CACHE_SQLITE_PATH", os.path.join(".cache", "llm_cache.sqlite3"))
+    LLM_CACHE_MONGO_COLLECTION: str = os.getenv("LLM_CACHE_MONGO_COLLECTION", "llm_response_cache")
+
     # 메시지 큐 설정
     KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "host.docker.internal:9092")
     KAFKA_CONSUMER_GROUP: str = os.getenv("KAFKA_CONSUMER_GROUP", "diagram-ai-group")
@@ -29,6 +49,84 @@ class Settings:
     # MongoDB 설정
     MONGO_URI: str = os.getenv("MONGO_URI", "mongodb://localhost:27017")
     MONGO_DB_NAME: str = os.getenv("MONGO_DB_NAME", "scrud_ai_db")
+    # MongoDB 커넥션 풀 설정
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "10"))
+    MONGO_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000"))
+    MONGO_CONNECT_TIMEOUT_MS: int = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "10000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "10000"))
+    MONGO_SOCKET_TIMEOUT_MS: int = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "60000"))
+    # 네트워크 압축 방식 (서버와 클라이언트가 모두 지원하는 첫 번째 방식 사용)
+    # zstd는 requirements.txt의 zstandard, zlib은 표준 라이브러리를 사용 (snappy는 python-snappy 설치 시 추가)
+    MONGO_COMPRESSORS: str = os.getenv("MONGO_COMPRESSORS", "zstd,zlib")
+    # 연결 시 인덱스 생성 여부
+    MONGO_ENSURE_INDEXES: bool = os.getenv("MONGO_ENSURE_INDEXES", "true").lower() == "true"
+    # 다이어그램과 채팅을 함께 저장할 때 트랜잭션 사용 여부 (레플리카 셋 또는 mongos 필요)
+    MONGO_TRANSACTIONS_ENABLED: bool = os.getenv("MONGO_TRANSACTIONS_ENABLED", "true").lower() == "true"
+
+    # 다이어그램 버전 저장 설정 (1 이하이면 모든 버전을 전체 문서로 저장)
+    DIAGRAM_SNAPSHOT_INTERVAL: int = int(os.getenv("DIAGRAM_SNAPSHOT_INTERVAL", "10"))
+    # 델타에서 복원한 이전 버전 다이어그램을 보관할 개수
+    DIAGRAM_MATERIALIZED_CACHE_SIZE: int = int(os.getenv("DIAGRAM_MATERIALIZED_CACHE_SIZE", "64"))
+    # 최신 다이어그램 캐시 설정 (DIAGRAM_CACHE_SIZE가 0이면 캐시 사용 안 함)
+    DIAGRAM_CACHE_SIZE: int = int(os.getenv("DIAGRAM_CACHE_SIZE", "256"))
+    DIAGRAM_CACHE_TTL_SECONDS: float = float(os.getenv("DIAGRAM_CACHE_TTL_SECONDS", "60"))
+    # 워커 간 캐시 무효화 공유 방식 (none: 워커별 캐시, mongo: MongoDB 세대 번호로 공유)
+    DIAGRAM_CACHE_SHARED_TIER: str = os.getenv("DIAGRAM_CACHE_SHARED_TIER", "none")
+    DIAGRAM_CACHE_MONGO_COLLECTION: str = os.getenv("DIAGRAM_CACHE_MONGO_COLLECTION", "diagram_cache_generations")
+    # 공유 세대 번호를 워커에 보관할 시간 (다른 워커의 변경이 반영되기까지의 최대 지연, 0이면 적중마다 조회)
+    DIAGRAM_CACHE_SHARED_GENERATION_TTL_SECONDS: float = float(
+        os.getenv("DIAGRAM_CACHE_SHARED_GENERATION_TTL_SECONDS", "1")
+    )
+
+    # 채팅 응답 캐시 설정 (같은 다이어그램 버전에 대한 반복 요청, RESPONSE_CACHE_SIZE가 0이면 사용 안 함)
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))
+    RESPONSE_CACHE_TTL_SECONDS: float = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "3600"))
+    # 유사 메시지 검색용 임베딩 모델 (비어 있으면 정확히 일치하는 메시지만 캐시 적중)
+    RESPONSE_CACHE_EMBEDDING_MODEL: str = os.getenv("RESPONSE_CACHE_EMBEDDING_MODEL", "")
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("RESPONSE_CACHE_SIMILARITY_THRESHOLD", "0.95"))
+    # 캐시된 응답을 SSE로 다시 보낼 때의 조각 크기(글자 수)와 조각 사이 대기 시간(초, 0이면 한 번에 전송)
+    RESPONSE_CACHE_REPLAY_CHUNK_SIZE: int = int(os.getenv("RESPONSE_CACHE_REPLAY_CHUNK_SIZE", "16"))
+    RESPONSE_CACHE_REPLAY_DELAY_SECONDS: float = float(os.getenv("RESPONSE_CACHE_REPLAY_DELAY_SECONDS", "0.01"))
+
+    # 채팅 기록 조회 설정 (페이지 크기와 커서에서 한 번에 가져올 문서 수)
+    CHAT_HISTORY_PAGE_SIZE: int = int(os.getenv("CHAT_HISTORY_PAGE_SIZE", "50"))
+    CHAT_HISTORY_MAX_PAGE_SIZE: int = int(os.getenv("CHAT_HISTORY_MAX_PAGE_SIZE", "200"))
+    CHAT_HISTORY_BATCH_SIZE: int = int(os.getenv("CHAT_HISTORY_BATCH_SIZE", "50"))
+
+    # 채팅 write-behind 저장 설정 (스트림을 먼저 닫고 채팅은 모아서 일괄 저장)
+    CHAT_WRITE_BEHIND_ENABLED: bool = os.getenv("CHAT_WRITE_BEHIND_ENABLED", "true").lower() == "true"
+    CHAT_WRITE_BUFFER_SIZE: int = int(os.getenv("CHAT_WRITE_BUFFER_SIZE", "1000"))
+    CHAT_WRITE_BATCH_SIZE: int = int(os.getenv("CHAT_WRITE_BATCH_SIZE", "100"))
+    CHAT_WRITE_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("CHAT_WRITE_FLUSH_INTERVAL_SECONDS", "0.2"))
+    CHAT_WRITE_MAX_RETRIES: int = int(os.getenv("CHAT_WRITE_MAX_RETRIES", "3"))
+    CHAT_WRITE_RETRY_BACKOFF_SECONDS: float = float(os.getenv("CHAT_WRITE_RETRY_BACKOFF_SECONDS", "0.5"))
+
+    # SSE 스트림 브로커 설정 (memory: 단일 워커, mongo: 워커 간 공유)
+    SSE_BROKER: str = os.getenv("SSE_BROKER", "memory")
+    SSE_MONGO_COLLECTION: str = os.getenv("SSE_MONGO_COLLECTION", "sse_events")
+    SSE_MONGO_CAPPED_SIZE_BYTES: int = int(os.getenv("SSE_MONGO_CAPPED_SIZE_BYTES", str(64 * 1024 * 1024)))
+    # 새 이벤트 조회 간격 (이벤트가 없으면 최대값까지 두 배씩 늘림)
+    SSE_MONGO_POLL_INTERVAL_SECONDS: float = float(os.getenv("SSE_MONGO_POLL_INTERVAL_SECONDS", "0.05"))
+    SSE_MONGO_MAX_POLL_INTERVAL_SECONDS: float = float(os.getenv("SSE_MONGO_MAX_POLL_INTERVAL_SECONDS", "1.0"))
+
+    # SSE 스트림 큐 및 정리 설정
+    SSE_QUEUE_MAX_SIZE: int = int(os.getenv("SSE_QUEUE_MAX_SIZE", "10000"))
+    # 토큰이 버려지면 응답이 손상되므로 기본값은 생산자를 대기시키는 block
+    SSE_QUEUE_OVERFLOW_POLICY: str = os.getenv("SSE_QUEUE_OVERFLOW_POLICY", "block")
+    SSE_STREAM_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("SSE_STREAM_CONNECT_TIMEOUT_SECONDS", "300"))
+    SSE_STREAM_IDLE_TIMEOUT_SECONDS: float = float(os.getenv("SSE_STREAM_IDLE_TIMEOUT_SECONDS", "600"))
+    SSE_REAPER_INTERVAL_SECONDS: float = float(os.getenv("SSE_REAPER_INTERVAL_SECONDS", "30"))
+    # 구독자 연결이 끊긴 뒤 재연결을 기다렸다가 응답 생성 작업을 취소하기까지의 시간
+    SSE_DISCONNECT_GRACE_SECONDS: float = float(os.getenv("SSE_DISCONNECT_GRACE_SECONDS", "15"))
+    # 재연결(Last-Event-ID) 시 다시 전송하기 위해 보관할 스트림별 최근 이벤트 수
+    SSE_REPLAY_BUFFER_SIZE: int = int(os.getenv("SSE_REPLAY_BUFFER_SIZE", "4096"))
+
+    # SSE 응답 전송 설정 (이벤트 묶음 전송 및 heartbeat)
+    SSE_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("SSE_FLUSH_INTERVAL_SECONDS", "0.03"))
+    SSE_FLUSH_MAX_BYTES: int = int(os.getenv("SSE_FLUSH_MAX_BYTES", "8192"))
+    SSE_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+    SSE_WRITER_MAX_BUFFERED_EVENTS: int = int(os.getenv("SSE_WRITER_MAX_BUFFERED_EVENTS", "256"))
 
     # SPRING 서버 설정
     A_HTTP_SPRING_BASE_URL: str = os.getenv("A_HTTP_SPRING_BASE_URL", "http://localhost:8080")
@@ -2,13 +2,16 @@ import logging
 import uuid
 from typing import List
 
-from app.api.dto.diagram_dto import DiagramResponse, PositionRequest
+from app.api.dto.diagram_dto import DiagramResponse, PositionRequest, ComponentPositionBatchRequest, \
+    ComponentPositionResponse, ComponentPositionListResponse
+from app.config.config import settings
 from app.core.diagram.component.component_service import ComponentService
 from app.core.diagram.connection.connection_service import ConnectionService
 from app.core.diagram.diagram_service import DiagramService
 from app.core.llm.prompt_service import PromptService
 from app.core.models.diagram_model import ComponentChainPayload
 from app.core.models.global_setting_model import ApiSpecChainPayload
+from app.core.pipeline.stage_graph import StageGraph
 from app.infrastructure.http.client.api_client import GlobalFileList, ApiSpec
 from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
 
@@ -33,11 +36,11 @@ class DiagramFacade:
             project_id: str,
             api_id: str,
             version: int,
-    ):
+    ) -> bytes:
         self.logger.info(f"[디버깅] DiagramFacade - get_diagram 메소드 시작: project_id={project_id}, api_id={api_id}, version={version}")
         
         try:
-            result = await self._diagram_service.get_diagram(project_id, api_id, version)
+            result = await self._diagram_service.get_diagram_json(project_id, api_id, version)
             self.logger.info(f"[디버깅] DiagramFacade - get_diagram 성공: 다이어그램 조회 완료")
             return result
         except Exception as e:
@@ -50,7 +53,7 @@ class DiagramFacade:
             api_id: str,
             component_id: str,
             position_data: PositionRequest
-    ) -> DiagramResponse:
+    ) -> ComponentPositionResponse:
         """
         도식화에서 특정 컴포넌트의 위치 좌표를 변경합니다.
 
@@ -61,10 +64,10 @@ class DiagramFacade:
             position_data: 새 위치 데이터 (x, y 좌표)
 
         Returns:
-            DiagramResponse: 업데이트된 다이어그램 정보
+            ComponentPositionResponse: 업데이트된 컴포넌트 좌표
 
         Raises:
-            ValueError: 컴포넌트를 찾을 수 없을 경우
+            HTTPException: 컴포넌트를 찾을 수 없을 경우 (404)
         """
         self.logger.info(f"[디버깅] DiagramFacade - update_component_position 메소드 시작")
         self.logger.info(f"[디버깅] DiagramFacade - 파라미터: project_id={project_id}, api_id={api_id}, component_id={component_id}")
@@ -83,6 +86,41 @@ class DiagramFacade:
             self.logger.error(f"[디버깅] DiagramFacade - update_component_position 실패: {str(e)}")
             raise
 
+    async def update_component_positions(
+            self,
+            project_id: str,
+            api_id: str,
+            position_data: ComponentPositionBatchRequest
+    ) -> ComponentPositionListResponse:
+        """
+        도식화에서 여러 컴포넌트의 위치 좌표를 한 번에 변경합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            position_data: 컴포넌트별 새 위치 데이터 목록
+
+        Returns:
+            ComponentPositionListResponse: 업데이트된 컴포넌트 좌표 목록
+
+        Raises:
+            HTTPException: 컴포넌트를 찾을 수 없을 경우 (404)
+        """
+        self.logger.info(f"[디버깅] DiagramFacade - update_component_positions 메소드 시작")
+        self.logger.info(f"[디버깅] DiagramFacade - 파라미터: project_id={project_id}, api_id={api_id}, count={len(position_data.positions)}")
+
+        try:
+            result = await self._diagram_service.update_component_positions(
+                project_id=project_id,
+                api_id=api_id,
+                position_data=position_data
+            )
+            self.logger.info(f"[디버깅] DiagramFacade - update_component_positions 성공: 컴포넌트 위치 업데이트 완료")
+            return result
+        except Exception as e:
+            self.logger.error(f"[디버깅] DiagramFacade - update_component_positions 실패: {str(e)}")
+            raise
+
     async def create_diagram(
             self,
             project_id: str,
@@ -156,15 +194,29 @@ class DiagramFacade:
         )
         self.logger.info(f"[디버깅] DiagramFacade - API 스펙 프롬프트 처리 완료: 컴포넌트 {len(components)}개 생성")
 
-        self.logger.info("[디버깅] DiagramFacade - DTO 생성 시작")
-        dtos = await self._component_service.create_dtos_with_api_spec(
-            api_spec=ApiSpecChainPayload.model_validate(api_spec),
-            components=components,
+        # DTO와 커넥션은 모두 컴포넌트 목록만 필요하므로 동시에 생성합니다
+        api_spec_payload = ApiSpecChainPayload.model_validate(api_spec)
+        stage_graph = StageGraph(
+            max_concurrency=settings.LLM_STAGE_MAX_CONCURRENCY,
+            default_timeout=settings.LLM_STAGE_TIMEOUT_SECONDS,
+        )
+        stage_graph.add_stage(
+            "dtos",
+            lambda results: self._component_service.create_dtos_with_api_spec(
+                api_spec=api_spec_payload,
+                components=components,
+            ),
+        )
+        stage_graph.add_stage(
+            "connections",
+            lambda results: self._connection_service.create_connection_with_prompt(components),
         )
-        self.logger.info(f"[디버깅] DiagramFacade - DTO 생성 완료: {len(dtos)}개 DTO 생성")
 
-        self.logger.info("[디버깅] DiagramFacade - 커넥션 생성 시작")
-        connections = await self._connection_service.create_connection_with_prompt(components)
+        self.logger.info("[디버깅] DiagramFacade - DTO/커넥션 생성 시작")
+        stage_results = await stage_graph.run()
+        dtos = stage_results["dtos"]
+        connections = stage_results["connections"]
+        self.logger.info(f"[디버깅] DiagramFacade - DTO 생성 완료: {len(dtos)}개 DTO 생성")
         self.logger.info(f"[디버깅] DiagramFacade - 커넥션 생성 완료: {len(connections)}개 커넥션 생성")
 
         self.logger.info("[디버깅] DiagramFacade - 다이어그램 생성 시작")
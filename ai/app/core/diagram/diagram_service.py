@@ -3,7 +3,13 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from app.api.dto.diagram_dto import DiagramResponse, PositionRequest
+import bson
+from bson.raw_bson import RawBSONDocument
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+
+from app.api.dto.diagram_dto import DiagramResponse, PositionRequest, ComponentPositionRequest, \
+    ComponentPositionBatchRequest, ComponentPositionResponse, ComponentPositionListResponse
 from app.core.models.diagram_model import ComponentChainPayload, DtoModelChainPayload, ConnectionChainPayload
 from app.core.models.user_chat_model import UserChatChainPayload
 from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
@@ -12,6 +18,9 @@ from app.infrastructure.mongodb.repository.model.diagram_model import DtoModel,
 
 logger = logging.getLogger(__name__)
 
+# 응답 스키마 검증 및 직렬화기 (모듈 로드 시 한 번만 생성)
+_diagram_response_adapter = TypeAdapter(DiagramResponse)
+
 
 class DiagramService:
     def __init__(
@@ -34,18 +43,43 @@ class DiagramService:
         # 응답 데이터로 변환
         return DiagramResponse.model_validate(diagram)
 
+    async def get_diagram_json(self, project_id: str, api_id: str, version: int) -> bytes:
+        """
+        다이어그램을 응답 JSON으로 바로 직렬화하여 조회합니다.
+        Diagram 모델을 거치지 않고 RawBSONDocument를 DiagramResponse TypeAdapter로 한 번만 검증하여 직렬화합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            version: 버전
+
+        Returns:
+            bytes: DiagramResponse JSON
+        """
+        logger.info(f"도식화 데이터 조회: project_id={project_id}, api_id={api_id}, version_id={version}")
+
+        raw_diagram = await self.diagram_repository.find_raw_by_project_api_version(project_id, api_id, version)
+
+        if raw_diagram is None:
+            logger.error(f"다이어그램을 찾을 수 없음: project_id={project_id}, api_id={api_id}, version_id={version}")
+            raise ValueError(f"다이어그램을 찾을 수 없습니다. (project_id={project_id}, api_id={api_id}, version_id={version})")
+
+        return self.serialize_raw_diagram(raw_diagram)
+
+    @staticmethod
+    def serialize_raw_diagram(raw_diagram: RawBSONDocument) -> bytes:
+        """RawBSONDocument를 DiagramResponse JSON으로 직렬화하는 함수"""
+        return _diagram_response_adapter.dump_json(
+            _diagram_response_adapter.validate_python(bson.decode(raw_diagram.raw))
+        )
+
     async def _find_latest_diagram_version(
             self,
             project_id: str,
             api_id: str,
     ) -> int:
-        """최신 다이어그램을 조회하는 함수"""
-        latest_diagram = await self.diagram_repository.find_latest_by_project_api(project_id, api_id)
-
-        if latest_diagram:
-            return latest_diagram.metadata.version
-        else:
-            return 0
+        """최신 다이어그램 버전을 조회하는 함수"""
+        return await self.diagram_repository.latest_version(project_id, api_id)
 
     async def create_diagram(
             self,
@@ -71,15 +105,51 @@ class DiagramService:
         Returns:
             생성된 다이어그램
         """
+        diagram = await self.build_diagram(
+            diagram_id=diagram_id,
+            components=components,
+            connections=connections,
+            dtos=dtos,
+            project_id=project_id,
+            api_id=api_id,
+            summary=summary,
+        )
+        await self.diagram_repository.save(diagram)
+        return diagram
+
+    async def build_diagram(
+            self,
+            diagram_id: str,
+            components: List[Component],
+            connections: List[Connection],
+            dtos: List[DtoModel],
+            project_id: Optional[str] = "",
+            api_id: Optional[str] = "",
+            summary: Optional[str] = "구현",
+    ) -> Diagram:
+        """새 버전을 할당하여 다이어그램 객체를 만듭니다. 저장은 하지 않습니다.
+
+        Args:
+            diagram_id
+            components: 컴포넌트 목록
+            connections: 커넥션 목록
+            dtos: DTO 모델 목록
+            project_id: 프로젝트 ID (선택)
+            api_id: API ID (선택)
+
+        Returns:
+            저장되지 않은 다이어그램
+        """
         logger.debug("Creating diagram")
-        latest_diagram_version = await self._find_latest_diagram_version(
+        # 동시에 생성되는 다이어그램과 버전이 겹치지 않도록 원자적으로 할당
+        version = await self.diagram_repository.allocate_version(
             project_id=project_id,
             api_id=api_id
         )
 
         metadata = Metadata(
             metadataId=str(uuid.uuid4()),
-            version=latest_diagram_version + 1, # 최신 버전 다이어그램 보다 1 높게 설정
+            version=version,
             name="name",
             description=summary,
             lastModified=datetime.now(),
@@ -96,7 +166,6 @@ class DiagramService:
         )
 
         logger.info(f"Created diagram with ID: {diagram_id}")
-        await self.diagram_repository.save(diagram)
         return diagram
 
     async def create_diagram_from_prompt_result(
@@ -140,6 +209,39 @@ class DiagramService:
             summary=summary
         )
 
+    async def build_diagram_from_prompt_result(
+            self,
+            diagram_id: str,
+            project_id: str,
+            api_id: str,
+            components: List[ComponentChainPayload],
+            dtos: List[DtoModelChainPayload],
+            connections: List[ConnectionChainPayload],
+            summary: Optional[str] = "최초 생성",
+    ) -> Diagram:
+        """프롬프트 결과로부터 저장하지 않은 다이어그램을 만듭니다. 채팅과 함께 커밋할 때 사용합니다.
+
+        Args:
+            diagram_id
+            project_id: 프로젝트 ID
+            api_id: API ID
+            components
+            dtos
+            connections
+            summary
+        Returns:
+            저장되지 않은 다이어그램
+        """
+        return await self.build_diagram(
+            diagram_id=diagram_id,
+            project_id=project_id,
+            api_id=api_id,
+            components=self.convert_to_component_from_payload(components),
+            connections=self.convert_to_connection_from_payload(connections),
+            dtos=self.convert_to_dto_from_payload(dtos),
+            summary=summary
+        )
+
     async def validate_exist_diagram(
             self,
             project_id: str,
@@ -148,12 +250,12 @@ class DiagramService:
         # 기존 다이어그램이 있는지 조회
         logger.info(f"다이어그램 존재 여부 확인: project_id={project_id}, api_id={api_id}")
 
-        existing_diagrams = await self.diagram_repository.find_many({
+        diagram_exists = await self.diagram_repository.exists({
             "projectId": project_id,
             "apiId": api_id
         })
 
-        if existing_diagrams and len(existing_diagrams) > 0:
+        if diagram_exists:
             logger.warning(f"이미 존재하는 다이어그램: project_id={project_id}, api_id={api_id}")
             raise ValueError(f"이미 존재하는 다이어그램입니다. (project_id={project_id}, api_id={api_id})")
 
@@ -205,23 +307,48 @@ class DiagramService:
             api_id: str,
             component_id: str,
             position_data: PositionRequest
-    ) -> DiagramResponse:
+    ) -> ComponentPositionResponse:
 
         logger.info(
             f"컴포넌트 위치 업데이트: project_id={project_id}, api_id={api_id}, "
             f"component_id={component_id}, x={position_data.x}, y={position_data.y}"
         )
 
-        # 컴포넌트 위치 업데이트
-        updated_diagram = await self.diagram_repository.update_component_position(
-            project_id, api_id, component_id, position_data.x, position_data.y
+        updated = await self.update_component_positions(
+            project_id,
+            api_id,
+            ComponentPositionBatchRequest(positions=[
+                ComponentPositionRequest(componentId=component_id, x=position_data.x, y=position_data.y)
+            ])
         )
+        return updated.content[0]
 
-        if not updated_diagram:
+    async def update_component_positions(
+            self,
+            project_id: str,
+            api_id: str,
+            position_data: ComponentPositionBatchRequest
+    ) -> ComponentPositionListResponse:
+
+        logger.info(
+            f"컴포넌트 위치 일괄 업데이트: project_id={project_id}, api_id={api_id}, "
+            f"count={len(position_data.positions)}"
+        )
+
+        positions = {p.componentId: (p.x, p.y) for p in position_data.positions}
+        if not positions:
+            return ComponentPositionListResponse()
+
+        # 컴포넌트 위치 업데이트
+        updated_components = await self.diagram_repository.update_component_positions(project_id, api_id, positions)
+
+        if updated_components is None:
             logger.error(
-                f"컴포넌트를 찾을 수 없음: project_id={project_id}, api_id={api_id}, component_id={component_id}"
+                f"컴포넌트를 찾을 수 없음: project_id={project_id}, api_id={api_id}, component_ids={list(positions)}"
             )
-            raise ValueError(f"컴포넌트를 찾을 수 없습니다. (component_id={component_id})")
+            raise HTTPException(status_code=404, detail=f"컴포넌트를 찾을 수 없습니다. (component_ids={list(positions)})")
 
         # 응답 데이터로 변환
-        return DiagramResponse.model_validate(updated_diagram)
+        return ComponentPositionListResponse(
+            content=[ComponentPositionResponse.model_validate(c) for c in updated_components]
+        )
@@ -0,0 +1,200 @@
+from typing import Iterable, List, Optional, Tuple
+
+# JSON 문자열 이스케이프 디코딩 테이블
+_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+}
+
+_WHITESPACE = ' \t\r\n'
+
+# 파서 상태
+_VALUE = 0  # 값 대기 (최상위, ':' 이후, 배열 원소)
+_KEY = 1  # 객체 키 또는 '}' 대기
+_COLON = 2  # ':' 대기
+_AFTER = 3  # 값 이후 ',' 또는 닫는 괄호 대기
+_SCALAR = 4  # 숫자/true/false/null 리터럴 내부
+
+
+class StreamingJsonFieldExtractor:
+    """
+    LLM이 토큰 단위로 생성하는 JSON에서 지정한 필드의 문자열 값을 증분으로 추출하는 파서
+
+    토큰 사이의 파싱 상태를 유지하여 각 문자를 한 번만 처리하므로 전체 비용은 출력 길이에 비례합니다.
+    문자열 값의 이스케이프(\\n, \\", \\uXXXX 등)는 디코딩된 상태로 반환됩니다.
+    필드 경로는 점으로 구분하며, 배열 원소는 인덱스로 지정합니다. (예: "message", "components.0.name")
+    최상위 '{' 또는 '[' 이전의 문자(마크다운 코드 펜스 등)는 무시합니다.
+    """
+
+    def __init__(self, field_paths: Iterable[str] = ("message",)):
+        """
+        StreamingJsonFieldExtractor 초기화
+
+        Args:
+            field_paths: 값을 추출할 필드 경로 목록
+        """
+        self.field_paths = frozenset(field_paths)
+
+        # 컨테이너 스택: [배열 여부, 현재 키 또는 인덱스]
+        self._stack: List[list] = []
+        self._state = _VALUE
+
+        # 문자열 파싱 상태
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._unicode: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        self._key_chars: List[str] = []
+
+        # 추출 대상 문자열을 파싱 중이면 해당 필드 경로
+        self._emit_path: Optional[str] = None
+        self._delta_chars: List[str] = []
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """
+        새 토큰을 입력하고 이번 토큰에서 새로 추출된 값을 반환합니다.
+
+        Args:
+            chunk: LLM이 생성한 토큰
+
+        Returns:
+            List[Tuple[str, str]]: (필드 경로, 디코딩된 증분 문자열) 목록
+        """
+        deltas: List[Tuple[str, str]] = []
+
+        for char in chunk:
+            if self._in_string:
+                self._consume_string_char(char, deltas)
+                continue
+
+            if self._state == _SCALAR:
+                if char not in ',}]' and char not in _WHITESPACE:
+                    continue
+                self._state = _AFTER
+
+            if char in _WHITESPACE:
+                continue
+
+            if self._state == _VALUE:
+                if char == '{':
+                    self._stack.append([False, None])
+                    self._state = _KEY
+                elif char == '[':
+                    self._stack.append([True, 0])
+                elif not self._stack:
+                    # 최상위 값 이전의 문자는 무시
+                    continue
+                elif char == '"':
+                    self._start_string(is_key=False)
+                elif char == ']' and self._stack[-1][0]:
+                    # 빈 배열
+                    self._close_container()
+                else:
+                    self._state = _SCALAR
+            elif self._state == _KEY:
+                if char == '"':
+                    self._start_string(is_key=True)
+                elif char == '}':
+                    self._close_container()
+            elif self._state == _COLON:
+                if char == ':':
+                    self._state = _VALUE
+            elif self._state == _AFTER:
+                top = self._stack[-1]
+                if char == ',':
+                    if top[0]:
+                        top[1] += 1
+                        self._state = _VALUE
+                    else:
+                        self._state = _KEY
+                elif char in '}]':
+                    self._close_container()
+
+        self._flush(deltas)
+        return deltas
+
+    def _start_string(self, is_key: bool) -> None:
+        self._in_string = True
+        self._string_is_key = is_key
+        if is_key:
+            self._key_chars = []
+        else:
+            path = ".".join(str(frame[1]) for frame in self._stack)
+            self._emit_path = path if path in self.field_paths else None
+
+    def _end_string(self, deltas: List[Tuple[str, str]]) -> None:
+        self._in_string = False
+        if self._string_is_key:
+            self._stack[-1][1] = "".join(self._key_chars)
+            self._state = _COLON
+        else:
+            self._flush(deltas)
+            self._emit_path = None
+            self._state = _AFTER
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        # 최상위 값이 끝나면 다시 다음 최상위 값을 대기
+        self._state = _AFTER if self._stack else _VALUE
+
+    def _consume_string_char(self, char: str, deltas: List[Tuple[str, str]]) -> None:
+        if self._unicode is not None:
+            self._unicode += char
+            if len(self._unicode) < 4:
+                return
+            try:
+                code = int(self._unicode, 16)
+            except ValueError:
+                code = 0xFFFD
+            self._unicode = None
+
+            if 0xD800 <= code < 0xDC00:
+                self._drop_lone_surrogate()
+                self._high_surrogate = code
+                return
+            if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+                code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+                self._high_surrogate = None
+            self._append(chr(code))
+            return
+
+        if self._escape:
+            self._escape = False
+            if char == 'u':
+                self._unicode = ""
+            else:
+                self._append(_ESCAPES.get(char, char))
+            return
+
+        if char == '\\':
+            self._escape = True
+        elif char == '"':
+            self._drop_lone_surrogate()
+            self._end_string(deltas)
+        else:
+            self._append(char)
+
+    def _drop_lone_surrogate(self) -> None:
+        # 짝이 없는 상위 서로게이트는 대체 문자로 출력
+        if self._high_surrogate is not None:
+            self._high_surrogate = None
+            self._append('\ufffd')
+
+    def _append(self, char: str) -> None:
+        self._drop_lone_surrogate()
+        if self._string_is_key:
+            self._key_chars.append(char)
+        elif self._emit_path is not None:
+            self._delta_chars.append(char)
+
+    def _flush(self, deltas: List[Tuple[str, str]]) -> None:
+        if self._delta_chars:
+            deltas.append((self._emit_path, "".join(self._delta_chars)))
+            self._delta_chars = []
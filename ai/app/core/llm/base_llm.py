@@ -1,8 +1,16 @@
 import logging
+import threading
+from collections import OrderedDict
 from enum import Enum
+from typing import ClassVar, Dict, Optional, Tuple
 
+import httpx
 from langchain_core.language_models import BaseChatModel
 
+from app.config.config import settings
+from app.core.llm.llm_cache import LLMResponseCache
+from app.infrastructure.cache.llm_cache_store import LLMCacheStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,8 +24,24 @@ class ModelType(str, Enum):
     OLLAMA_GEMMA = "gemma3:4b"
 
 
+OPENAI_MODELS = [ModelType.OPENAI_GPT3, ModelType.OPENAI_GPT4, ModelType.OPENAI_GPT4_TURBO, ModelType.OPENAI_GPT4_1]
+
+
 class LLMFactory:
-    """LLM 모델 생성 팩토리"""
+    """LLM 모델 생성 팩토리
+
+    get_llm()은 (model, temperature, streaming, base_url) 단위로 생성된 클라이언트를 프로세스 전역에서 재사용하며,
+    같은 base_url의 클라이언트들은 keep-alive HTTP 커넥션 풀을 공유합니다.
+    temperature=0이고 스트리밍하지 않는 클라이언트는 같은 프롬프트의 응답을 공유 LLM 응답 캐시에서 재사용합니다.
+    """
+
+    # 재사용 중인 LLM 클라이언트 (LRU 순서)
+    _pool: ClassVar["OrderedDict[Tuple, BaseChatModel]"] = OrderedDict()
+    # base_url별 공유 HTTP 클라이언트 (동기, 비동기)
+    _http_clients: ClassVar[Dict[str, Tuple[httpx.Client, httpx.AsyncClient]]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    # 결정적인 호출의 공유 응답 캐시
+    _response_cache: ClassVar[Optional[LLMResponseCache]] = None
 
     @staticmethod
     def create_llm(
@@ -40,7 +64,7 @@ class LLMFactory:
             LLM 인터페이스 구현체
         """
 
-        if model in [ModelType.OPENAI_GPT3, ModelType.OPENAI_GPT4, ModelType.OPENAI_GPT4_TURBO, ModelType.OPENAI_GPT4_1]:
+        if model in OPENAI_MODELS:
             from langchain_openai import ChatOpenAI
             return ChatOpenAI(
                 model=model,
@@ -67,3 +91,114 @@ class LLMFactory:
             )
         else:
             raise ValueError(f"지원되지 않는 모델 유형: {model}")
+
+    @classmethod
+    def get_llm(
+            cls,
+            model: ModelType,
+            api_key: str,
+            base_url: str,
+            temperature: float,
+            streaming: bool = False,
+    ) -> BaseChatModel:
+        """프로세스 전역 풀에서 LLM 클라이언트를 조회하고, 없으면 생성하여 등록합니다.
+
+        풀의 클라이언트는 여러 요청이 동시에 공유하므로 콜백 등 요청별 상태를 설정하면 안 됩니다.
+        요청별 콜백은 호출 시 config로 전달합니다.
+
+        Args:
+            model: 모델 유형
+            api_key: API 키
+            base_url: API 기본 URL
+            temperature
+            streaming: 스트리밍 여부
+
+        Returns:
+            공유 LLM 인터페이스 구현체
+        """
+        key = (model, temperature, streaming, base_url)
+
+        with cls._lock:
+            llm = cls._pool.get(key)
+            if llm is not None:
+                cls._pool.move_to_end(key)
+                return llm
+
+            kwargs = {}
+            if streaming:
+                kwargs["streaming"] = True
+            elif temperature == 0:
+                response_cache = cls.get_response_cache()
+                if response_cache is not None:
+                    kwargs["cache"] = response_cache
+            if model in OPENAI_MODELS:
+                http_client, http_async_client = cls._get_http_clients(base_url)
+                kwargs["http_client"] = http_client
+                kwargs["http_async_client"] = http_async_client
+
+            llm = cls.create_llm(
+                model=model,
+                api_key=api_key,
+                base_url=base_url,
+                temperature=temperature,
+                **kwargs
+            )
+            cls._pool[key] = llm
+            logger.info(f"LLM 클라이언트 생성: model={model.value}, temperature={temperature}, streaming={streaming}")
+
+            # 풀 크기 제한 (가장 오래 사용되지 않은 클라이언트 제거)
+            while len(cls._pool) > settings.LLM_POOL_MAX_SIZE:
+                evicted_key, _ = cls._pool.popitem(last=False)
+                logger.info(f"LLM 클라이언트 제거: {evicted_key}")
+
+            return llm
+
+    @classmethod
+    def get_response_cache(cls) -> Optional[LLMResponseCache]:
+        """공유 LLM 응답 캐시 반환 (LLM_CACHE_SIZE가 0이면 None)"""
+        if settings.LLM_CACHE_SIZE <= 0:
+            return None
+        if cls._response_cache is None:
+            cls._response_cache = LLMResponseCache(
+                max_size=settings.LLM_CACHE_SIZE,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                store=LLMCacheStore.create(
+                    tier=settings.LLM_CACHE_STORE,
+                    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                    max_size=settings.LLM_CACHE_STORE_MAX_SIZE,
+                    sqlite_path=settings.LLM_CACHE_SQLITE_PATH,
+                    collection_name=settings.LLM_CACHE_MONGO_COLLECTION,
+                ),
+            )
+        return cls._response_cache
+
+    @classmethod
+    def _get_http_clients(cls, base_url: str) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """base_url별로 공유되는 keep-alive HTTP 클라이언트 반환"""
+        clients = cls._http_clients.get(base_url)
+        if clients is None:
+            limits = httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            )
+            timeout = httpx.Timeout(settings.LLM_HTTP_TIMEOUT_SECONDS)
+            clients = (
+                httpx.Client(limits=limits, timeout=timeout),
+                httpx.AsyncClient(limits=limits, timeout=timeout),
+            )
+            cls._http_clients[base_url] = clients
+        return clients
+
+    @classmethod
+    async def close(cls):
+        """풀의 LLM 클라이언트와 공유 HTTP 커넥션을 모두 정리합니다."""
+        with cls._lock:
+            http_clients = list(cls._http_clients.values())
+            cls._http_clients.clear()
+            cls._pool.clear()
+
+        for http_client, http_async_client in http_clients:
+            http_client.close()
+            await http_async_client.aclose()
+        logger.info("LLM 클라이언트 풀 종료")
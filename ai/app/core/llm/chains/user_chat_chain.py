@@ -1,5 +1,7 @@
 import logging
+from typing import List, Optional
 
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
@@ -35,6 +37,7 @@ class UserChatChain:
             chat_data: UserChatChainPayload,
             global_files: GlobalFileListChainPayload,
             current_diagram: DiagramChainPayload,
+            callbacks: Optional[List[BaseCallbackHandler]] = None,
     ) -> SystemChatChainPayload:
         """채팅 기반 흐름 처리
 
@@ -42,6 +45,7 @@ class UserChatChain:
             chat_data: 채팅 데이터
             global_files: 전역 데이터
             current_diagram: 다이어그램
+            callbacks: 이번 호출에만 적용할 콜백 (예: SSE 스트리밍 핸들러)
 
         Returns:
             처리 결과
@@ -62,7 +66,8 @@ class UserChatChain:
 
         logger.info(f"[디버깅] UserChatChain - LLM 요청 시작")
         result = await self.chain.ainvoke(
-            format_instructions
+            format_instructions,
+            config={"callbacks": callbacks},
         )
         logger.info(f"[디버깅] UserChatChain - LLM 요청 완료 - 결과 데이터\n {result}")
 
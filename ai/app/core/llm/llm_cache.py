@@ -0,0 +1,123 @@
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+from app.infrastructure.cache.llm_cache_store import LLMCacheStore
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def llm_cache_key(prompt: str, llm_string: str) -> str:
+    """
+    LLM 호출의 캐시 키를 만듭니다.
+
+    Args:
+        prompt: 직렬화된 입력 메시지 (출력 파서의 형식 지침 포함)
+        llm_string: 모델 이름, temperature 등 호출 설정을 직렬화한 문자열
+
+    Returns:
+        str: 호출 내용의 SHA-256 해시
+    """
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(BaseCache):
+    """
+    결정적인(temperature=0) LLM 호출의 응답 캐시
+
+    LangChain 채팅 모델의 cache로 설정되어 체인 코드 변경 없이 동작합니다.
+    모델 설정과 완성된 프롬프트의 해시로 응답을 조회하며, 워커 메모리의 LRU 계층을 먼저 확인하고
+    없으면 영속 계층(SQLite/MongoDB)을 확인합니다. 영속 계층 오류는 캐시 미적중으로 처리합니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, store: Optional[LLMCacheStore] = None):
+        """
+        LLMResponseCache 초기화
+
+        Args:
+            max_size: 메모리 계층에 보관할 최대 응답 수
+            ttl_seconds: 응답 만료 시간 (0 이하이면 만료되지 않음)
+            store: 영속 계층 (없으면 메모리 계층만 사용)
+        """
+        self._memory: TTLLRUCache[str, RETURN_VAL_TYPE] = TTLLRUCache(max_size, ttl_seconds)
+        self._store = store
+        self._store_hits = 0
+        self._store_misses = 0
+        self._store_errors = 0
+        self._writes = 0
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        # 동기 호출은 메모리 계층만 사용 (체인은 모두 비동기로 호출됨)
+        return self._memory.get(llm_cache_key(prompt, llm_string))
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self._memory.put(llm_cache_key(prompt, llm_string), return_val)
+        self._writes += 1
+
+    def clear(self, **kwargs: Any) -> None:
+        self._memory.clear()
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = llm_cache_key(prompt, llm_string)
+        value = self._memory.get(key)
+        if value is not None or self._store is None:
+            return value
+
+        try:
+            serialized = await self._store.get(key)
+            # 손상되었거나 호환되지 않는 LangChain 버전에서 저장된 값도 미적중으로 처리
+            value = loads(serialized) if serialized is not None else None
+        except Exception as e:
+            self._store_errors += 1
+            logger.warning(f"LLM 응답 캐시 영속 계층 조회 실패: {e}")
+            return None
+        if value is None:
+            self._store_misses += 1
+            return None
+
+        self._store_hits += 1
+        self._memory.put(key, value)
+        return value
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = llm_cache_key(prompt, llm_string)
+        self._memory.put(key, return_val)
+        self._writes += 1
+        if self._store is None:
+            return
+
+        try:
+            await self._store.put(key, dumps(return_val))
+        except Exception as e:
+            self._store_errors += 1
+            logger.warning(f"LLM 응답 캐시 영속 계층 저장 실패: {e}")
+
+    async def aclear(self, **kwargs: Any) -> None:
+        self._memory.clear()
+        if self._store is not None:
+            await self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 지표를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 메모리/영속 계층 적중 수, 미적중 수, 적중률, 저장 수, 영속 계층 오류 수 등
+        """
+        stats: Dict[str, Any] = self._memory.stats()
+        # 메모리 계층 미적중 중 영속 계층에서 찾은 호출은 적중으로 집계
+        hits = stats["hits"] + self._store_hits
+        misses = stats["misses"] - self._store_hits
+        stats["memory_hits"] = stats["hits"]
+        stats["store_hits"] = self._store_hits
+        stats["store_misses"] = self._store_misses
+        stats["store_errors"] = self._store_errors
+        stats["hits"] = hits
+        stats["misses"] = misses
+        stats["hit_rate"] = round(hits / (hits + misses), 4) if hits + misses else 0.0
+        stats["writes"] = self._writes
+        return stats
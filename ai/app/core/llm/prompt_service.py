@@ -1,33 +1,40 @@
 import asyncio
+import hashlib
+import json
 import logging
-from typing import List
+from typing import List, Optional, Tuple
 
 from app.api.dto.diagram_dto import UserChatRequest
+from app.config.config import settings
 from app.core.generator.streaming_handler import SSEStreamingHandler
 from app.core.llm.chains.create_diagram_component_chain import CreateDiagramComponentChain
 from app.core.llm.chains.user_chat_chain import UserChatChain
 from app.core.models.diagram_model import DiagramChainPayload, ComponentChainPayload
 from app.core.models.global_setting_model import GlobalFileListChainPayload, ApiSpecChainPayload
 from app.core.models.user_chat_model import UserChatChainPayload, SystemChatChainPayload
+from app.infrastructure.cache.response_cache import ResponseCache
 from app.infrastructure.http.client.api_client import GlobalFileList, ApiSpec
 from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
 
 logger = logging.getLogger(__name__)
 
+# 다이어그램을 변경하지 않아 같은 버전에 대한 반복 요청에 재사용할 수 있는 응답 상태
+CACHEABLE_STATUSES = {
+    SystemChatChainPayload.PromptResponseEnum.EXPLANATION,
+    SystemChatChainPayload.PromptResponseEnum.UNCHANGED,
+}
+
 
 class PromptService:
     def __init__(
             self,
             user_chat_chain: UserChatChain,
             create_diagram_chain: CreateDiagramComponentChain,
+            response_cache: Optional[ResponseCache] = None,
     ):
         self.user_chat_chain = user_chat_chain
         self.create_diagram_chain = create_diagram_chain
-
-    def set_streaming_handler(self, queue: asyncio.Queue):
-        """스트리밍 핸들러를 설정합니다"""
-        streaming_handler = SSEStreamingHandler(response_queue=queue)
-        self.user_chat_chain.llm.callbacks = [streaming_handler]
+        self.response_cache = response_cache
 
     async def process_api_spec_flow(
             self,
@@ -56,6 +63,7 @@ class PromptService:
             chat_data: UserChatRequest,
             global_files: GlobalFileList,
             diagram: Diagram,
+            response_queue: Optional[asyncio.Queue] = None,
     ) -> SystemChatChainPayload:
         """채팅 기반 흐름 처리
 
@@ -63,11 +71,32 @@ class PromptService:
             chat_data: 채팅 데이터
             global_files: 전역 데이터
             diagram
+            response_queue: 응답 토큰을 스트리밍할 SSE 큐 (선택)
 
         Returns:
             처리 결과
         """
         logger.info("LLM을 사용한 채팅 기반 프롬프트 처리 시작")
+        global_files_payload = GlobalFileListChainPayload.model_validate(global_files)
+
+        # 같은 다이어그램 버전에 대한 같은 요청이면 캐시된 응답을 다시 전송
+        scope = None
+        if self.response_cache is not None and diagram is not None:
+            scope = response_cache_scope(chat_data, global_files_payload, diagram)
+            cached: Optional[SystemChatChainPayload] = await self.response_cache.get(scope, chat_data.message)
+            if cached is not None:
+                logger.info(f"캐시된 채팅 응답 사용: 상태={cached.status}")
+                if response_queue is not None:
+                    await replay_response(
+                        cached,
+                        response_queue,
+                        chunk_size=settings.RESPONSE_CACHE_REPLAY_CHUNK_SIZE,
+                        delay=settings.RESPONSE_CACHE_REPLAY_DELAY_SECONDS,
+                    )
+                return cached.model_copy(deep=True)
+
+        # 스트리밍 핸들러는 LLM 클라이언트가 요청 간에 공유되므로 이번 호출에만 전달합니다
+        callbacks = [SSEStreamingHandler(response_queue=response_queue)] if response_queue is not None else None
 
         # LLM 체인을 사용하여 처리
         result: SystemChatChainPayload = await self.user_chat_chain.predict(
@@ -76,15 +105,71 @@ class PromptService:
                 diagram=diagram,
                 chat_data=chat_data
             ),
-            global_files=GlobalFileListChainPayload.model_validate(global_files),
+            global_files=global_files_payload,
             current_diagram=DiagramChainPayload.model_validate(diagram),
+            callbacks=callbacks,
         )
 
+        if scope is not None and result.status in CACHEABLE_STATUSES:
+            await self.response_cache.put(scope, chat_data.message, result.model_copy(deep=True))
+
         logger.info("채팅 기반 프롬프트 처리 완료")
 
         return result
 
 
+def response_cache_scope(
+        chat_data: UserChatRequest,
+        global_files: GlobalFileListChainPayload,
+        diagram: Diagram,
+) -> Tuple:
+    """채팅 응답 캐시 범위 생성
+
+    메시지를 제외하고 응답에 영향을 주는 값(다이어그램 버전, 대상 methodId, tag, promptType, 전역 파일)으로 구성합니다.
+
+    Args:
+        chat_data: 채팅 데이터
+        global_files: 전역 파일 데이터
+        diagram: 요청 대상 다이어그램
+
+    Returns:
+        Tuple: 응답 캐시 범위
+    """
+    method_ids = tuple(sorted(method.get("methodId", "") for method in chat_data.targetMethods))
+    global_files_hash = hashlib.sha256(global_files.model_dump_json().encode("utf-8")).hexdigest()
+    return ResponseCache.make_scope(
+        diagram.projectId,
+        diagram.apiId,
+        diagram.metadata.version,
+        method_ids,
+        chat_data.tag,
+        chat_data.promptType,
+        global_files_hash,
+    )
+
+
+async def replay_response(
+        payload: SystemChatChainPayload,
+        response_queue: asyncio.Queue,
+        chunk_size: int,
+        delay: float,
+) -> None:
+    """캐시된 응답 메시지를 LLM 스트리밍과 같은 SSE 토큰 이벤트로 다시 전송
+
+    Args:
+        payload: 캐시된 시스템 응답
+        response_queue: SSE 응답 큐
+        chunk_size: 이벤트 하나에 담을 글자 수
+        delay: 이벤트 사이 대기 시간(초, 0이면 대기하지 않음)
+    """
+    message = payload.message or ""
+    chunk_size = max(chunk_size, 1)
+    for start in range(0, len(message), chunk_size):
+        await response_queue.put(f"data: {json.dumps({'token': message[start:start + chunk_size]})}\n\n")
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 def convert_chat_payload(
         user_chat: UserChatRequest,
         diagram: Diagram,
@@ -112,18 +197,15 @@ def convert_chat_payload(
             return [method.model_dump() for method in target_method_details]
 
 
-        latest_diagram_components = latest_diagram.components
-
-        for component in latest_diagram_components:
-            for targetMethod in user_chat_data.targetMethods:
-                target_method_id = targetMethod.get("methodId", "")
-                if not target_method_id:
-                    continue
+        # methodId 위치 색인으로 선택한 메서드만 조회
+        for targetMethod in user_chat_data.targetMethods:
+            target_method_id = targetMethod.get("methodId", "")
+            if not target_method_id:
+                continue
 
-                for method in component.methods:
-                    if method.methodId == target_method_id:
-                        target_method_details.append(method)
-                        break
+            method = latest_diagram.find_method(target_method_id)
+            if method is not None:
+                target_method_details.append(method)
 
         logger.info(f"코드 데이터 조회 완료: {len(target_method_details)}개 메소드")
 
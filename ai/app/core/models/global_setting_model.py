@@ -8,6 +8,7 @@ class GlobalFileListChainPayload(BaseModel):
 
     class GlobalFileChainPayload(BaseModel):
 
+        globalFileId: Optional[int] = Field(None, description="글로벌 파일 ID")
         fileName: Optional[str] = Field("", description="파일의 이름")
         fileType: Optional[str] = Field("", description="파일의 유형")
         fileUrl: Optional[str] = Field("", description="파일의 URL 경로")
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class _Stage:
+    name: str
+    func: StageFunc
+    depends_on: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+
+
+class StageGraph:
+    """
+    의존 관계가 있는 LLM 호출 단계를 그래프로 구성하여 실행합니다.
+
+    선행 단계가 모두 끝난 단계는 곧바로 실행되므로 서로 독립적인 단계는 동시에 실행됩니다.
+    동시 실행 수는 max_concurrency로 제한되며, 각 단계에는 개별 타임아웃을 지정할 수 있습니다.
+    한 단계라도 실패하면 실행 중인 나머지 단계를 취소하고 예외를 전파합니다.
+    """
+
+    def __init__(self, max_concurrency: int, default_timeout: Optional[float] = None):
+        """
+        StageGraph 초기화
+
+        Args:
+            max_concurrency: 동시에 실행할 수 있는 최대 단계 수
+            default_timeout: 단계별 기본 타임아웃 (초, None이면 제한 없음)
+        """
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self._stages: Dict[str, _Stage] = {}
+
+    def add_stage(
+            self,
+            name: str,
+            func: StageFunc,
+            depends_on: Optional[List[str]] = None,
+            timeout: Optional[float] = None,
+    ) -> "StageGraph":
+        """
+        단계를 추가합니다. 선행 단계는 먼저 추가되어 있어야 하므로 순환 의존은 만들어지지 않습니다.
+
+        Args:
+            name: 단계 이름 (결과 딕셔너리의 키)
+            func: 완료된 선행 단계 결과 딕셔너리를 받아 실행되는 코루틴 함수
+            depends_on: 선행 단계 이름 목록
+            timeout: 단계 타임아웃 (초, 지정하지 않으면 default_timeout)
+
+        Returns:
+            StageGraph: 체이닝을 위한 자기 자신
+        """
+        if name in self._stages:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+
+        depends_on = list(depends_on or [])
+        for dependency in depends_on:
+            if dependency not in self._stages:
+                raise ValueError(f"등록되지 않은 선행 단계입니다: {name} -> {dependency}")
+
+        self._stages[name] = _Stage(
+            name=name,
+            func=func,
+            depends_on=depends_on,
+            timeout=timeout if timeout is not None else self.default_timeout,
+        )
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        모든 단계를 의존 관계에 따라 실행합니다.
+
+        Returns:
+            Dict[str, Any]: 단계 이름별 실행 결과
+
+        Raises:
+            TimeoutError: 단계가 타임아웃을 초과한 경우
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: Dict[str, Any] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def _run_stage(stage: _Stage) -> Any:
+            if stage.depends_on:
+                await asyncio.gather(*(tasks[dependency] for dependency in stage.depends_on))
+
+            async with semaphore:
+                started_at = time.perf_counter()
+                logger.info(f"[디버깅] StageGraph - 단계 시작: {stage.name}")
+                try:
+                    result = await asyncio.wait_for(stage.func(results), timeout=stage.timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"단계 실행 시간이 초과되었습니다: {stage.name} ({stage.timeout}초)")
+                logger.info(
+                    f"[디버깅] StageGraph - 단계 완료: {stage.name} ({time.perf_counter() - started_at:.2f}초)"
+                )
+
+            results[stage.name] = result
+            return result
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.create_task(_run_stage(stage))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return results
@@ -1,17 +1,57 @@
 import logging
 import uuid
-from datetime import datetime
-from typing import Optional, Tuple
+from datetime import datetime, timedelta
+from typing import Optional, Tuple, AsyncIterator, Dict, Any
 
+from bson import ObjectId
 from fastapi import HTTPException
 
 from app.api.dto.diagram_dto import UserChatRequest, ChatResponse, ChatResponseList
 from app.core.llm.chains.chat_summary_chain import ChatSummaryChain
 from app.core.models.user_chat_model import SystemChatChainPayload
 from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
+from app.infrastructure.mongodb.repository.chat_write_behind import ChatWriteBehind
+from app.infrastructure.mongodb.repository.unit_of_work import MongoUnitOfWork
 from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
 from app.infrastructure.mongodb.repository.model.diagram_model import Diagram, SystemChat, Chat, VersionInfo, UserChat
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def encode_chat_cursor(document: Dict[str, Any]) -> str:
+    """
+    채팅 문서의 (createdAt, _id)를 다음 페이지 조회용 커서 문자열로 변환합니다.
+    MongoDB의 날짜는 밀리초 단위이므로 createdAt은 밀리초로 저장합니다.
+
+    Args:
+        document: 채팅 문서
+
+    Returns:
+        str: "{createdAt 밀리초}_{_id}" 형식의 커서
+    """
+    created_at: datetime = document["createdAt"].replace(tzinfo=None)
+    return f"{(created_at - _EPOCH) // timedelta(milliseconds=1)}_{document['_id']}"
+
+
+def decode_chat_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    커서 문자열을 (createdAt, _id)로 변환합니다.
+
+    Args:
+        cursor: encode_chat_cursor로 만든 커서
+
+    Returns:
+        Tuple[datetime, ObjectId]: 커서 위치의 (createdAt, _id)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        millis, chat_id = cursor.split("_")
+        return _EPOCH + timedelta(milliseconds=int(millis)), ObjectId(chat_id)
+    except Exception:
+        raise ValueError(f"잘못된 채팅 기록 커서입니다: {cursor}")
+
 
 class ChatService:
     """
@@ -23,6 +63,7 @@ class ChatService:
             diagram_repository: Optional[DiagramRepository] = None,
             chat_repository: Optional[ChatRepository] = None,
             chat_summary_chain: ChatSummaryChain = None,
+            chat_writer: Optional[ChatWriteBehind] = None,
     ):
         """
         ChatService 초기화
@@ -30,9 +71,11 @@ class ChatService:
         Args:
             diagram_repository (DiagramRepository, optional): 다이어그램 저장소
             chat_repository (ChatRepository, optional): 채팅 저장소
+            chat_writer (ChatWriteBehind, optional): 채팅 write-behind 버퍼 (없으면 바로 저장)
         """
         self.diagram_repository = diagram_repository
         self.chat_repository = chat_repository
+        self.chat_writer = chat_writer
         self.chat_summary_chain = chat_summary_chain
 
         self.llm = None
@@ -132,6 +175,70 @@ class ChatService:
             self.logger.error(f"채팅 기록 조회 중 오류 발생: {str(e)}", exc_info=True)
             raise
 
+    async def get_prompt_page(
+            self,
+            project_id: str,
+            api_id: str,
+            cursor: Optional[str],
+            limit: int,
+    ) -> ChatResponseList:
+        """
+        특정 프로젝트와 API의 채팅 기록을 (createdAt, _id) 커서 기준으로 limit개씩 조회합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            cursor: 이전 페이지의 nextCursor (없으면 처음부터)
+            limit: 페이지 크기
+
+        Returns:
+            ChatResponseList: 채팅 기록 목록과 다음 페이지 커서
+        """
+        after = decode_chat_cursor(cursor) if cursor else None
+
+        # 다음 페이지가 있는지 확인하기 위해 하나 더 조회
+        content = []
+        last_document = None
+        has_more = False
+        async for document in self.chat_repository.iter_prompts(project_id, api_id, after, limit + 1):
+            if len(content) == limit:
+                has_more = True
+                break
+            content.append(ChatResponse.model_validate(document))
+            last_document = document
+
+        self.logger.info(f"채팅 기록 페이지 조회 완료: {len(content)}개의 채팅, 다음 페이지 존재={has_more}")
+        return ChatResponseList(
+            content=content,
+            nextCursor=encode_chat_cursor(last_document) if has_more else None,
+        )
+
+    def stream_prompts(
+            self,
+            project_id: str,
+            api_id: str,
+            cursor: Optional[str] = None,
+    ) -> AsyncIterator[ChatResponse]:
+        """
+        특정 프로젝트와 API의 채팅 기록을 커서에서 읽는 대로 하나씩 반환합니다.
+        커서 형식 오류는 스트림을 시작하기 전에 ValueError로 발생합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            cursor: 이 커서 이후의 채팅만 조회 (없으면 처음부터)
+
+        Returns:
+            AsyncIterator[ChatResponse]: 채팅 기록
+        """
+        after = decode_chat_cursor(cursor) if cursor else None
+
+        async def _stream():
+            async for document in self.chat_repository.iter_prompts(project_id, api_id, after):
+                yield ChatResponse.model_validate(document)
+
+        return _stream()
+
     ######################################################################################################
 
     async def create_short_summary(
@@ -178,4 +285,34 @@ class ChatService:
         )
 
     async def save_chat(self, chat: Chat) -> str:
+        """
+        채팅을 저장합니다. write-behind 버퍼가 있으면 대기열에 넣고 바로 반환합니다.
+
+        Args:
+            chat: 저장할 채팅
+
+        Returns:
+            str: 채팅 ID (write-behind) 또는 삽입된 문서 ID
+        """
+        if self.chat_writer is not None:
+            await self.chat_writer.enqueue(chat)
+            return chat.chatId
         return await self.chat_repository.insert_one(chat)
+
+    async def save_chat_with_diagram(self, chat: Chat, diagram: Diagram) -> str:
+        """
+        채팅과 채팅으로 생성된 다이어그램 버전을 함께 커밋합니다.
+        둘 중 하나라도 저장에 실패하면 어느 것도 저장되지 않습니다.
+
+        Args:
+            chat: 저장할 채팅
+            diagram: 저장할 다이어그램
+
+        Returns:
+            str: 채팅 ID
+        """
+        unit_of_work = MongoUnitOfWork(self.diagram_repository, self.chat_repository)
+        unit_of_work.add_diagram(diagram)
+        unit_of_work.add_chat(chat)
+        await unit_of_work.commit()
+        return chat.chatId
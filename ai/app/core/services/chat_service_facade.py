@@ -1,9 +1,10 @@
 import asyncio
 import logging
 import uuid
-from typing import List
+from typing import List, Optional, AsyncIterator
 
-from app.api.dto.diagram_dto import UserChatRequest, ChatResponseList
+from app.api.dto.diagram_dto import UserChatRequest, ChatResponseList, ChatResponse
+from app.config.config import settings
 from app.core.diagram.component.component_service import ComponentService
 from app.core.diagram.connection.connection_service import ConnectionService
 from app.core.diagram.diagram_service import DiagramService
@@ -11,6 +12,7 @@ from app.core.llm.prompt_service import PromptService
 from app.core.models.diagram_model import ComponentChainPayload, DtoModelChainPayload, DiagramChainPayload
 from app.core.models.global_setting_model import ApiSpecChainPayload
 from app.core.models.user_chat_model import SystemChatChainPayload
+from app.core.pipeline.stage_graph import StageGraph
 from app.core.services.chat_service import ChatService
 from app.core.services.sse_service import SSEService
 from app.infrastructure.http.client.api_client import GlobalFileList, ApiSpec
@@ -63,6 +65,43 @@ class ChatServiceFacade:
         self.logger.info(f"[디버깅] ChatServiceFacade - get_prompts 메소드 완료: 채팅 개수={len(result.chats) if hasattr(result, 'chats') else 0}")
         return result
 
+    async def get_prompt_page(
+            self,
+            project_id: str,
+            api_id: str,
+            cursor: Optional[str],
+            limit: int,
+    ) -> ChatResponseList:
+        """
+        특정 프로젝트와 API의 채팅 기록을 커서 기준으로 limit개씩 조회합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            cursor: 이전 페이지의 nextCursor (없으면 처음부터)
+            limit: 페이지 크기
+
+        Returns:
+            ChatResponseList: 채팅 기록 목록과 다음 페이지 커서
+        """
+        self.logger.info(f"[디버깅] ChatServiceFacade - get_prompt_page 메소드 시작: project_id={project_id}, api_id={api_id}, limit={limit}")
+        return await self.chat_service.get_prompt_page(project_id, api_id, cursor, limit)
+
+    def stream_prompts(self, project_id: str, api_id: str, cursor: Optional[str] = None) -> AsyncIterator[ChatResponse]:
+        """
+        특정 프로젝트와 API의 채팅 기록을 하나씩 반환합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            cursor: 이 커서 이후의 채팅만 조회 (없으면 처음부터)
+
+        Returns:
+            AsyncIterator[ChatResponse]: 채팅 기록
+        """
+        self.logger.info(f"[디버깅] ChatServiceFacade - stream_prompts 메소드 시작: project_id={project_id}, api_id={api_id}")
+        return self.chat_service.stream_prompts(project_id, api_id, cursor)
+
     ######################################################################################################
 
     async def create_chat(
@@ -117,9 +156,7 @@ class ChatServiceFacade:
         self.logger.info("-" * 80)
 
         target_diagram = None
-        # 스트리밍 핸들러 설정
-        self.prompt_service.set_streaming_handler(queue)
-        self.logger.info("[디버깅] ChatServiceFacade - 스트리밍 핸들러 설정 완료")
+        new_diagram: Optional[Diagram] = None
 
         # 1. 최신 다이어그램 조회
         self.logger.info("[디버깅] ChatServiceFacade - 다이어그램 조회 시작")
@@ -147,7 +184,8 @@ class ChatServiceFacade:
         system_chat_payload: SystemChatChainPayload = await self.prompt_service.process_chat_flow(
             chat_data=chat_request,
             global_files=global_files,
-            diagram=target_diagram
+            diagram=target_diagram,
+            response_queue=queue,
         )
         self.logger.info(f"[디버깅] ChatServiceFacade - 채팅 흐름 처리 완료: 상태={system_chat_payload.status}")
         self.logger.info("[디버깅] ChatServiceFacade - 다이어그램 ID 이벤트 전송 완료")
@@ -160,31 +198,52 @@ class ChatServiceFacade:
         }:
             self.logger.info("[디버깅] ChatServiceFacade - 다이어그램 생성 시작")
             
-            self.logger.info("[디버깅] ChatServiceFacade - 컴포넌트 생성 시작")
-            components: List[ComponentChainPayload] = await self._component_service.create_components_with_system_chat(
-                system_chat_payload,
-                target_diagram
+            # 컴포넌트 생성 후 DTO/커넥션 생성은 동시에 실행하고, 요약은 시스템 채팅만 필요하므로 처음부터 함께 실행합니다
+            api_spec_payload = ApiSpecChainPayload.model_validate(api_spec.model_dump())
+            stage_graph = StageGraph(
+                max_concurrency=settings.LLM_STAGE_MAX_CONCURRENCY,
+                default_timeout=settings.LLM_STAGE_TIMEOUT_SECONDS,
             )
-            self.logger.info(f"[디버깅] ChatServiceFacade - 컴포넌트 생성 완료: {len(components)}개")
-            
-            self.logger.info("[디버깅] ChatServiceFacade - DTO 생성 시작")
-            dtos: List[DtoModelChainPayload] = await self._component_service.create_dtos_with_api_spec(
-                api_spec=ApiSpecChainPayload.model_validate(api_spec.model_dump()),
-                components=components
+            stage_graph.add_stage(
+                "components",
+                lambda results: self._component_service.create_components_with_system_chat(
+                    system_chat_payload,
+                    target_diagram
+                ),
+            )
+            stage_graph.add_stage(
+                "dtos",
+                lambda results: self._component_service.create_dtos_with_api_spec(
+                    api_spec=api_spec_payload,
+                    components=results["components"]
+                ),
+                depends_on=["components"],
             )
+            stage_graph.add_stage(
+                "connections",
+                lambda results: self._connection_service.create_connection_with_prompt(results["components"]),
+                depends_on=["components"],
+            )
+            stage_graph.add_stage(
+                "summary",
+                lambda results: self.chat_service.create_short_summary(system_chat=system_chat_payload),
+            )
+
+            self.logger.info("[디버깅] ChatServiceFacade - 컴포넌트/DTO/커넥션/요약 생성 시작")
+            stage_results = await stage_graph.run()
+
+            components: List[ComponentChainPayload] = stage_results["components"]
+            dtos: List[DtoModelChainPayload] = stage_results["dtos"]
+            connections = stage_results["connections"]
+            brief_summary, two_phrase_summary = stage_results["summary"]
+            self.logger.info(f"[디버깅] ChatServiceFacade - 컴포넌트 생성 완료: {len(components)}개")
             self.logger.info(f"[디버깅] ChatServiceFacade - DTO 생성 완료: {len(dtos)}개")
-            
-            self.logger.info("[디버깅] ChatServiceFacade - 커넥션 생성 시작")
-            connections = await self._connection_service.create_connection_with_prompt(components)
             self.logger.info(f"[디버깅] ChatServiceFacade - 커넥션 생성 완료: {len(connections)}개")
-
-            brief_summary, two_phrase_summary = await self.chat_service.create_short_summary(
-                system_chat=system_chat_payload
-            )
             self.logger.info(f"[디버깅] ChatServiceFacade - 다이어그램 요약 완료: 버전 요약 {brief_summary}, 메타 데이터 요약 {two_phrase_summary}")
 
-            self.logger.info("[디버깅] ChatServiceFacade - 다이어그램 저장 시작")
-            diagram: Diagram = await self.diagram_service.create_diagram_from_prompt_result(
+            # 다이어그램은 채팅과 함께 커밋하므로 여기서는 버전만 할당하고 저장하지 않음
+            self.logger.info("[디버깅] ChatServiceFacade - 다이어그램 생성 시작")
+            new_diagram = await self.diagram_service.build_diagram_from_prompt_result(
                 project_id=project_id,
                 api_id=api_id,
                 diagram_id=diagram_id,
@@ -193,9 +252,9 @@ class ChatServiceFacade:
                 connections=connections,
                 summary=two_phrase_summary
             )
-            self.logger.info(f"[디버깅] ChatServiceFacade - 다이어그램 저장 완료: 버전 {diagram.metadata.version}")
+            self.logger.info(f"[디버깅] ChatServiceFacade - 다이어그램 생성 완료: 버전 {new_diagram.metadata.version}")
 
-            version_id = str(diagram.metadata.version)
+            version_id = str(new_diagram.metadata.version)
             version_info: VersionInfo = VersionInfo(
                 newVersionId=version_id,
                 description=brief_summary
@@ -209,14 +268,8 @@ class ChatServiceFacade:
             )
             self.logger.info(f"[디버깅] ChatServiceFacade - 버전 유지: 버전 ID={version_info.newVersionId}")
 
-        self.logger.info("[디버깅] ChatServiceFacade - 버전 이벤트 전송")
-        await self.sse_service.send_version_event(
-            version_id=version_id,
-            response_queue=queue
-        )
         # 6. Chat 엔티티 조립 및 저장
         self.logger.info("[디버깅] ChatServiceFacade - 채팅 엔티티 조립 시작")
-        self.logger.info("[디버깅] ChatServiceFacade - 채팅 엔티티 조립 시작")
         chat_entity: Chat = self.chat_service.assemble_chat_entity(
             project_id=project_id,
             api_id=api_id,
@@ -227,12 +280,26 @@ class ChatServiceFacade:
         )
         self.logger.info(f"[디버깅] ChatServiceFacade - 채팅 엔티티 조립 완료: ID={chat_entity.chatId}")
 
-        self.logger.info("[디버깅] ChatServiceFacade - 채팅 저장 시작")
-        saved = await self.chat_service.save_chat(chat_entity)
-        self.logger.info("[디버깅] ChatServiceFacade - 채팅 저장 완료")
-        
+        if new_diagram is not None:
+            # 클라이언트가 버전 이벤트를 받고 새 버전을 조회하므로, 다이어그램과 채팅을 먼저 함께 커밋
+            self.logger.info("[디버깅] ChatServiceFacade - 다이어그램/채팅 저장 시작")
+            saved = await self.chat_service.save_chat_with_diagram(chat_entity, new_diagram)
+            self.logger.info("[디버깅] ChatServiceFacade - 다이어그램/채팅 저장 완료")
+
+        self.logger.info("[디버깅] ChatServiceFacade - 버전 이벤트 전송")
+        await self.sse_service.send_version_event(
+            version_id=version_id,
+            response_queue=queue
+        )
+
+        # 응답은 모두 전송되었으므로 스트림을 먼저 닫고 채팅을 저장
         self.logger.info("[디버깅] ChatServiceFacade - SSE 스트림 종료")
         await self.sse_service.close_stream(response_queue=queue)
+
+        if new_diagram is None:
+            self.logger.info("[디버깅] ChatServiceFacade - 채팅 저장 시작")
+            saved = await self.chat_service.save_chat(chat_entity)
+            self.logger.info("[디버깅] ChatServiceFacade - 채팅 저장 완료")
         self.logger.info("[디버깅] ChatServiceFacade - create_chat 메소드 완료")
 
         return saved
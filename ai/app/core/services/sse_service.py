@@ -2,18 +2,20 @@ import asyncio
 import json
 import logging
 import uuid
-from typing import Dict, Optional, ClassVar
+from typing import Optional, ClassVar, AsyncIterator, Awaitable, Dict, Set
+
+from app.config.config import settings
+from app.infrastructure.sse.stream_broker import StreamBroker, StreamBrokerFactory
 
 
 class SSEService:
     """
     SSE(Server-Sent Events) 스트리밍 기능을 제공하는 서비스
-    싱글톤 패턴으로 구현되어 모든 인스턴스가 동일한 sse_clients를 공유합니다.
+    싱글톤 패턴으로 구현되어 모든 인스턴스가 동일한 스트림 브로커를 공유합니다.
+    브로커 백엔드(settings.SSE_BROKER)에 따라 스트림을 워커 프로세스 간에 공유할 수 있습니다.
     """
     # 싱글톤 인스턴스
     _instance: ClassVar[Optional['SSEService']] = None
-    # 모든 인스턴스가 공유하는 클래스 변수
-    _sse_clients: ClassVar[Dict[str, asyncio.Queue]] = {}
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -21,22 +23,33 @@ class SSEService:
             cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, broker: Optional[StreamBroker] = None):
         """
         SSEService 초기화
 
         Args:
-            logger: 로깅 객체
+            broker: 스트림 브로커 (지정하지 않으면 settings.SSE_BROKER 기준으로 생성)
         """
         # 이미 초기화되었으면 다시 초기화하지 않음
         if getattr(self, '_initialized', False):
             return
 
         self.logger = logging.getLogger(__name__)
+        self._broker = broker or StreamBrokerFactory.create_broker(settings.SSE_BROKER)
+        self._reaper_task: Optional[asyncio.Task] = None
+        # 스트림별 응답 생성 태스크와 이 워커에 연결된 구독자 수
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._subscribers: Dict[str, int] = {}
+        self._cancel_handles: Dict[str, asyncio.TimerHandle] = {}
+        # 공유 브로커에서 이 워커가 실행 중인 스트림 작업의 다른 워커 구독자 수와 제어 메시지 구독 태스크
+        self._remote_subscribers: Dict[str, int] = {}
+        self._control_watchers: Dict[str, asyncio.Task] = {}
+        # 전송 중인 제어 메시지 태스크 참조 (가비지 컬렉션 방지)
+        self._control_tasks: Set[asyncio.Task] = set()
         self._initialized = True
-        self.logger.info("SSEService 시작")
+        self.logger.info(f"SSEService 시작: broker={type(self._broker).__name__}")
 
-    def create_stream(self) -> tuple[str, asyncio.Queue]:
+    async def create_stream(self) -> tuple[str, asyncio.Queue]:
         """
         새로운 SSE 스트림을 생성합니다.
 
@@ -44,43 +57,214 @@ class SSEService:
             tuple: (stream_id, response_queue)
         """
         stream_id = str(uuid.uuid4())
-        response_queue = asyncio.Queue()
-        SSEService._sse_clients[stream_id] = response_queue
+        response_queue = await self._broker.open(stream_id)
 
         self.logger.info(f"SSE 스트림 생성: stream_id={stream_id}")
-        self.logger.info(f"현재 sse clients: {SSEService._sse_clients.keys()}")
 
         return stream_id, response_queue
 
-    def get_stream(self, stream_id: str) -> Optional[asyncio.Queue]:
+    async def has_stream(self, stream_id: str) -> bool:
+        """
+        SSE 스트림이 존재하는지 확인합니다.
+
+        Args:
+            stream_id: 스트림 ID
+
+        Returns:
+            bool: 스트림 존재 여부
+        """
+        return await self._broker.exists(stream_id)
+
+    async def subscribe(self, stream_id: str, last_event_id: int = 0) -> AsyncIterator[str]:
         """
-        기존 SSE 스트림을 조회합니다.
+        SSE 스트림을 구독합니다. 다른 워커에서 생성된 스트림도 브로커를 통해 구독할 수 있습니다.
+        각 이벤트 앞에 id 필드를 붙여, 클라이언트가 재연결 시 Last-Event-ID로 이어 받을 수 있도록 합니다.
 
         Args:
             stream_id: 스트림 ID
+            last_event_id: 클라이언트가 마지막으로 받은 이벤트 ID
 
         Returns:
-            Optional[asyncio.Queue]: 응답 큐 또는 None (스트림이 없는 경우)
+            AsyncIterator[str]: 스트림 종료 시까지 이벤트를 반환하는 이터레이터
         """
-        self.logger.info(f"현재 sse clients: {SSEService._sse_clients.keys()}")
-        self.logger.info(f"현재 sse clients: {SSEService._sse_clients}")
-        return SSEService._sse_clients.get(stream_id)
+        self._subscribers[stream_id] = self._subscribers.get(stream_id, 0) + 1
+        self._cancel_scheduled(stream_id)
+
+        # 스트림 작업이 다른 워커에서 실행 중이면 브로커를 통해 연결/해제를 알림
+        remote = self._broker.shared and stream_id not in self._tasks
+        if remote:
+            await self._publish_control(stream_id, StreamBroker.ATTACH)
+
+        finished = False
+        try:
+            async for event_id, data in self._broker.subscribe(stream_id, last_event_id):
+                yield f"id: {event_id}\n{data}"
+            finished = True
+        finally:
+            remaining = self._subscribers.pop(stream_id) - 1
+            if remaining:
+                self._subscribers[stream_id] = remaining
+            elif not finished and stream_id in self._tasks:
+                # 응답 도중 연결이 끊긴 경우 재연결 유예 시간 후에도 구독자가 없으면 작업 취소
+                self.logger.info(f"SSE 구독자 연결 끊김: stream_id={stream_id}")
+                self._schedule_cancel(stream_id, settings.SSE_DISCONNECT_GRACE_SECONDS)
+
+            if remote and not finished:
+                # 연결이 끊겨 제너레이터가 취소되는 중에도 전송되도록 별도 태스크로 실행
+                task = asyncio.create_task(self._publish_control(stream_id, StreamBroker.DETACH))
+                self._control_tasks.add(task)
+                task.add_done_callback(self._control_tasks.discard)
 
-    def remove_stream(self, stream_id: str) -> None:
+    def run_stream_task(self, stream_id: str, response_queue: asyncio.Queue, coro: Awaitable) -> asyncio.Task:
+        """
+        스트림에 응답을 생성하는 작업을 스트림에 묶인 취소 가능한 태스크로 실행합니다.
+        구독자가 연결되지 않거나 연결이 끊긴 뒤 돌아오지 않으면 태스크를 취소하여
+        진행 중인 LLM 호출을 중단합니다.
+
+        Args:
+            stream_id: 스트림 ID
+            response_queue: 스트림 응답 큐
+            coro: 실행할 코루틴
+
+        Returns:
+            asyncio.Task: 실행 중인 태스크
+        """
+        task = asyncio.create_task(self._run_stream_task(stream_id, response_queue, coro))
+        self._tasks[stream_id] = task
+        task.add_done_callback(lambda _: self._forget_task(stream_id))
+
+        # 공유 브로커에서는 다른 워커에 연결된 구독자의 연결/해제를 제어 메시지로 받음
+        if self._broker.shared:
+            self._control_watchers[stream_id] = asyncio.create_task(self._watch_remote_subscribers(stream_id))
+
+        if not self._subscribers.get(stream_id):
+            self._schedule_cancel(stream_id, settings.SSE_STREAM_CONNECT_TIMEOUT_SECONDS)
+
+        return task
+
+    async def _run_stream_task(self, stream_id: str, response_queue: asyncio.Queue, coro: Awaitable):
+        try:
+            return await coro
+        except asyncio.CancelledError:
+            self.logger.info(f"구독자가 없어 스트림 작업 취소: stream_id={stream_id}")
+            response_queue.put_nowait(None)
+            raise
+        except Exception as e:
+            self.logger.error(f"스트림 작업 중 오류 발생: stream_id={stream_id}, error={str(e)}", exc_info=True)
+            response_queue.put_nowait(None)
+
+    async def _publish_control(self, stream_id: str, control: str) -> None:
+        try:
+            await self._broker.publish_control(stream_id, control)
+        except Exception as e:
+            self.logger.error(f"SSE 제어 메시지 전송 실패: stream_id={stream_id}, control={control}, error={str(e)}")
+
+    async def _watch_remote_subscribers(self, stream_id: str) -> None:
+        """다른 워커 구독자의 연결/해제 메시지를 받아 작업 취소 예약을 갱신합니다."""
+        try:
+            async for control in self._broker.watch_control(stream_id):
+                count = self._remote_subscribers.get(stream_id, 0)
+                if control == StreamBroker.ATTACH:
+                    self._remote_subscribers[stream_id] = count + 1
+                    self._cancel_scheduled(stream_id)
+                elif control == StreamBroker.DETACH:
+                    self._remote_subscribers[stream_id] = max(count - 1, 0)
+                    if not self._has_subscribers(stream_id):
+                        self.logger.info(f"다른 워커의 SSE 구독자 연결 끊김: stream_id={stream_id}")
+                        self._schedule_cancel(stream_id, settings.SSE_DISCONNECT_GRACE_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 구독자 연결 여부를 알 수 없으므로 연결된 것으로 보고 자동 취소하지 않음
+            self._cancel_scheduled(stream_id)
+            self.logger.error(f"SSE 제어 메시지 구독 실패: stream_id={stream_id}, error={str(e)}", exc_info=True)
+
+    def _has_subscribers(self, stream_id: str) -> bool:
+        return bool(self._subscribers.get(stream_id) or self._remote_subscribers.get(stream_id))
+
+    def _schedule_cancel(self, stream_id: str, delay: float) -> None:
+        self._cancel_scheduled(stream_id)
+        loop = asyncio.get_running_loop()
+        self._cancel_handles[stream_id] = loop.call_later(delay, self._cancel_if_detached, stream_id)
+
+    def _cancel_scheduled(self, stream_id: str) -> None:
+        handle = self._cancel_handles.pop(stream_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _cancel_if_detached(self, stream_id: str) -> None:
+        self._cancel_handles.pop(stream_id, None)
+        if self._has_subscribers(stream_id):
+            return
+
+        task = self._tasks.get(stream_id)
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _forget_task(self, stream_id: str) -> None:
+        self._tasks.pop(stream_id, None)
+        self._cancel_scheduled(stream_id)
+        self._remote_subscribers.pop(stream_id, None)
+        watcher = self._control_watchers.pop(stream_id, None)
+        if watcher is not None:
+            watcher.cancel()
+
+    async def remove_stream(self, stream_id: str) -> None:
         """
         SSE 스트림을 제거합니다.
 
         Args:
             stream_id: 제거할 스트림 ID
         """
-        if stream_id in SSEService._sse_clients:
-            self.logger.info(f"SSE 스트림 제거: stream_id={stream_id}")
-            del SSEService._sse_clients[stream_id]
+        self.logger.info(f"SSE 스트림 제거: stream_id={stream_id}")
+        await self._broker.remove(stream_id)
+
+    def start_reaper(self) -> None:
+        """
+        방치된 스트림을 주기적으로 정리하는 백그라운드 태스크를 시작합니다.
+        구독자가 연결되지 않았거나 이벤트가 끊긴 스트림의 큐를 해제합니다.
+        """
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_loop())
+
+    async def stop_reaper(self) -> None:
+        """스트림 정리 태스크를 종료합니다."""
+        if self._reaper_task is None:
+            return
+
+        self._reaper_task.cancel()
+        try:
+            await self._reaper_task
+        except asyncio.CancelledError:
+            pass
+        self._reaper_task = None
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.SSE_REAPER_INTERVAL_SECONDS)
+            try:
+                reaped = await self._broker.reap(
+                    connect_timeout=settings.SSE_STREAM_CONNECT_TIMEOUT_SECONDS,
+                    idle_timeout=settings.SSE_STREAM_IDLE_TIMEOUT_SECONDS,
+                )
+                if reaped:
+                    self.logger.info(f"방치된 SSE 스트림 {reaped}개 정리: stats={self._broker.stats()}")
+            except Exception as e:
+                self.logger.error(f"SSE 스트림 정리 중 오류 발생: {str(e)}", exc_info=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        스트림 브로커의 현재 상태 지표를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 활성/미연결 스트림 수, 버퍼링된 이벤트 수, 버려진 이벤트 수 등
+        """
+        return self._broker.stats()
 
     async def send_version_event(self, version_id: str, response_queue: asyncio.Queue) -> None:
         """버전 생성 이벤트를 전송하는 함수"""
         event = f"data: {json.dumps({'token': {'newVersionId': version_id}})}\n\n"
-        response_queue.put_nowait(event)
+        await response_queue.put(event)
         self.logger.info(f"생성 이벤트 발송: {event}")
 
     async def send_progress(self, response_queue: asyncio.Queue, message: str) -> None:
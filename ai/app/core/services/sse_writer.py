@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+# 구독 종료 표시
+_END = object()
+
+
+class SSEBatchWriter:
+    """
+    SSE 이벤트를 시간 창 또는 크기 기준으로 묶어 StreamingResponse에 전달하는 writer
+
+    토큰마다 응답을 쓰는 대신 flush_interval 동안 도착한 이벤트를 한 번에 쓰고,
+    max_batch_bytes를 넘으면 즉시 씁니다. 이벤트가 없는 동안에는 heartbeat 주석을 보내
+    프록시가 연결을 끊지 않도록 합니다. 내부 버퍼는 max_buffered_events로 제한되어 클라이언트가
+    느리면 이벤트 이터레이터(스트림 큐) 소비를 멈추고 생산자까지 백프레셔가 전달됩니다.
+    """
+
+    HEARTBEAT = ": heartbeat\n\n"
+
+    def __init__(self, flush_interval: float, max_batch_bytes: int, heartbeat_interval: float, max_buffered_events: int = 256):
+        """
+        SSEBatchWriter 초기화
+
+        Args:
+            flush_interval: 이벤트를 묶는 시간 창 (초)
+            max_batch_bytes: 한 번에 쓰는 최대 크기 (바이트)
+            heartbeat_interval: 유휴 상태에서 heartbeat를 보내는 주기 (초)
+            max_buffered_events: 응답으로 쓰기 전에 버퍼에 보관할 최대 이벤트 수
+        """
+        self.flush_interval = flush_interval
+        self.max_batch_bytes = max_batch_bytes
+        self.heartbeat_interval = heartbeat_interval
+        self.max_buffered_events = max_buffered_events
+
+    async def write(self, events: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        이벤트 이터레이터를 묶음 단위 응답 청크 이터레이터로 변환합니다.
+
+        Args:
+            events: SSE 이벤트 이터레이터
+
+        Returns:
+            AsyncIterator[str]: 응답 본문 청크 이터레이터
+        """
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=self.max_buffered_events)
+
+        async def _pump():
+            try:
+                async for event in events:
+                    await buffer.put(event)
+            except asyncio.CancelledError:
+                # 응답이 끝나 취소된 경우 종료 표시를 읽을 소비자가 없음
+                raise
+            except Exception:
+                await buffer.put(_END)
+                raise
+            await buffer.put(_END)
+
+        pump = asyncio.create_task(_pump())
+        loop = asyncio.get_running_loop()
+
+        try:
+            ended = False
+            while not ended:
+                try:
+                    event = await asyncio.wait_for(buffer.get(), timeout=self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield self.HEARTBEAT
+                    continue
+
+                if event is _END:
+                    break
+
+                chunks = [f"{event}\n\n"]
+                size = len(chunks[0].encode())
+                deadline = loop.time() + self.flush_interval
+
+                # 시간 창이 끝나거나 크기 한도에 도달할 때까지 이벤트를 모음
+                while size < self.max_batch_bytes:
+                    if buffer.empty():
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            event = await asyncio.wait_for(buffer.get(), timeout=timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    else:
+                        event = buffer.get_nowait()
+
+                    if event is _END:
+                        ended = True
+                        break
+
+                    chunk = f"{event}\n\n"
+                    chunks.append(chunk)
+                    size += len(chunk.encode())
+
+                logger.debug(f"SSE 이벤트 {len(chunks)}개 전송 ({size} bytes)")
+                yield "".join(chunks)
+
+            # 구독 중 발생한 예외 전파
+            await pump
+        finally:
+            if not pump.done():
+                pump.cancel()
@@ -0,0 +1 @@
+"""프로세스 내 캐시 모듈"""
@@ -0,0 +1,225 @@
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pymongo.errors import PyMongoError
+
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
+
+logger = logging.getLogger(__name__)
+
+
+class CacheGenerationStore(ABC):
+    """
+    워커 간에 공유되는 캐시 세대 번호 저장소
+
+    다이어그램이 변경될 때마다 (projectId, apiId)의 세대 번호를 증가시키고,
+    각 워커는 캐시한 시점의 세대 번호와 비교하여 다른 워커의 변경을 감지합니다.
+    """
+
+    @abstractmethod
+    async def get_generation(self, key: str) -> int:
+        """키의 현재 세대 번호를 반환합니다. 변경된 적이 없으면 0입니다."""
+        pass
+
+    @abstractmethod
+    async def bump(self, key: str) -> None:
+        """키의 세대 번호를 증가시킵니다."""
+        pass
+
+
+class MongoCacheGenerationStore(CacheGenerationStore):
+    """MongoDB 컬렉션에 세대 번호를 저장하는 공유 계층"""
+
+    def __init__(self, collection_name: str):
+        """
+        MongoCacheGenerationStore 초기화
+
+        Args:
+            collection_name: 세대 번호를 저장할 컬렉션 이름
+        """
+        self.collection_name = collection_name
+        self._collection = None
+
+    async def _get_collection(self):
+        if self._collection is None:
+            from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+            db = await MongoDBConnection.connect()
+            self._collection = db[self.collection_name]
+        return self._collection
+
+    async def get_generation(self, key: str) -> int:
+        collection = await self._get_collection()
+        document = await collection.find_one({"_id": key}, {"generation": 1})
+        return document["generation"] if document else 0
+
+    async def bump(self, key: str) -> None:
+        collection = await self._get_collection()
+        await collection.update_one({"_id": key}, {"$inc": {"generation": 1}}, upsert=True)
+
+
+class LatestDiagramCache:
+    """
+    (projectId, apiId)별 최신 다이어그램의 read-through 캐시
+
+    조회한 Diagram 객체를 그대로 보관하므로, 캐시에서 반환된 다이어그램은 수정하지 않고
+    새 객체로 복제하여 사용해야 합니다. 공유 계층이 있으면 적중 시 세대 번호를 확인하여
+    다른 워커에서 저장된 변경도 반영합니다. 세대 번호는 generation_ttl_seconds 동안 워커에 보관하므로
+    다른 워커의 변경은 최대 그 시간만큼 늦게 반영되고, 이 워커의 변경은 바로 반영됩니다.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            ttl_seconds: float,
+            shared: Optional[CacheGenerationStore] = None,
+            generation_ttl_seconds: float = 0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        LatestDiagramCache 초기화
+
+        Args:
+            max_size: 캐시할 최대 다이어그램 수
+            ttl_seconds: 캐시 만료 시간
+            shared: 워커 간 무효화를 공유할 세대 번호 저장소 (없으면 워커별 캐시)
+            generation_ttl_seconds: 공유 세대 번호를 워커에 보관할 시간 (0 이하이면 적중마다 조회)
+            clock: 현재 시각을 반환하는 함수 (테스트용)
+        """
+        self._cache: TTLLRUCache[Tuple[str, str], Tuple[Diagram, int]] = TTLLRUCache(max_size, ttl_seconds, clock)
+        self._shared = shared
+        self._shared_generations: Optional[TTLLRUCache[Tuple[str, str], int]] = (
+            TTLLRUCache(max_size, generation_ttl_seconds, clock) if generation_ttl_seconds > 0 else None
+        )
+        # 조회 중 무효화된 결과를 캐시하지 않기 위한 워커 내 세대 번호
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._stale = 0
+        self._shared_errors = 0
+
+    @staticmethod
+    def create(
+            max_size: int,
+            ttl_seconds: float,
+            shared_tier: str,
+            collection_name: str,
+            generation_ttl_seconds: float = 0,
+    ) -> "LatestDiagramCache":
+        """설정된 공유 계층 유형으로 캐시 생성
+
+        Args:
+            max_size: 캐시할 최대 다이어그램 수
+            ttl_seconds: 캐시 만료 시간
+            shared_tier: 공유 계층 유형 ("none", "mongo")
+            collection_name: mongo 공유 계층의 세대 번호 컬렉션 이름
+            generation_ttl_seconds: 공유 세대 번호를 워커에 보관할 시간
+
+        Returns:
+            LatestDiagramCache
+        """
+        if shared_tier == "none":
+            return LatestDiagramCache(max_size, ttl_seconds)
+        elif shared_tier == "mongo":
+            return LatestDiagramCache(
+                max_size, ttl_seconds, MongoCacheGenerationStore(collection_name), generation_ttl_seconds
+            )
+        else:
+            raise ValueError(f"지원되지 않는 다이어그램 캐시 공유 계층 유형: {shared_tier}")
+
+    @staticmethod
+    def _shared_key(key: Tuple[str, str]) -> str:
+        return f"{key[0]}:{key[1]}"
+
+    async def _get_shared_generation(self, key: Tuple[str, str], refresh: bool) -> int:
+        """워커에 보관한 공유 세대 번호를 반환하고, 없거나 refresh이면 공유 계층에서 조회합니다."""
+        if not refresh and self._shared_generations is not None:
+            generation = self._shared_generations.get(key)
+            if generation is not None:
+                return generation
+
+        generation = await self._shared.get_generation(self._shared_key(key))
+        if self._shared_generations is not None:
+            self._shared_generations.put(key, generation)
+        return generation
+
+    async def get_or_load(
+            self,
+            project_id: str,
+            api_id: str,
+            loader: Callable[[], Awaitable[Optional[Diagram]]],
+    ) -> Optional[Diagram]:
+        """
+        캐시된 최신 다이어그램을 반환하고, 없으면 loader로 조회하여 캐시합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            loader: 저장소에서 최신 다이어그램을 조회하는 함수
+
+        Returns:
+            Optional[Diagram]: 최신 다이어그램 또는 None
+        """
+        key = (project_id, api_id)
+        entry = self._cache.get(key)
+        shared_generation = 0
+        if self._shared is not None:
+            try:
+                # 미적중이면 어차피 MongoDB를 조회하므로 세대 번호도 새로 조회
+                shared_generation = await self._get_shared_generation(key, refresh=entry is None)
+            except PyMongoError as e:
+                # 공유 계층을 확인할 수 없으면 캐시를 거치지 않고 조회
+                self._shared_errors += 1
+                logger.error(f"다이어그램 캐시 세대 번호 조회 실패: key={key}, error={e}")
+                return await loader()
+
+        if entry is not None:
+            diagram, cached_generation = entry
+            if cached_generation == shared_generation:
+                return diagram
+            # 다른 워커에서 변경된 다이어그램
+            self._stale += 1
+            self._cache.invalidate(key)
+
+        local_generation = self._generations.get(key, 0)
+        diagram = await loader()
+        if diagram is not None and self._generations.get(key, 0) == local_generation:
+            self._cache.put(key, (diagram, shared_generation))
+        return diagram
+
+    async def invalidate(self, project_id: str, api_id: str) -> None:
+        """
+        최신 다이어그램 캐시를 무효화합니다. 다이어그램을 저장한 뒤 호출합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+        """
+        key = (project_id, api_id)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._cache.invalidate(key)
+
+        if self._shared is not None:
+            if self._shared_generations is not None:
+                self._shared_generations.invalidate(key)
+            try:
+                await self._shared.bump(self._shared_key(key))
+            except PyMongoError as e:
+                # 다른 워커의 캐시는 만료 시간이 지나면 갱신됨
+                self._shared_errors += 1
+                logger.error(f"다이어그램 캐시 세대 번호 갱신 실패: key={key}, error={e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 지표를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 적중/미적중 수, 다른 워커의 변경으로 버려진 항목 수, 만료/제거/무효화 수 등
+        """
+        stats = self._cache.stats()
+        # 세대 번호가 달라 버려진 항목은 미적중으로 집계
+        stats["hits"] -= self._stale
+        stats["misses"] += self._stale
+        stats["stale"] = self._stale
+        stats["shared_errors"] = self._shared_errors
+        return stats
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCacheStore(ABC):
+    """
+    LLM 응답 캐시의 영속 계층
+
+    키는 모델 설정과 프롬프트의 해시이고, 값은 직렬화된 LLM 응답 문자열입니다.
+    워커 재시작 후나 다른 워커에서도 같은 호출의 응답을 재사용하기 위해 사용합니다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """키의 값을 반환합니다. 없거나 만료되었으면 None입니다."""
+        pass
+
+    @abstractmethod
+    async def put(self, key: str, value: str) -> None:
+        """키의 값을 저장합니다."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """모든 값을 제거합니다."""
+        pass
+
+    @staticmethod
+    def create(tier: str, ttl_seconds: float, max_size: int, sqlite_path: str, collection_name: str) -> Optional["LLMCacheStore"]:
+        """설정된 유형의 영속 계층 생성
+
+        Args:
+            tier: 영속 계층 유형 ("none", "sqlite", "mongo")
+            ttl_seconds: 값 만료 시간 (0 이하이면 만료되지 않음)
+            max_size: 보관할 최대 값 수 (sqlite만 해당, 0 이하이면 제한 없음)
+            sqlite_path: sqlite 데이터베이스 파일 경로
+            collection_name: mongo 컬렉션 이름
+
+        Returns:
+            Optional[LLMCacheStore]: 영속 계층 (none이면 None)
+        """
+        if tier == "none":
+            return None
+        elif tier == "sqlite":
+            return SQLiteLLMCacheStore(sqlite_path, ttl_seconds, max_size)
+        elif tier == "mongo":
+            return MongoLLMCacheStore(collection_name, ttl_seconds)
+        else:
+            raise ValueError(f"지원되지 않는 LLM 캐시 영속 계층 유형: {tier}")
+
+
+class SQLiteLLMCacheStore(LLMCacheStore):
+    """로컬 SQLite 파일에 저장하는 영속 계층 (같은 호스트의 워커 간 공유)"""
+
+    def __init__(self, path: str, ttl_seconds: float, max_size: int):
+        """
+        SQLiteLLMCacheStore 초기화
+
+        Args:
+            path: 데이터베이스 파일 경로
+            ttl_seconds: 값 만료 시간 (0 이하이면 만료되지 않음)
+            max_size: 보관할 최대 값 수 (넘으면 가장 오래 사용되지 않은 값부터 제거)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)")
+            self._connection = connection
+        return self._connection
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if 0 < self.ttl_seconds <= now - created_at:
+                connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            connection.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def _put(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            if self.max_size > 0:
+                connection.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM llm_cache")
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._put, key, value)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+
+class MongoLLMCacheStore(LLMCacheStore):
+    """MongoDB 컬렉션에 저장하는 영속 계층 (모든 워커 간 공유, 만료는 TTL 인덱스로 처리)"""
+
+    def __init__(self, collection_name: str, ttl_seconds: float):
+        """
+        MongoLLMCacheStore 초기화
+
+        Args:
+            collection_name: 값을 저장할 컬렉션 이름
+            ttl_seconds: 값 만료 시간 (0 이하이면 만료되지 않음)
+        """
+        self.collection_name = collection_name
+        self.ttl_seconds = ttl_seconds
+        self._collection = None
+
+    async def _get_collection(self):
+        if self._collection is None:
+            from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+            db = await MongoDBConnection.connect()
+            collection = db[self.collection_name]
+            # TTL 인덱스의 삭제 작업은 주기적으로 실행되므로 조회 시에도 expiresAt을 확인
+            await collection.create_index("expiresAt", expireAfterSeconds=0)
+            self._collection = collection
+        return self._collection
+
+    async def get(self, key: str) -> Optional[str]:
+        collection = await self._get_collection()
+        document = await collection.find_one({"_id": key}, {"value": 1, "expiresAt": 1})
+        if document is None:
+            return None
+        expires_at = document.get("expiresAt")
+        if expires_at is not None and expires_at.replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc):
+            return None
+        return document["value"]
+
+    async def put(self, key: str, value: str) -> None:
+        collection = await self._get_collection()
+        document = {"value": value}
+        if self.ttl_seconds > 0:
+            document["expiresAt"] = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        await collection.update_one({"_id": key}, {"$set": document}, upsert=True)
+
+    async def clear(self) -> None:
+        collection = await self._get_collection()
+        await collection.delete_many({})
@@ -0,0 +1,224 @@
+import logging
+import math
+import re
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# 메시지를 임베딩 벡터로 변환하는 함수
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message: Optional[str]) -> str:
+    """
+    캐시 키에 사용할 수 있도록 메시지를 정규화합니다. (앞뒤 공백 제거, 소문자, 연속 공백 축약)
+
+    Args:
+        message: 사용자 메시지
+
+    Returns:
+        str: 정규화된 메시지
+    """
+    return _WHITESPACE.sub(" ", (message or "").strip()).lower()
+
+
+def _normalize_vector(vector: Sequence[float]) -> Optional[Tuple[float, ...]]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return None
+    return tuple(value / norm for value in vector)
+
+
+class ResponseCache(Generic[V]):
+    """
+    같은 다이어그램 버전에 대한 반복 채팅 요청의 응답 캐시
+
+    응답은 (projectId, apiId, 다이어그램 버전, 대상 methodId, tag, promptType 등) 범위와
+    정규화된 메시지로 구성된 키에 저장합니다. 임베딩 함수가 있으면 정확히 일치하는 키가 없을 때
+    같은 범위 안에서 코사인 유사도가 similarity_threshold 이상인 메시지의 응답을 사용합니다.
+    다이어그램의 새 버전이 저장되면 invalidate로 해당 API의 응답을 모두 제거합니다.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            ttl_seconds: float,
+            embedder: Optional[Embedder] = None,
+            similarity_threshold: float = 1.0,
+    ):
+        """
+        ResponseCache 초기화
+
+        Args:
+            max_size: 캐시할 최대 응답 수
+            ttl_seconds: 응답 만료 시간 (0 이하이면 만료되지 않음)
+            embedder: 메시지 임베딩 함수 (없으면 정확히 일치하는 메시지만 적중)
+            similarity_threshold: 유사 메시지로 판단할 최소 코사인 유사도
+        """
+        self._cache: TTLLRUCache[Tuple, V] = TTLLRUCache(max_size, ttl_seconds)
+        self._embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        # 범위별 (메시지 키, 정규화된 임베딩) 목록 - 같은 범위 안에서만 비교하므로 선형 탐색으로 충분함
+        self._vectors: Dict[Tuple, List[Tuple[Tuple, Tuple[float, ...]]]] = {}
+        self._similar_hits = 0
+        self._embedding_errors = 0
+
+    @staticmethod
+    def create(
+            max_size: int,
+            ttl_seconds: float,
+            embedding_model: str = "",
+            similarity_threshold: float = 1.0,
+            api_key: str = "",
+            base_url: str = "",
+    ) -> "ResponseCache":
+        """설정으로 응답 캐시 생성
+
+        Args:
+            max_size: 캐시할 최대 응답 수
+            ttl_seconds: 응답 만료 시간
+            embedding_model: 유사 메시지 검색에 사용할 OpenAI 임베딩 모델 (비어 있으면 사용 안 함)
+            similarity_threshold: 유사 메시지로 판단할 최소 코사인 유사도
+            api_key: OpenAI API 키
+            base_url: OpenAI API 기본 URL
+
+        Returns:
+            ResponseCache
+        """
+        if not embedding_model:
+            return ResponseCache(max_size, ttl_seconds)
+
+        from langchain_openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(model=embedding_model, api_key=api_key, base_url=base_url or None)
+        return ResponseCache(max_size, ttl_seconds, embeddings.aembed_query, similarity_threshold)
+
+    @staticmethod
+    def make_scope(project_id: str, api_id: str, *parts: Hashable) -> Tuple:
+        """
+        응답 캐시 범위를 만듭니다. 처음 두 값은 무효화 단위인 (projectId, apiId)입니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            *parts: 응답에 영향을 주는 나머지 값 (다이어그램 버전, 대상 methodId 등)
+
+        Returns:
+            Tuple: 캐시 범위
+        """
+        return (project_id, api_id) + tuple(parts)
+
+    async def get(self, scope: Tuple, message: Optional[str]) -> Optional[V]:
+        """
+        캐시된 응답을 조회합니다. 정확히 일치하는 메시지가 없으면 유사 메시지를 찾습니다.
+
+        Args:
+            scope: make_scope로 만든 캐시 범위
+            message: 사용자 메시지
+
+        Returns:
+            Optional[V]: 캐시된 응답 또는 None
+        """
+        normalized = normalize_message(message)
+        value = self._cache.get(scope + (normalized,))
+        if value is not None or self._embedder is None or not self._vectors.get(scope):
+            return value
+
+        vector = await self._embed(normalized)
+        if vector is None:
+            return None
+
+        best_key, best_score = None, self.similarity_threshold
+        for key, candidate in self._vectors[scope]:
+            score = sum(a * b for a, b in zip(vector, candidate))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+
+        value = self._cache.get(best_key)
+        if value is None:
+            # 만료되거나 제거된 응답의 임베딩은 버림
+            self._vectors[scope] = [entry for entry in self._vectors[scope] if entry[0] != best_key]
+            return None
+        self._similar_hits += 1
+        return value
+
+    async def put(self, scope: Tuple, message: Optional[str], value: V) -> None:
+        """
+        응답을 저장합니다.
+
+        Args:
+            scope: make_scope로 만든 캐시 범위
+            message: 사용자 메시지
+            value: 저장할 응답
+        """
+        normalized = normalize_message(message)
+        key = scope + (normalized,)
+        self._cache.put(key, value)
+
+        if self._embedder is None or key not in self._cache:
+            return
+        vector = await self._embed(normalized)
+        if vector is None:
+            return
+        entries = [entry for entry in self._vectors.get(scope, []) if entry[0] != key]
+        entries.append((key, vector))
+        self._vectors[scope] = entries
+        self._prune_vectors()
+
+    def invalidate(self, project_id: str, api_id: str) -> int:
+        """
+        API의 캐시된 응답을 모두 제거합니다. 다이어그램의 새 버전이 저장된 뒤 호출합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+
+        Returns:
+            int: 제거된 응답 수
+        """
+        prefix = (project_id, api_id)
+        for scope in [scope for scope in self._vectors if scope[:2] == prefix]:
+            del self._vectors[scope]
+        return self._cache.invalidate_where(lambda key: key[:2] == prefix)
+
+    async def _embed(self, message: str) -> Optional[Tuple[float, ...]]:
+        try:
+            return _normalize_vector(await self._embedder(message))
+        except Exception as e:
+            # 임베딩을 만들 수 없으면 정확히 일치하는 메시지만 사용
+            self._embedding_errors += 1
+            logger.warning(f"응답 캐시 임베딩 생성 실패: {e}")
+            return None
+
+    def _prune_vectors(self) -> None:
+        """캐시에서 제거된 응답의 임베딩이 쌓이지 않도록 정리합니다."""
+        if sum(len(entries) for entries in self._vectors.values()) <= 2 * self._cache.max_size:
+            return
+        for scope in list(self._vectors):
+            entries = [entry for entry in self._vectors[scope] if entry[0] in self._cache]
+            if entries:
+                self._vectors[scope] = entries
+            else:
+                del self._vectors[scope]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 지표를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 적중/미적중 수(유사 메시지 적중 포함), 임베딩 수, 만료/제거/무효화 수 등
+        """
+        stats = self._cache.stats()
+        # 유사 메시지 적중은 정확한 키 조회에서 미적중으로 집계되었으므로 제외
+        stats["misses"] -= self._similar_hits
+        stats["similar_hits"] = self._similar_hits
+        stats["embeddings"] = sum(len(entries) for entries in self._vectors.values())
+        stats["embedding_errors"] = self._embedding_errors
+        return stats
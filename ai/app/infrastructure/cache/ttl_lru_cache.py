@@ -0,0 +1,136 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLLRUCache(Generic[K, V]):
+    """
+    크기 제한과 만료 시간을 가진 LRU 캐시
+
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    저장 후 ttl_seconds가 지난 항목은 조회 시 만료 처리합니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        """
+        TTLLRUCache 초기화
+
+        Args:
+            max_size: 보관할 최대 항목 수
+            ttl_seconds: 항목 만료 시간 (0 이하이면 만료되지 않음)
+            clock: 현재 시각을 반환하는 함수 (테스트용)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        항목을 조회합니다. 없거나 만료된 경우 None을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[V]: 캐시된 값 또는 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        stored_at, value = entry
+        if 0 < self.ttl_seconds <= self._clock() - stored_at:
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        항목을 저장합니다. 최대 크기를 넘으면 가장 오래 사용되지 않은 항목을 제거합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        """
+        항목을 제거합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            bool: 항목이 있어 제거되었는지 여부
+        """
+        if self._entries.pop(key, None) is None:
+            return False
+        self._invalidations += 1
+        return True
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        """
+        조건을 만족하는 키의 항목을 모두 제거합니다.
+
+        Args:
+            predicate: 제거할 키이면 True를 반환하는 함수
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        self._invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        self._entries.clear()
+
+    def __contains__(self, key: K) -> bool:
+        """만료 여부와 사용 순서, 지표에 영향 없이 항목이 있는지 확인합니다."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 지표를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 적중/미적중 수, 만료/제거/무효화 수, 현재 크기
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "expirations": self._expirations,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
@@ -6,6 +6,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
 
 from app.config.config import settings
+from app.infrastructure.mongodb.connection.indexes import ensure_indexes
 
 logger = logging.getLogger(__name__)
 
@@ -27,25 +28,56 @@ class MongoDBConnection:
                 mongo_uri = settings.MONGO_URI
                 db_name = settings.MONGO_DB_NAME
 
-                # MongoDB 클라이언트 생성 (비동기)
-                cls._client = AsyncIOMotorClient(mongo_uri, ssl=True, tlsAllowInvalidCertificates=True)
+                # MongoDB 클라이언트 생성 (비동기, 프로세스 전체에서 하나의 커넥션 풀 공유)
+                cls._client = AsyncIOMotorClient(
+                    mongo_uri,
+                    ssl=True,
+                    tlsAllowInvalidCertificates=True,
+                    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                    maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+                    connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+                    serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                    socketTimeoutMS=settings.MONGO_SOCKET_TIMEOUT_MS,
+                    compressors=settings.MONGO_COMPRESSORS,
+                )
                 cls._db = cls._client[db_name]
 
                 # 연결 상태 검증
-                print(f"MongoDB에 연결합니다: {mongo_uri}, 데이터베이스: {db_name}")
+                logger.info(f"MongoDB에 연결합니다: {mongo_uri}, 데이터베이스: {db_name}")
 
                 await cls._client.admin.command('ping')
                 logger.info(f"MongoDB 연결 성공: {mongo_uri}, 데이터베이스: {db_name}")
 
+                # 자주 실행되는 쿼리를 위한 인덱스 생성
+                if settings.MONGO_ENSURE_INDEXES:
+                    await ensure_indexes(cls._db)
+
                 return cls._db
             except ConnectionFailure as e:
                 logger.error(f"MongoDB 연결 실패: {e}")
+                cls._reset_client()
                 raise
             except Exception as e:
                 logger.error(f"MongoDB 연결 중 예기치 않은 오류: {e}")
+                cls._reset_client()
                 raise
         return cls._db
 
+    @classmethod
+    def _reset_client(cls):
+        """연결에 실패한 클라이언트를 닫고 다음 connect() 호출에서 다시 연결하도록 초기화"""
+        if cls._client is not None:
+            cls._client.close()
+        cls._client = None
+        cls._db = None
+
+    @classmethod
+    async def start_session(cls):
+        """공유 클라이언트에서 MongoDB 세션을 시작합니다. 여러 쓰기를 하나의 트랜잭션으로 묶을 때 사용합니다."""
+        await cls.connect()
+        return await cls._client.start_session()
+
     @classmethod
     async def close(cls):
         """MongoDB 연결 종료"""
@@ -0,0 +1,93 @@
+"""MongoDB 인덱스 관리 모듈"""
+
+import logging
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# 컬렉션별로 자주 실행되는 쿼리를 지원하는 인덱스 정의
+INDEXES: Dict[str, List[IndexModel]] = {
+    "diagrams": [
+        # 최신 버전 조회 (find_latest_by_project_api) 및 버전별 조회 (find_by_project_api_version)
+        # 동시에 생성된 다이어그램이 같은 버전을 갖지 않도록 고유 인덱스로 생성
+        IndexModel(
+            [("projectId", ASCENDING), ("apiId", ASCENDING), ("metadata.version", DESCENDING)],
+            name="projectId_apiId_version",
+            unique=True,
+        ),
+        # methodId 색인이 없는 이전 데이터의 메서드 ID 조회 (find_diagram_by_method_id), 배열 필드이므로 multikey 인덱스
+        IndexModel([("components.methods.methodId", ASCENDING)], name="components_methods_methodId"),
+        # 다이어그램 ID로 조회 및 저장 (save)
+        IndexModel([("diagramId", ASCENDING)], name="diagramId_unique", unique=True),
+    ],
+    "diagram_method_index": [
+        # 메서드 ID로 해당 메서드를 포함하는 최신 버전 조회 (find_diagram_by_method_id)
+        IndexModel(
+            [("projectId", ASCENDING), ("apiId", ASCENDING), ("methodId", ASCENDING), ("version", DESCENDING)],
+            name="projectId_apiId_methodId_version",
+            unique=True,
+        ),
+        # 다이어그램 저장 시 기존 색인 항목 교체
+        IndexModel([("diagramId", ASCENDING)], name="diagramId"),
+    ],
+    "chats": [
+        # 채팅 기록 조회 (get_prompts) 및 (createdAt, _id) 커서 페이지 조회 (iter_prompts)
+        IndexModel(
+            [("projectId", ASCENDING), ("apiId", ASCENDING), ("createdAt", ASCENDING), ("_id", ASCENDING)],
+            name="projectId_apiId_createdAt_id",
+        ),
+    ],
+}
+
+
+# 생성하지 못하면 데이터 정합성을 보장할 수 없어 시작을 중단해야 하는 인덱스 (컬렉션, 인덱스 이름)
+REQUIRED_INDEXES = {
+    # 버전 고유성 (allocate_version의 카운터는 기존 최신 버전에서 시작하므로 중복 저장은 이 인덱스로만 막음)
+    ("diagrams", "projectId_apiId_version"),
+    ("diagrams", "diagramId_unique"),
+}
+
+
+class IndexCreationError(RuntimeError):
+    """필수 인덱스를 생성하지 못한 경우 발생하는 예외"""
+
+
+async def ensure_indexes(db) -> Dict[str, str]:
+    """
+    정의된 인덱스를 생성합니다. 이미 존재하는 인덱스는 MongoDB가 무시하므로 여러 번 호출해도 안전합니다.
+    create_indexes는 컬렉션 단위로 전부 실패하므로 인덱스마다 따로 생성하여, 기존 데이터와 충돌하는
+    인덱스가 있어도 나머지 인덱스는 생성합니다.
+
+    Args:
+        db: MongoDB 데이터베이스 객체
+
+    Returns:
+        Dict[str, str]: 생성하지 못한 인덱스("컬렉션.인덱스 이름")별 오류 메시지
+
+    Raises:
+        IndexCreationError: 필수 인덱스(REQUIRED_INDEXES)를 생성하지 못한 경우
+    """
+    failures: Dict[str, str] = {}
+    required_failures = []
+    for collection_name, indexes in INDEXES.items():
+        for index in indexes:
+            index_name = index.document["name"]
+            try:
+                await db[collection_name].create_indexes([index])
+            except OperationFailure as e:
+                failures[f"{collection_name}.{index_name}"] = str(e)
+                logger.error(f"MongoDB 인덱스 생성 실패: collection={collection_name}, index={index_name}, error={e}")
+                if (collection_name, index_name) in REQUIRED_INDEXES:
+                    required_failures.append(f"{collection_name}.{index_name}")
+        logger.info(f"MongoDB 인덱스 확인 완료: collection={collection_name}")
+
+    if required_failures:
+        # 기존 데이터를 정리하지 않으면 고유성이 보장되지 않으므로 시작을 중단
+        raise IndexCreationError(
+            f"필수 MongoDB 인덱스를 생성하지 못했습니다. 중복된 (projectId, apiId, metadata.version) 또는 "
+            f"diagramId 문서를 정리한 뒤 다시 시작하세요: {', '.join(required_failures)}"
+        )
+    return failures
@@ -1,6 +1,10 @@
 import logging
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Any
 
+from bson import ObjectId
+
+from app.config.config import settings
 from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
 from app.infrastructure.mongodb.repository.model.diagram_model import Chat
 from app.infrastructure.mongodb.repository.mongo_repository_impl import MongoRepositoryImpl
@@ -49,3 +53,59 @@ class ChatRepositoryImpl(MongoRepositoryImpl[Chat], ChatRepository):
         logger.info(f"{len(chats)}개의 채팅 기록을 조회했습니다")
 
         return chats
+
+    async def iter_prompts(
+            self,
+            project_id: str,
+            api_id: str,
+            after: Optional[Tuple[datetime, ObjectId]] = None,
+            limit: int = 0,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        특정 프로젝트와 API의 채팅 문서를 (createdAt, _id) 오름차순으로 커서에서 읽는 대로 반환합니다.
+        전체 목록을 메모리에 올리지 않고 CHAT_HISTORY_BATCH_SIZE 단위로 가져옵니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            after: 이 (createdAt, _id) 이후의 채팅만 조회 (없으면 처음부터)
+            limit: 최대 문서 수 (0이면 제한 없음)
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: 채팅 문서
+        """
+        filter_dict: Dict[str, Any] = {
+            "projectId": project_id,
+            "apiId": api_id
+        }
+        if after is not None:
+            created_at, chat_id = after
+            filter_dict["$or"] = [
+                {"createdAt": {"$gt": created_at}},
+                {"createdAt": created_at, "_id": {"$gt": chat_id}},
+            ]
+
+        collection = await self.get_collection()
+        cursor = collection.find(
+            filter_dict,
+            {"projectId": 0, "apiId": 0},
+        ).sort([("createdAt", 1), ("_id", 1)]).batch_size(settings.CHAT_HISTORY_BATCH_SIZE)
+        if limit > 0:
+            cursor = cursor.limit(limit)
+
+        async for document in cursor:
+            yield document
+
+    async def insert_documents(self, documents: List[Dict[str, Any]], session=None) -> None:
+        """
+        채팅 문서를 순서 없이(ordered=False) 한 번에 삽입합니다. 일부 문서가 실패해도 나머지는 저장됩니다.
+
+        Args:
+            documents: _id가 부여된 채팅 문서 목록
+            session: 트랜잭션에 참여할 MongoDB 세션 (없으면 단독 실행)
+
+        Raises:
+            BulkWriteError: 일부 문서를 저장하지 못한 경우
+        """
+        collection = await self.get_collection()
+        await collection.insert_many(documents, ordered=False, session=session)
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
+from app.infrastructure.mongodb.repository.model.diagram_model import Chat
+
+logger = logging.getLogger(__name__)
+
+# 이미 저장된 문서를 다시 삽입할 때 발생하는 오류 코드
+DUPLICATE_KEY_ERROR = 11000
+
+
+class ChatWriteBehind:
+    """
+    채팅 저장을 응답 경로에서 분리하는 write-behind 버퍼
+
+    enqueue된 Chat을 크기가 제한된 큐에 모았다가 batch_size개 또는 flush_interval마다
+    순서 없는(ordered=False) insert_many로 한 번에 저장합니다.
+    문서의 _id는 큐에 넣을 때 정해지므로, 일부만 저장된 배치를 재시도해도 같은 채팅이 두 번 저장되지 않습니다.
+    """
+
+    def __init__(
+            self,
+            chat_repository: ChatRepository,
+            max_size: int,
+            batch_size: int,
+            flush_interval: float,
+            max_retries: int,
+            retry_backoff: float,
+    ):
+        """
+        ChatWriteBehind 초기화
+
+        Args:
+            chat_repository: 채팅 저장소
+            max_size: 저장 대기 중인 채팅의 최대 수 (가득 차면 enqueue가 대기)
+            batch_size: 한 번에 저장할 최대 채팅 수
+            flush_interval: 첫 채팅이 들어온 뒤 배치를 저장하기까지 기다리는 최대 시간(초)
+            max_retries: 배치 저장 실패 시 재시도 횟수
+            retry_backoff: 첫 재시도 대기 시간(초), 재시도마다 두 배로 증가
+        """
+        self.chat_repository = chat_repository
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_size)
+        self._task: Optional[asyncio.Task] = None
+        # 모으는 중이거나 저장 중인 배치 (종료 시 작업이 취소되어도 저장하기 위해 보관)
+        self._batch: List[Dict[str, Any]] = []
+        self._written = 0
+        self._batches = 0
+        self._retries = 0
+        self._dropped = 0
+
+    def start(self) -> None:
+        """배치 저장 작업을 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def enqueue(self, chat: Chat) -> None:
+        """
+        채팅을 저장 대기열에 추가합니다. 대기열이 가득 차면 자리가 날 때까지 기다립니다.
+
+        Args:
+            chat: 저장할 채팅
+        """
+        self.start()
+        document = chat.model_dump()
+        # 재시도 시 같은 _id로 저장되도록 미리 부여
+        document["_id"] = ObjectId()
+        await self._queue.put(document)
+
+    async def stop(self) -> None:
+        """배치 저장 작업을 멈추고 대기 중인 채팅을 모두 저장합니다. 종료 시 호출합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # 취소된 배치는 일부가 이미 저장되었어도 같은 _id로 다시 저장하므로 중복되지 않음
+        batch, self._batch = self._batch, []
+        await self._write(batch)
+        while not self._queue.empty():
+            await self._write(self._drain(self.batch_size))
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        documents = []
+        while len(documents) < limit and not self._queue.empty():
+            documents.append(self._queue.get_nowait())
+        return documents
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            documents = self._batch = [await self._queue.get()]
+
+            # 첫 채팅 이후 flush_interval 동안 batch_size까지 모음
+            deadline = loop.time() + self.flush_interval
+            while len(documents) < self.batch_size:
+                documents.extend(self._drain(self.batch_size - len(documents)))
+                remaining = deadline - loop.time()
+                if len(documents) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    documents.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write(documents)
+            except Exception as e:
+                self._dropped += len(documents)
+                logger.error(f"채팅 일괄 저장 중 오류 발생: {len(documents)}개, error={e}", exc_info=True)
+            self._batch = []
+
+    async def _write(self, documents: List[Dict[str, Any]]) -> None:
+        """배치를 저장하고, 실패하면 저장되지 않은 문서만 재시도합니다."""
+        if not documents:
+            return
+
+        pending = documents
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.chat_repository.insert_documents(pending)
+                pending = []
+                break
+            except BulkWriteError as e:
+                # 이전 시도에서 이미 저장된 문서(중복 키)는 성공으로 처리
+                failed = {
+                    error["index"] for error in e.details.get("writeErrors", [])
+                    if error.get("code") != DUPLICATE_KEY_ERROR
+                }
+                pending = [pending[index] for index in sorted(failed)]
+                if not pending:
+                    break
+                logger.warning(f"채팅 일괄 저장 일부 실패: {len(pending)}개, 시도={attempt + 1}")
+            except PyMongoError as e:
+                logger.warning(f"채팅 일괄 저장 실패: {len(pending)}개, 시도={attempt + 1}, error={e}")
+
+            if attempt < self.max_retries:
+                self._retries += 1
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+        self._batches += 1
+        self._written += len(documents) - len(pending)
+        if pending:
+            self._dropped += len(pending)
+            logger.error(f"채팅 저장 재시도 초과로 {len(pending)}개를 저장하지 못했습니다: "
+                         f"chatIds={[document.get('chatId') for document in pending]}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        write-behind 지표를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 대기 중인 채팅 수, 저장된 채팅 수, 배치 수, 재시도 수, 저장하지 못한 채팅 수
+        """
+        return {
+            "pending": self._queue.qsize(),
+            "written": self._written,
+            "batches": self._batches,
+            "retries": self._retries,
+            "dropped": self._dropped,
+        }
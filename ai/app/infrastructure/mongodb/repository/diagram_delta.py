@@ -0,0 +1,144 @@
+"""
+다이어그램 버전 간 구조적 델타 계산 및 적용 모듈
+
+컴포넌트는 componentId, 메서드는 methodId, 커넥션은 connectionId, DTO는 dtoId를 키로 비교하여
+변경된 항목과 전체 순서만 저장합니다. 키가 없거나 중복된 목록은 목록 전체를 저장합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# 델타에 포함되는 목록 필드와 항목 키
+KEYED_FIELDS = {
+    "connections": "connectionId",
+    "dto": "dtoId",
+}
+
+
+def _has_unique_keys(items: List[Dict[str, Any]], key: str) -> bool:
+    keys = [item.get(key) for item in items]
+    return None not in keys and len(set(keys)) == len(keys)
+
+
+def _diff_keyed(base: Optional[List[Dict[str, Any]]], target: Optional[List[Dict[str, Any]]], key: str) -> Dict[str, Any]:
+    base = base or []
+    target = target or []
+    if not (_has_unique_keys(base, key) and _has_unique_keys(target, key)):
+        return {"items": target}
+
+    base_by_key = {item[key]: item for item in base}
+    return {
+        "order": [item[key] for item in target],
+        "set": [item for item in target if base_by_key.get(item[key]) != item],
+    }
+
+
+def _apply_keyed(base: Optional[List[Dict[str, Any]]], delta: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    if "items" in delta:
+        return delta["items"]
+
+    by_key = {item.get(key): item for item in base or []}
+    for item in delta["set"]:
+        by_key[item[key]] = item
+    return [by_key[item_key] for item_key in delta["order"]]
+
+
+def _diff_components(base: Optional[List[Dict[str, Any]]], target: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    base = base or []
+    target = target or []
+    if not (_has_unique_keys(base, "componentId") and _has_unique_keys(target, "componentId")):
+        return {"items": target}
+
+    base_by_id = {component["componentId"]: component for component in base}
+    changed = []
+    for component in target:
+        base_component = base_by_id.get(component["componentId"])
+        if base_component == component:
+            continue
+
+        # 컴포넌트 정보와 메서드 목록을 나누어 변경된 메서드만 저장
+        changed.append({
+            "component": {k: v for k, v in component.items() if k != "methods"},
+            "methods": _diff_keyed(
+                base_component.get("methods") if base_component else None,
+                component.get("methods"),
+                "methodId",
+            ),
+        })
+
+    return {
+        "order": [component["componentId"] for component in target],
+        "set": changed,
+    }
+
+
+def _apply_components(base: Optional[List[Dict[str, Any]]], delta: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if "items" in delta:
+        return delta["items"]
+
+    by_id = {component.get("componentId"): component for component in base or []}
+    for entry in delta["set"]:
+        component_id = entry["component"]["componentId"]
+        base_component = by_id.get(component_id)
+        by_id[component_id] = {
+            **entry["component"],
+            "methods": _apply_keyed(base_component.get("methods") if base_component else None,
+                                    entry["methods"], "methodId"),
+        }
+    return [by_id[component_id] for component_id in delta["order"]]
+
+
+def diff_diagram(base: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    base 다이어그램 문서를 target 다이어그램 문서로 바꾸는 델타를 계산합니다.
+
+    Args:
+        base: 기준 다이어그램 문서
+        target: 델타를 적용한 결과가 되어야 하는 다이어그램 문서
+
+    Returns:
+        Dict[str, Any]: 구조적 델타
+    """
+    delta = {"components": _diff_components(base.get("components"), target.get("components"))}
+    for field, key in KEYED_FIELDS.items():
+        delta[field] = _diff_keyed(base.get(field), target.get(field), key)
+    return delta
+
+
+def apply_diagram_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    base 다이어그램 문서에 델타를 적용한 새 문서를 반환합니다. base는 변경하지 않습니다.
+
+    Args:
+        base: 기준 다이어그램 문서
+        delta: diff_diagram으로 계산한 델타
+
+    Returns:
+        Dict[str, Any]: 델타가 적용된 다이어그램 문서 (목록 필드만 포함)
+    """
+    result = {"components": _apply_components(base.get("components"), delta["components"])}
+    for field, key in KEYED_FIELDS.items():
+        result[field] = _apply_keyed(base.get(field), delta[field], key)
+    return result
+
+
+def component_positions(document: Dict[str, Any]) -> Dict[str, List[float]]:
+    """
+    문서의 컴포넌트별 좌표를 반환합니다.
+    기준 버전의 좌표가 캔버스에서 변경되어도 이전 버전의 좌표가 유지되도록 델타와 함께 저장합니다.
+    """
+    return {
+        component["componentId"]: [component.get("positionX"), component.get("positionY")]
+        for component in document.get("components") or []
+        if component.get("componentId") is not None
+    }
+
+
+def apply_component_positions(components: List[Dict[str, Any]], positions: Dict[str, List[float]]) -> List[Dict[str, Any]]:
+    """저장된 컴포넌트 좌표를 적용한 새 컴포넌트 목록을 반환합니다."""
+    result = []
+    for component in components:
+        position = positions.get(component.get("componentId"))
+        if position is not None:
+            component = {**component, "positionX": position[0], "positionY": position[1]}
+        result.append(component)
+    return result
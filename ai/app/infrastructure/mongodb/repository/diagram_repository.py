@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+from bson.raw_bson import RawBSONDocument
 
 from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
 
@@ -21,6 +23,14 @@ class DiagramRepository(ABC):
     async def insert_one(self, diagram: Diagram) -> str:
         pass
 
+    @abstractmethod
+    async def exists(self, fileter_dict: Dict[str, Any]) -> bool:
+        pass
+
+    @abstractmethod
+    async def count_document(self, fileter_dict: Dict[str, Any]) -> int:
+        pass
+
     @abstractmethod
     async def find_by_project_api_version(self, project_id: str, api_id: str, version_id: int) -> Optional[Diagram]:
         """
@@ -36,6 +46,26 @@ class DiagramRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_raw_by_project_api_version(
+            self,
+            project_id: str,
+            api_id: str,
+            version: int,
+    ) -> Optional[RawBSONDocument]:
+        """
+        프로젝트 ID, API ID, 버전으로 다이어그램을 디코딩하지 않은 BSON 그대로 조회합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            version: 버전
+
+        Returns:
+            Optional[RawBSONDocument]: 조회된 다이어그램 문서 또는 None
+        """
+        pass
+
     @abstractmethod
     async def find_latest_by_project_api(self, project_id: str, api_id: str) -> Optional[Diagram]:
         """
@@ -50,6 +80,20 @@ class DiagramRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def latest_version(self, project_id: str, api_id: str) -> int:
+        """
+        프로젝트 ID와 API ID의 최신 다이어그램 버전을 조회합니다. 다이어그램 본문은 조회하지 않습니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+
+        Returns:
+            int: 최신 버전 (다이어그램이 없으면 0)
+        """
+        pass
+
     @abstractmethod
     async def save(self, diagram: Diagram) -> Diagram:
         """
@@ -64,20 +108,74 @@ class DiagramRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_component_position(self, project_id: str, api_id: str, component_id: str, x: float, y: float) -> \
-            Optional[Diagram]:
+    async def upsert(self, diagram: Diagram, session=None) -> bool:
+        """
+        diagramId를 기준으로 다이어그램을 한 번의 upsert로 저장합니다.
+        저장 후 처리는 on_saved에서 수행합니다.
+
+        Args:
+            diagram: 저장할 다이어그램 객체
+            session: 트랜잭션에 참여할 MongoDB 세션 (없으면 단독 실행)
+
+        Returns:
+            bool: 새로 삽입되었는지 여부
+        """
+        pass
+
+    @abstractmethod
+    async def on_saved(self, diagram: Diagram, inserted: bool) -> None:
+        """
+        다이어그램 저장(트랜잭션이면 커밋) 후 처리를 수행합니다.
+
+        Args:
+            diagram: 저장된 다이어그램 객체
+            inserted: 새로 삽입되었는지 여부
+        """
+        pass
+
+    @abstractmethod
+    async def delete_by_diagram_id(self, diagram_id: str) -> None:
+        """
+        diagramId로 다이어그램을 삭제합니다.
+
+        Args:
+            diagram_id: 다이어그램 ID
+        """
+        pass
+
+    @abstractmethod
+    async def update_component_positions(
+            self,
+            project_id: str,
+            api_id: str,
+            positions: Dict[str, Tuple[float, float]],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        최신 버전 다이어그램에서 여러 컴포넌트의 위치를 한 번에 업데이트합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            positions: 컴포넌트 ID별 새로운 (X, Y) 좌표
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 업데이트된 컴포넌트의 componentId, positionX, positionY 목록
+                (다이어그램이 없거나 찾을 수 없는 컴포넌트가 있으면 아무것도 저장하지 않고 None)
+        """
+        pass
+
+    @abstractmethod
+    async def allocate_version(self, project_id: str, api_id: str) -> int:
         """
-        특정 컴포넌트의 위치를 업데이트합니다.
+        프로젝트 ID와 API ID에 대한 다음 다이어그램 버전을 원자적으로 할당합니다.
+        동시에 호출되어도 서로 다른 버전이 반환됩니다.
 
         Args:
             project_id: 프로젝트 ID
             api_id: API ID
-            component_id: 컴포넌트 ID
-            x: 새로운 X 좌표
-            y: 새로운 Y 좌표
 
         Returns:
-            Optional[Diagram]: 업데이트된 다이어그램 또는 None
+            int: 새로 할당된 버전
         """
         pass
 
@@ -1,34 +1,81 @@
 import logging
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any
-
+from typing import Optional, Dict, Any, List, Tuple
+
+import bson
+from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+from pymongo import DeleteMany, ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from app.config.config import settings
+from app.infrastructure.cache.latest_diagram_cache import LatestDiagramCache
+from app.infrastructure.cache.response_cache import ResponseCache
+from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+from app.infrastructure.mongodb.repository.diagram_delta import diff_diagram, apply_diagram_delta, \
+    component_positions, apply_component_positions
 from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
 from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
 from app.infrastructure.mongodb.repository.mongo_repository_impl import MongoRepositoryImpl
 
+# 델타로 저장된 이전 버전 문서의 storageType 값과 델타 전용 필드
+DELTA_STORAGE_TYPE = "delta"
+DELTA_FIELDS = ("storageType", "baseVersion", "delta", "positions")
+
 
 class DiagramRepositoryImpl(DiagramRepository):
     """
     MongoDB를 사용한 다이어그램 저장소 구현
+
+    최신 버전은 항상 전체 문서로 저장되고, 새 버전이 생성되면 직전 버전은 다음 버전 기준의
+    역방향 델타로 교체됩니다. DIAGRAM_SNAPSHOT_INTERVAL 간격의 버전은 전체 문서로 유지되어
+    이전 버전을 복원할 때 적용하는 델타 수를 제한합니다.
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            latest_cache: Optional[LatestDiagramCache] = None,
+            response_cache: Optional[ResponseCache] = None,
+    ):
         """
         DiagramRepositoryImpl 초기화
+
+        Args:
+            latest_cache: 최신 다이어그램 캐시 (없으면 매번 MongoDB에서 조회)
+            response_cache: 다이어그램 버전별 채팅 응답 캐시 (새 버전이 저장되면 무효화)
         """
         self.repository = MongoRepositoryImpl("diagrams", Diagram)
+        self.counter_collection_name = "diagram_version_counters"
+        self.method_index_collection_name = "diagram_method_index"
         self.logger = logging.getLogger(__name__)
+        self.latest_cache = latest_cache
+        self.response_cache = response_cache
+        # 델타에서 복원한 버전 캐시 (save/upsert로 같은 버전을 덮어쓰면 on_saved에서 제거)
+        self._materialized: "OrderedDict[Tuple[str, str, int], Dict[str, Any]]" = OrderedDict()
 
     async def find_many(self, fileter_dict: Dict[str, Any], sort: Optional[list] = None) -> list:
-        return await self.repository.find_many(fileter_dict, sort)
+        collection = await self.repository.get_collection()
+        cursor = collection.find(fileter_dict)
+        if sort:
+            cursor = cursor.sort(sort)
+        return [await self._to_diagram(document) async for document in cursor]
 
     async def find_one(self, fileter_dict: Dict[str, Any]) -> Optional[Diagram]:
-        return await self.repository.find_one(fileter_dict)
+        collection = await self.repository.get_collection()
+        document = await collection.find_one(fileter_dict)
+        return await self._to_diagram(document) if document is not None else None
 
     async def insert_one(self, diagram: Diagram) -> str:
         return await self.repository.insert_one(diagram)
 
+    async def exists(self, fileter_dict: Dict[str, Any]) -> bool:
+        return await self.repository.exists(fileter_dict)
+
+    async def count_document(self, fileter_dict: Dict[str, Any]) -> int:
+        return await self.repository.count_document(fileter_dict)
+
     async def find_by_project_api_version(self, project_id: str, api_id: str, version: int) -> Optional[Diagram]:
         """
         프로젝트 ID, API ID, 버전 ID로 다이어그램을 조회합니다.
@@ -47,11 +94,43 @@ class DiagramRepositoryImpl(DiagramRepository):
             "metadata.version": version
         }
 
-        return await self.repository.find_one(filter_dict)
+        return await self.find_one(filter_dict)
+
+    async def find_raw_by_project_api_version(
+            self,
+            project_id: str,
+            api_id: str,
+            version: int,
+    ) -> Optional[RawBSONDocument]:
+        """
+        프로젝트 ID, API ID, 버전으로 다이어그램을 디코딩하지 않은 BSON 그대로 조회합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+            version: 버전
+
+        Returns:
+            Optional[RawBSONDocument]: 조회된 다이어그램 문서 또는 None
+        """
+        filter_dict = {
+            "projectId": project_id,
+            "apiId": api_id,
+            "metadata.version": version
+        }
+
+        # 응답에 포함되지 않는 _id는 제외
+        raw_document = await self.repository.find_one_raw(filter_dict, {"_id": 0})
+        if raw_document is None or raw_document.get("storageType") != DELTA_STORAGE_TYPE:
+            return raw_document
+
+        materialized = await self._materialize(bson.decode(raw_document.raw))
+        return RawBSONDocument(bson.encode(materialized))
 
     async def find_latest_by_project_api(self, project_id: str, api_id: str) -> Optional[Diagram]:
         """
         프로젝트 ID와 API ID로 최신 버전의 다이어그램을 조회합니다.
+        최신 다이어그램 캐시가 있으면 캐시를 먼저 확인합니다.
 
         Args:
             project_id: 프로젝트 ID
@@ -60,6 +139,14 @@ class DiagramRepositoryImpl(DiagramRepository):
         Returns:
             Optional[Diagram]: 최신 버전의 다이어그램 또는 None
         """
+        if self.latest_cache is None:
+            return await self._find_latest_by_project_api(project_id, api_id)
+
+        return await self.latest_cache.get_or_load(
+            project_id, api_id, lambda: self._find_latest_by_project_api(project_id, api_id)
+        )
+
+    async def _find_latest_by_project_api(self, project_id: str, api_id: str) -> Optional[Diagram]:
         filter_dict = {
             "projectId": project_id,
             "apiId": api_id
@@ -70,6 +157,25 @@ class DiagramRepositoryImpl(DiagramRepository):
 
         return await self.repository.find_one(filter_dict, sort)
 
+    async def latest_version(self, project_id: str, api_id: str) -> int:
+        """
+        프로젝트 ID와 API ID의 최신 다이어그램 버전을 조회합니다. 다이어그램 본문은 조회하지 않습니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+
+        Returns:
+            int: 최신 버전 (다이어그램이 없으면 0)
+        """
+        documents = await self.repository.find_projected(
+            {"projectId": project_id, "apiId": api_id},
+            {"_id": 0, "metadata.version": 1},
+            sort=[("metadata.version", -1)],
+            limit=1,
+        )
+        return documents[0]["metadata"]["version"] if documents else 0
+
     async def save(self, diagram: Diagram) -> Diagram:
         """
         다이어그램을 저장합니다. 기존 다이어그램이 있으면 업데이트하고, 없으면 새로 생성합니다.
@@ -80,124 +186,412 @@ class DiagramRepositoryImpl(DiagramRepository):
         Returns:
             Diagram: 저장된 다이어그램 객체
         """
-        # diagramId가 이미 존재하는지 확인
-        existing_diagram = None
-        if diagram.diagramId:
-            existing_diagram = await self.repository.find_one({"diagramId": diagram.diagramId})
+        inserted = await self.upsert(diagram)
+        await self.on_saved(diagram, inserted)
+        return diagram
 
-        if existing_diagram:
-            # 기존 다이어그램이 있으면 업데이트
-            filter_dict = {"diagramId": diagram.diagramId}
-            update_dict = diagram.model_dump()
+    async def upsert(self, diagram: Diagram, session=None) -> bool:
+        """
+        diagramId를 기준으로 다이어그램을 한 번의 upsert로 저장합니다. 존재 여부를 먼저 조회하지 않습니다.
+        저장 후 처리(캐시 무효화, 색인, 이전 버전 델타 저장)는 on_saved에서 수행합니다.
 
-            # _id 필드 제거 (MongoDB가 관리)
-            if "_id" in update_dict:
-                del update_dict["_id"]
+        Args:
+            diagram: 저장할 다이어그램 객체
+            session: 트랜잭션에 참여할 MongoDB 세션 (없으면 단독 실행)
 
-            self.logger.info(f"다이어그램 업데이트 중: diagramId={diagram.diagramId}, 필터={filter_dict}")
-            await self.repository.update_one(filter_dict, {"$set": update_dict})
-            self.logger.info(f"다이어그램이 성공적으로 업데이트되었습니다: diagramId={diagram.diagramId}")
-            return diagram
+        Returns:
+            bool: 새로 삽입되었는지 여부
+        """
+        update_dict = diagram.model_dump()
+
+        # _id 필드 제거 (MongoDB가 관리)
+        if "_id" in update_dict:
+            del update_dict["_id"]
+
+        collection = await self.repository.get_collection()
+        # 델타로 저장된 이전 버전을 수정하는 경우 전체 문서로 되돌림
+        result = await collection.update_one(
+            {"diagramId": diagram.diagramId},
+            {"$set": update_dict, "$unset": {field: "" for field in DELTA_FIELDS}},
+            upsert=True,
+            session=session,
+        )
+        inserted = result.upserted_id is not None
+        self.logger.info(f"다이어그램이 성공적으로 {'삽입' if inserted else '업데이트'}되었습니다: diagramId={diagram.diagramId}")
+        return inserted
+
+    async def on_saved(self, diagram: Diagram, inserted: bool) -> None:
+        """
+        다이어그램 저장(트랜잭션이면 커밋) 후 최신 다이어그램/응답 캐시를 무효화하고 methodId 색인을 갱신합니다.
+        새로 삽입된 버전이면 직전 버전을 델타로 저장합니다.
 
-        self.logger.info(f"새 다이어그램 삽입 중: diagramId={diagram.diagramId}")
-        await self.repository.insert_one(diagram)
-        self.logger.info(f"다이어그램이 성공적으로 삽입되었습니다: diagramId={diagram.diagramId}")
-        return diagram
+        Args:
+            diagram: 저장된 다이어그램 객체
+            inserted: 새로 삽입되었는지 여부
+        """
+        await self._invalidate_latest(diagram.projectId, diagram.apiId)
+        self._invalidate_responses(diagram.projectId, diagram.apiId)
+        # 델타로 저장된 이전 버전을 덮어쓴 경우 복원해 둔 문서는 더 이상 유효하지 않음
+        self._materialized.pop((diagram.projectId, diagram.apiId, diagram.metadata.version), None)
+        await self._index_methods(diagram, remove_stale=not inserted)
+        if inserted:
+            await self._compact_previous(diagram)
+
+    async def delete_by_diagram_id(self, diagram_id: str) -> None:
+        """
+        diagramId로 다이어그램을 삭제합니다. 함께 저장하려던 문서가 실패했을 때 되돌리기 위해 사용합니다.
 
-    async def update_component_position(self, project_id: str, api_id: str, component_id: str, x: float, y: float) -> \
-            Optional[Diagram]:
+        Args:
+            diagram_id: 다이어그램 ID
+        """
+        collection = await self.repository.get_collection()
+        await collection.delete_one({"diagramId": diagram_id})
+
+    async def update_component_positions(
+            self,
+            project_id: str,
+            api_id: str,
+            positions: Dict[str, Tuple[float, float]],
+    ) -> Optional[List[Dict[str, Any]]]:
         """
-        특정 컴포넌트의 위치를 업데이트합니다.
+        최신 버전 다이어그램에서 여러 컴포넌트의 위치를 한 번에 업데이트합니다.
+        문서 전체를 읽고 다시 쓰는 대신 파이프라인 업데이트로 지정한 컴포넌트의 좌표만 변경하며,
+        최신 버전 선택과 저장을 find_one_and_update 한 번으로 처리합니다.
+        모든 componentId가 최신 버전에 있을 때만 좌표를 변경하므로 일부만 저장되는 경우가 없습니다.
 
         Args:
             project_id: 프로젝트 ID
             api_id: API ID
-            component_id: 컴포넌트 ID
-            x: 새로운 X 좌표
-            y: 새로운 Y 좌표
+            positions: 컴포넌트 ID별 새로운 (X, Y) 좌표
 
         Returns:
-            Optional[Diagram]: 업데이트된 다이어그램 또는 None
+            Optional[List[Dict[str, Any]]]: 업데이트된 컴포넌트의 componentId, positionX, positionY 목록
+                (다이어그램이 없거나 찾을 수 없는 컴포넌트가 있으면 아무것도 저장하지 않고 None)
         """
-        # 최신 다이어그램 조회
-        diagram = await self.find_latest_by_project_api(project_id, api_id)
-        if not diagram:
-            return None
+        component_ids = [{"$literal": component_id} for component_id in positions]
+        # 하나라도 없는 컴포넌트가 있으면 문서를 그대로 둠
+        all_exist = {"$setIsSubset": [component_ids, "$components.componentId"]}
+        moved_components = {
+            "$map": {
+                "input": "$components",
+                "as": "component",
+                "in": {
+                    "$switch": {
+                        "branches": [
+                            {
+                                "case": {"$eq": ["$$component.componentId", {"$literal": component_id}]},
+                                "then": {"$mergeObjects": ["$$component", {"positionX": x, "positionY": y}]},
+                            }
+                            for component_id, (x, y) in positions.items()
+                        ],
+                        "default": "$$component",
+                    }
+                },
+            }
+        }
 
-        # 해당 컴포넌트 찾기
-        component_found = False
-        for component in diagram.components:
-            if component.componentId == component_id:
-                component.positionX = x
-                component.positionY = y
-                component_found = True
-                break
+        collection = await self.repository.get_collection()
+        document = await collection.find_one_and_update(
+            {"projectId": project_id, "apiId": api_id},
+            [{"$set": {
+                "components": {"$cond": [all_exist, moved_components, "$components"]},
+                "metadata.lastModified": {"$cond": [all_exist, datetime.utcnow(), "$metadata.lastModified"]},
+            }}],
+            # 이전 스냅샷 버전이 선택되지 않도록 최신 버전에 적용
+            sort=[("metadata.version", -1)],
+            # 캔버스에 필요한 컴포넌트 좌표만 반환
+            projection={
+                "_id": 0,
+                "components.componentId": 1,
+                "components.positionX": 1,
+                "components.positionY": 1,
+            },
+            return_document=ReturnDocument.AFTER,
+        )
+        if document is None:
+            return None
 
-        if not component_found:
+        updated = [
+            component for component in document.get("components", [])
+            if component.get("componentId") in positions
+        ]
+        if len({component["componentId"] for component in updated}) < len(positions):
+            self.logger.warning(f"위치를 업데이트할 컴포넌트를 찾을 수 없습니다: "
+                                f"projectId={project_id}, apiId={api_id}, componentIds={list(positions)}")
             return None
+        await self._invalidate_latest(project_id, api_id)
 
-        # 최종 수정 시간 업데이트
-        diagram.metadata.lastModified = datetime.utcnow()
+        return updated
 
-        # 업데이트된 다이어그램 저장
-        await self.save(diagram)
-        return diagram
+    async def allocate_version(self, project_id: str, api_id: str) -> int:
+        """
+        프로젝트 ID와 API ID에 대한 다음 다이어그램 버전을 원자적으로 할당합니다.
+        (projectId, apiId)별 카운터 문서를 find_one_and_update로 증가시키므로 한 번의 왕복으로 처리되며,
+        동시에 호출되어도 서로 다른 버전이 반환됩니다. 카운터가 기존 데이터와 어긋나더라도 중복 버전 저장은
+        필수 인덱스인 (projectId, apiId, metadata.version) 고유 인덱스가 거부합니다.
+
+        Args:
+            project_id: 프로젝트 ID
+            api_id: API ID
+
+        Returns:
+            int: 새로 할당된 버전
+        """
+        db = await MongoDBConnection.connect()
+        counters = db[self.counter_collection_name]
+        counter_id = f"{project_id}:{api_id}"
+
+        counter = await counters.find_one_and_update(
+            {"_id": counter_id},
+            {"$inc": {"version": 1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if counter is not None:
+            return counter["version"]
+
+        # 카운터가 없으면 이미 저장된 최신 버전으로 초기화 (카운터 도입 이전 데이터)
+        try:
+            await counters.insert_one({
+                "_id": counter_id,
+                "projectId": project_id,
+                "apiId": api_id,
+                "version": await self.latest_version(project_id, api_id),
+            })
+        except DuplicateKeyError:
+            # 다른 요청이 먼저 초기화한 경우
+            pass
+
+        counter = await counters.find_one_and_update(
+            {"_id": counter_id},
+            {"$inc": {"version": 1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["version"]
 
     async def create_new_version(self, diagram: Diagram) -> Diagram:
         """
         기존 다이어그램을 기반으로 새 버전의 다이어그램을 생성합니다.
-        프로젝트 ID와 API ID를 기준으로 가장 높은 버전 값에 1을 더한 버전으로 생성됩니다.
+        프로젝트 ID와 API ID의 버전 카운터에서 할당받은 버전으로 생성됩니다.
 
         Args:
             diagram: 기존 다이어그램 객체
         Returns:
             Diagram: 새 버전으로 생성된 다이어그램 객체
         """
-        # 프로젝트 ID와 API ID로 모든 다이어그램 조회 (버전 내림차순)
-        filter_dict = {
-            "projectId": diagram.projectId,
-            "apiId": diagram.apiId
-        }
-        sort = [("metadata.version", -1)]
-
-        # 가장 최신 버전의 다이어그램 조회
-        latest_diagram = await self.repository.find_one(filter_dict, sort)
-
-        # 새 버전 번호 계산 (현재 최신 버전 + 1)
-        new_version = latest_diagram.metadata.version + 1 if latest_diagram else 1
+        new_version = await self.allocate_version(diagram.projectId, diagram.apiId)
 
         # 새 다이어그램 생성 (기존 다이어그램 복제)
         new_diagram = Diagram(**diagram.model_dump())
 
         # 메타데이터 업데이트
-        self.logger.info(f"버전 업데이트: {latest_diagram.metadata.version} -> {new_version}")
+        self.logger.info(f"버전 업데이트: {diagram.metadata.version} -> {new_version}")
 
+        # 버전마다 별도 문서로 저장되므로 diagramId도 새로 부여 (diagramId 고유 인덱스)
+        new_diagram.diagramId = str(uuid.uuid4())
         new_diagram.metadata.metadataId = str(uuid.uuid4())
         new_diagram.metadata.version = new_version
         new_diagram.metadata.lastModified = datetime.utcnow()
 
         # 새 다이어그램 저장
         await self.repository.insert_one(new_diagram)
+        await self._invalidate_latest(new_diagram.projectId, new_diagram.apiId)
+        self._invalidate_responses(new_diagram.projectId, new_diagram.apiId)
+        await self._index_methods(new_diagram, remove_stale=False)
+        await self._compact_previous(new_diagram)
         return new_diagram
 
+    async def _invalidate_latest(self, project_id: str, api_id: str) -> None:
+        """최신 다이어그램 캐시를 무효화합니다."""
+        if self.latest_cache is not None:
+            await self.latest_cache.invalidate(project_id, api_id)
+
+    def _invalidate_responses(self, project_id: str, api_id: str) -> None:
+        """이전 버전 기준으로 캐시된 채팅 응답을 제거합니다."""
+        if self.response_cache is not None:
+            removed = self.response_cache.invalidate(project_id, api_id)
+            if removed:
+                self.logger.info(f"채팅 응답 캐시 무효화: projectId={project_id}, apiId={api_id}, {removed}개")
+
+    async def _compact_previous(self, diagram: Diagram) -> None:
+        """
+        새로 저장된 다이어그램 직전의 전체 문서 버전을 새 버전 기준의 역방향 델타로 교체합니다.
+        스냅샷 버전((version - 1) % DIAGRAM_SNAPSHOT_INTERVAL == 0)은 전체 문서로 유지하며,
+        교체에 실패하면 이전 버전은 전체 문서로 남습니다.
+
+        Args:
+            diagram: 새로 저장된 최신 버전 다이어그램
+        """
+        interval = settings.DIAGRAM_SNAPSHOT_INTERVAL
+        if interval <= 1:
+            return
+
+        version = diagram.metadata.version
+        try:
+            collection = await self.repository.get_collection()
+            previous = await collection.find_one(
+                {
+                    "projectId": diagram.projectId,
+                    "apiId": diagram.apiId,
+                    "metadata.version": {"$lt": version},
+                    "storageType": {"$ne": DELTA_STORAGE_TYPE},
+                },
+                sort=[("metadata.version", -1)],
+            )
+            if previous is None:
+                return
+
+            previous_version = previous["metadata"]["version"]
+            if (previous_version - 1) % interval == 0:
+                return
+
+            delta_document = {
+                "projectId": previous.get("projectId"),
+                "apiId": previous.get("apiId"),
+                "diagramId": previous["diagramId"],
+                "metadata": previous["metadata"],
+                "storageType": DELTA_STORAGE_TYPE,
+                "baseVersion": version,
+                "delta": diff_diagram(diagram.model_dump(), previous),
+                # 최신 버전의 좌표가 캔버스에서 변경되어도 이전 버전의 좌표는 유지
+                "positions": component_positions(previous),
+            }
+            # 다른 요청이 먼저 교체했거나 수정한 경우에는 교체하지 않음
+            await collection.replace_one(
+                {"_id": previous["_id"], "storageType": {"$ne": DELTA_STORAGE_TYPE}},
+                delta_document,
+            )
+            self.logger.info(f"이전 버전을 델타로 저장했습니다: version={previous_version}, baseVersion={version}")
+        except PyMongoError as e:
+            self.logger.error(f"이전 버전 델타 저장 실패: diagramId={diagram.diagramId}, error={e}")
+
+    async def _to_diagram(self, document: Dict[str, Any]) -> Diagram:
+        """조회한 문서를 Diagram으로 변환합니다. 델타로 저장된 버전은 전체 문서로 복원합니다."""
+        if document.get("storageType") == DELTA_STORAGE_TYPE:
+            document = {**await self._materialize(document), "_id": document["_id"]}
+
+        # _id를 문자열로 변환
+        if isinstance(document.get("_id"), ObjectId):
+            document["_id"] = str(document["_id"])
+
+        return Diagram(**document)
+
+    async def _materialize(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        델타로 저장된 버전 문서를 전체 다이어그램 문서로 복원합니다.
+        baseVersion을 따라 가장 가까운 전체 문서(또는 캐시된 복원 버전)까지 올라간 뒤,
+        역순으로 델타와 좌표를 적용합니다. 필요한 상위 버전은 커서 하나로 오름차순 조회합니다.
+
+        Args:
+            document: storageType이 delta인 다이어그램 문서
+
+        Returns:
+            Dict[str, Any]: 복원된 다이어그램 문서 (_id 제외)
+        """
+        project_id = document.get("projectId")
+        api_id = document.get("apiId")
+        cached = self._get_materialized(project_id, api_id, document["metadata"]["version"])
+        if cached is not None:
+            return cached
+
+        collection = await self.repository.get_collection()
+        cursor = collection.find(
+            {"projectId": project_id, "apiId": api_id, "metadata.version": {"$gt": document["metadata"]["version"]}},
+            {"_id": 0},
+        ).sort("metadata.version", 1)
+        loaded: Dict[int, Dict[str, Any]] = {}
+
+        async def _load(target_version: int) -> Optional[Dict[str, Any]]:
+            if target_version not in loaded:
+                async for loaded_document in cursor:
+                    loaded[loaded_document["metadata"]["version"]] = loaded_document
+                    if loaded_document["metadata"]["version"] >= target_version:
+                        break
+            return loaded.get(target_version)
+
+        # 복원에 필요한 델타 문서를 기준 문서 방향으로 수집
+        pending = [document]
+        while True:
+            base_version = pending[-1]["baseVersion"]
+            base = self._get_materialized(project_id, api_id, base_version)
+            if base is not None:
+                break
+
+            base = await _load(base_version)
+            if base is None:
+                raise ValueError(f"델타의 기준 버전을 찾을 수 없습니다: projectId={project_id}, apiId={api_id}, "
+                                 f"version={pending[-1]['metadata']['version']}, baseVersion={base_version}")
+            if base.get("storageType") != DELTA_STORAGE_TYPE:
+                break
+            pending.append(base)
+
+        for delta_document in reversed(pending):
+            materialized = {
+                key: value for key, value in delta_document.items()
+                if key not in DELTA_FIELDS and key != "_id"
+            }
+            materialized.update(apply_diagram_delta(base, delta_document["delta"]))
+            materialized["components"] = apply_component_positions(
+                materialized["components"], delta_document.get("positions") or {}
+            )
+            self._put_materialized(materialized)
+            base = materialized
+
+        return base
+
+    def _get_materialized(self, project_id: str, api_id: str, version: int) -> Optional[Dict[str, Any]]:
+        key = (project_id, api_id, version)
+        materialized = self._materialized.get(key)
+        if materialized is not None:
+            self._materialized.move_to_end(key)
+        return materialized
+
+    def _put_materialized(self, materialized: Dict[str, Any]) -> None:
+        if settings.DIAGRAM_MATERIALIZED_CACHE_SIZE <= 0:
+            return
+
+        key = (materialized.get("projectId"), materialized.get("apiId"), materialized["metadata"]["version"])
+        self._materialized[key] = materialized
+        self._materialized.move_to_end(key)
+        while len(self._materialized) > settings.DIAGRAM_MATERIALIZED_CACHE_SIZE:
+            self._materialized.popitem(last=False)
+
     async def find_diagram_by_method_id(self, project_id: str, api_id: str, method_id: str) -> Optional[Diagram]:
         """
-        프로젝트 ID, API ID, 메서드 ID로 다이어그램을 조회합니다.
-        MongoDB의 $elemMatch 쿼리 연산자를 사용하여 components 배열 내에서 
-        methods 배열 내의 methodId 필드가 주어진 method_id와 일치하는 문서를 찾습니다.
-        
+        프로젝트 ID, API ID, 메서드 ID로 해당 메서드를 포함하는 가장 최신 버전의 다이어그램을 조회합니다.
+        최신 다이어그램(캐시)에 메서드가 있으면 바로 반환하고, 없으면 methodId 색인에서 버전을 찾습니다.
+        색인이 없는 이전 데이터는 전체 문서 버전의 components 배열을 $elemMatch로 검색하고,
+        최신 버전과 첫 스냅샷 사이의 델타 버전(최대 DIAGRAM_SNAPSHOT_INTERVAL - 1개)은 복원하여 확인한 뒤 색인을 채웁니다.
+
         Args:
             project_id: 프로젝트 ID
             api_id: API ID
             method_id: 메서드 ID
-            
+
         Returns:
             Optional[Diagram]: 해당 메서드 ID를 포함하는 다이어그램 또는 None
         """
+        latest_diagram = await self.find_latest_by_project_api(project_id, api_id)
+        if latest_diagram is not None and latest_diagram.find_method(method_id) is not None:
+            return latest_diagram
+
+        db = await MongoDBConnection.connect()
+        entry = await db[self.method_index_collection_name].find_one(
+            {"projectId": project_id, "apiId": api_id, "methodId": method_id},
+            {"_id": 0, "version": 1},
+            sort=[("version", -1)],
+        )
+        if entry is not None:
+            diagram = await self.find_by_project_api_version(project_id, api_id, entry["version"])
+            if diagram is not None and diagram.find_method(method_id) is not None:
+                self.logger.info(f"다이어그램 발견: {diagram.diagramId}")
+                return diagram
+
         # MongoDB 쿼리 작성 - components 배열 내의 메서드들 중 methodId가 일치하는 요소 검색
+        # (델타 문서에는 components 배열이 없으므로 전체 문서 버전만 검색)
         filter_dict = {
             "projectId": project_id,
             "apiId": api_id,
+            "storageType": {"$ne": DELTA_STORAGE_TYPE},
             "components": {
                 "$elemMatch": {
                     "methods": {
@@ -210,13 +604,70 @@ class DiagramRepositoryImpl(DiagramRepository):
         }
 
         # 버전 번호를 기준으로 내림차순 정렬하여 최신 버전을 먼저 찾음
-        diagram: Diagram = await self.repository.find_one(filter_dict)
+        diagram: Optional[Diagram] = await self.repository.find_one(filter_dict, [("metadata.version", -1)])
+
+        # 찾은 버전보다 새로운 델타 버전에 메서드가 있으면 그 버전을 사용
+        # 최신 버전(이미 확인)부터 첫 스냅샷 전까지만 확인하고, 더 오래된 델타 버전은 저장 시 채워지는 색인으로 찾음
+        versions = await self.repository.find_projected(
+            {
+                "projectId": project_id,
+                "apiId": api_id,
+                "metadata.version": {"$gt": diagram.metadata.version if diagram is not None else 0},
+            },
+            {"_id": 0, "metadata.version": 1, "storageType": 1},
+            sort=[("metadata.version", -1)],
+            limit=settings.DIAGRAM_SNAPSHOT_INTERVAL,
+        )
+        for entry in versions[1:]:
+            if entry.get("storageType") != DELTA_STORAGE_TYPE:
+                break
+            delta_diagram = await self.find_by_project_api_version(project_id, api_id, entry["metadata"]["version"])
+            if delta_diagram is not None and delta_diagram.find_method(method_id) is not None:
+                diagram = delta_diagram
+                break
 
         # 만약 diagram이 None이라면 예외 발생
         if diagram is None:
             raise ValueError(f"다이어그램을 찾을 수 없습니다: projectId={project_id}, apiId={api_id}, methodId={method_id}")
 
         self.logger.info(f"다이어그램 발견: {diagram.diagramId}")
+        await self._index_methods(diagram)
 
         # 쿼리 실행 및 결과 반환
         return diagram
+
+    async def _index_methods(self, diagram: Diagram, remove_stale: bool = True) -> None:
+        """
+        다이어그램의 methodId별 위치를 methodId 색인 컬렉션에 저장합니다.
+        (diagramId, methodId)별 upsert와 더 이상 없는 메서드 항목 삭제를 한 번의 bulk_write로 처리하므로
+        기존 항목이 사라지는 구간이 없으며, 실패하면 조회 시 $elemMatch 검색으로 대체됩니다.
+
+        Args:
+            diagram: 색인할 다이어그램
+            remove_stale: 같은 diagramId의 이전 항목 중 없는 메서드를 삭제할지 여부 (새로 삽입된 diagramId면 False)
+        """
+        locations = diagram.method_locations()
+        operations = [
+            UpdateOne(
+                {"diagramId": diagram.diagramId, "methodId": method_id},
+                {"$set": {
+                    "projectId": diagram.projectId,
+                    "apiId": diagram.apiId,
+                    "version": diagram.metadata.version,
+                    "componentIndex": component_index,
+                    "methodIndex": method_index,
+                }},
+                upsert=True,
+            )
+            for method_id, (component_index, method_index) in locations.items()
+        ]
+        if remove_stale:
+            operations.append(DeleteMany({"diagramId": diagram.diagramId, "methodId": {"$nin": list(locations)}}))
+        if not operations:
+            return
+
+        try:
+            db = await MongoDBConnection.connect()
+            await db[self.method_index_collection_name].bulk_write(operations, ordered=False)
+        except PyMongoError as e:
+            self.logger.error(f"methodId 색인 저장 실패: diagramId={diagram.diagramId}, error={e}")
@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 
 # 열거형(Enum) 정의
@@ -226,6 +226,9 @@ class Diagram(BaseModel):
     dto: Optional[List[DtoModel]] = []
     metadata: Metadata
 
+    # methodId별 (컴포넌트 인덱스, 메서드 인덱스), method_locations를 처음 호출할 때 계산
+    _method_locations: Optional[Dict[str, Tuple[int, int]]] = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
@@ -234,6 +237,35 @@ class Diagram(BaseModel):
         }
     )
 
+    def method_locations(self) -> Dict[str, Tuple[int, int]]:
+        """
+        methodId별 (컴포넌트 인덱스, 메서드 인덱스)를 반환합니다.
+        같은 methodId가 여러 번 나오면 첫 번째 위치를 사용합니다.
+        """
+        if self._method_locations is None:
+            locations: Dict[str, Tuple[int, int]] = {}
+            for component_index, component in enumerate(self.components or []):
+                for method_index, method in enumerate(component.methods or []):
+                    locations.setdefault(method.methodId, (component_index, method_index))
+            self._method_locations = locations
+        return self._method_locations
+
+    def find_method(self, method_id: str) -> Optional[Method]:
+        """
+        methodId로 메서드를 조회합니다.
+
+        Args:
+            method_id: 메서드 ID
+
+        Returns:
+            Optional[Method]: 메서드 또는 None
+        """
+        location = self.method_locations().get(method_id)
+        if location is None:
+            return None
+        component_index, method_index = location
+        return self.components[component_index].methods[method_index]
+
     def validate_diagram_ids(self) -> bool:
         """다이어그램 내 ID 중복을 검사하는 메서드"""
         # 컴포넌트 ID 검사
@@ -1,6 +1,8 @@
 from typing import Dict, List, Any, Optional, Type
 
 from bson import ObjectId
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from pymongo.collection import Collection
 
 from app.infrastructure.mongodb.connection.connection import MongoDBConnection
@@ -91,6 +93,92 @@ class MongoRepositoryImpl(MongoRepository[T]):
 
         return result
 
+    async def find_one_raw(
+            self,
+            filter_dict: Dict[str, Any],
+            projection: Optional[Dict[str, Any]] = None,
+            sort: List[tuple] = None,
+    ) -> Optional[RawBSONDocument]:
+        """
+        조건에 맞는 단일 문서를 디코딩하지 않은 BSON 그대로 조회합니다.
+        모델 변환 없이 응답으로 직렬화하는 읽기 경로에서 사용합니다.
+
+        Args:
+            filter_dict: 조회 필터 딕셔너리
+            projection: 조회할 필드 (None이면 전체)
+            sort: 정렬 조건 (예: [("field", 1)]) 1은 오름차순, -1은 내림차순
+
+        Returns:
+            조회된 RawBSONDocument 또는 없을 경우 None
+        """
+        collection = await self.get_collection()
+        raw_collection = collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+
+        cursor = raw_collection.find(filter_dict, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+
+        documents = await cursor.to_list(length=1)
+        return documents[0] if documents else None
+
+    async def find_projected(
+            self,
+            filter_dict: Dict[str, Any],
+            projection: Dict[str, Any],
+            sort: List[tuple] = None,
+            limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        조건에 맞는 문서의 지정한 필드만 조회합니다. 모델로 변환하지 않고 딕셔너리를 그대로 반환합니다.
+
+        Args:
+            filter_dict: 조회 필터 딕셔너리
+            projection: 조회할 필드 (예: {"metadata.version": 1, "_id": 0})
+            sort: 정렬 조건 (예: [("field", 1)]) 1은 오름차순, -1은 내림차순
+            limit: 최대 조회 개수 (0이면 제한 없음)
+
+        Returns:
+            조회된 문서 딕셔너리 리스트
+        """
+        collection = await self.get_collection()
+
+        cursor = collection.find(filter_dict, projection)
+        if sort:
+            cursor = cursor.sort(sort)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        return await cursor.to_list(length=limit or None)
+
+    async def exists(self, filter_dict: Dict[str, Any]) -> bool:
+        """
+        조건에 맞는 문서가 존재하는지 확인합니다.
+
+        Args:
+            filter_dict: 조회 필터 딕셔너리
+
+        Returns:
+            문서 존재 여부
+        """
+        collection = await self.get_collection()
+
+        # _id만 조회하여 문서 본문 전송 없이 확인
+        document = await collection.find_one(filter_dict, {"_id": 1})
+        return document is not None
+
+    async def count_document(self, filter_dict: Dict[str, Any]) -> int:
+        """
+        조건에 맞는 문서 수를 조회합니다.
+
+        Args:
+            filter_dict: 조회 필터 딕셔너리
+
+        Returns:
+            문서 수
+        """
+        collection = await self.get_collection()
+        return await collection.count_documents(filter_dict)
+
     async def insert_one(self, document: T) -> str:
         """
         단일 문서를 삽입합니다.
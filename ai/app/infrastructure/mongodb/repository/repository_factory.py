@@ -0,0 +1,103 @@
+from typing import Optional
+
+from app.infrastructure.cache.latest_diagram_cache import LatestDiagramCache
+from app.infrastructure.cache.response_cache import ResponseCache
+from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
+from app.infrastructure.mongodb.repository.chat_write_behind import ChatWriteBehind
+from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
+
+
+class RepositoryFactory:
+    """
+    저장소 인스턴스를 프로세스 전체에서 공유하는 팩토리
+
+    저장소는 상태 없이 공유 MongoDB 클라이언트의 컬렉션만 참조하므로,
+    요청마다 새로 만들지 않고 하나의 인스턴스를 재사용합니다.
+    """
+
+    _diagram_repository: Optional[DiagramRepository] = None
+    _chat_repository: Optional[ChatRepository] = None
+    _latest_diagram_cache: Optional[LatestDiagramCache] = None
+    _response_cache: Optional[ResponseCache] = None
+    _chat_writer: Optional[ChatWriteBehind] = None
+
+    @classmethod
+    def get_latest_diagram_cache(cls) -> Optional[LatestDiagramCache]:
+        """공유 최신 다이어그램 캐시 반환 (DIAGRAM_CACHE_SIZE가 0이면 None)"""
+        from app.config.config import settings
+
+        if settings.DIAGRAM_CACHE_SIZE <= 0:
+            return None
+        if cls._latest_diagram_cache is None:
+            cls._latest_diagram_cache = LatestDiagramCache.create(
+                max_size=settings.DIAGRAM_CACHE_SIZE,
+                ttl_seconds=settings.DIAGRAM_CACHE_TTL_SECONDS,
+                shared_tier=settings.DIAGRAM_CACHE_SHARED_TIER,
+                collection_name=settings.DIAGRAM_CACHE_MONGO_COLLECTION,
+                generation_ttl_seconds=settings.DIAGRAM_CACHE_SHARED_GENERATION_TTL_SECONDS,
+            )
+        return cls._latest_diagram_cache
+
+    @classmethod
+    def get_response_cache(cls) -> Optional[ResponseCache]:
+        """공유 채팅 응답 캐시 반환 (RESPONSE_CACHE_SIZE가 0이면 None)"""
+        from app.config.config import settings
+
+        if settings.RESPONSE_CACHE_SIZE <= 0:
+            return None
+        if cls._response_cache is None:
+            cls._response_cache = ResponseCache.create(
+                max_size=settings.RESPONSE_CACHE_SIZE,
+                ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+                embedding_model=settings.RESPONSE_CACHE_EMBEDDING_MODEL,
+                similarity_threshold=settings.RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+                api_key=settings.OPENAI_API_KEY,
+                base_url=settings.OPENAI_API_BASE,
+            )
+        return cls._response_cache
+
+    @classmethod
+    def get_diagram_repository(cls) -> DiagramRepository:
+        """공유 DiagramRepository 반환"""
+        if cls._diagram_repository is None:
+            from app.infrastructure.mongodb.repository.diagram_repository_impl import DiagramRepositoryImpl
+            cls._diagram_repository = DiagramRepositoryImpl(
+                latest_cache=cls.get_latest_diagram_cache(),
+                response_cache=cls.get_response_cache(),
+            )
+        return cls._diagram_repository
+
+    @classmethod
+    def get_chat_repository(cls) -> ChatRepository:
+        """공유 ChatRepository 반환"""
+        if cls._chat_repository is None:
+            from app.infrastructure.mongodb.repository.chat_repository_impl import ChatRepositoryImpl
+            cls._chat_repository = ChatRepositoryImpl()
+        return cls._chat_repository
+
+    @classmethod
+    def get_chat_writer(cls) -> Optional[ChatWriteBehind]:
+        """공유 채팅 write-behind 버퍼 반환 (CHAT_WRITE_BEHIND_ENABLED가 false이면 None)"""
+        from app.config.config import settings
+
+        if not settings.CHAT_WRITE_BEHIND_ENABLED:
+            return None
+        if cls._chat_writer is None:
+            cls._chat_writer = ChatWriteBehind(
+                chat_repository=cls.get_chat_repository(),
+                max_size=settings.CHAT_WRITE_BUFFER_SIZE,
+                batch_size=settings.CHAT_WRITE_BATCH_SIZE,
+                flush_interval=settings.CHAT_WRITE_FLUSH_INTERVAL_SECONDS,
+                max_retries=settings.CHAT_WRITE_MAX_RETRIES,
+                retry_backoff=settings.CHAT_WRITE_RETRY_BACKOFF_SECONDS,
+            )
+        return cls._chat_writer
+
+    @classmethod
+    def reset(cls) -> None:
+        """공유 저장소를 제거합니다. MongoDB 연결을 닫은 뒤 컬렉션 참조를 버리기 위해 사용합니다."""
+        cls._diagram_repository = None
+        cls._chat_repository = None
+        cls._latest_diagram_cache = None
+        cls._response_cache = None
+        cls._chat_writer = None
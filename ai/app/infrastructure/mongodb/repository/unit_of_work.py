@@ -0,0 +1,98 @@
+import logging
+from typing import Any, Dict, List
+
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from app.config.config import settings
+from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+from app.infrastructure.mongodb.repository.chat_repository import ChatRepository
+from app.infrastructure.mongodb.repository.diagram_repository import DiagramRepository
+from app.infrastructure.mongodb.repository.model.diagram_model import Chat, Diagram
+
+logger = logging.getLogger(__name__)
+
+# 단독 서버처럼 트랜잭션을 지원하지 않는 MongoDB에서 발생하는 오류 코드
+ILLEGAL_OPERATION = 20
+
+
+class MongoUnitOfWork:
+    """
+    다이어그램과 채팅 저장을 하나의 단위로 커밋하는 Unit of Work
+
+    add_diagram/add_chat으로 등록한 문서는 commit 전까지 저장되지 않으며,
+    commit은 Motor 세션의 트랜잭션 안에서 다이어그램 upsert와 채팅 insert_many만 실행합니다.
+    트랜잭션을 지원하지 않는 서버에서는 순서대로 저장하고, 채팅 저장에 실패하면 새로 삽입한 다이어그램을 삭제합니다.
+    """
+
+    # 서버가 트랜잭션을 지원하지 않는 것이 확인되면 이후에는 트랜잭션을 시도하지 않음
+    _transactions_supported = True
+
+    def __init__(self, diagram_repository: DiagramRepository, chat_repository: ChatRepository):
+        """
+        MongoUnitOfWork 초기화
+
+        Args:
+            diagram_repository: 다이어그램 저장소
+            chat_repository: 채팅 저장소
+        """
+        self.diagram_repository = diagram_repository
+        self.chat_repository = chat_repository
+        self._diagrams: List[Diagram] = []
+        self._chat_documents: List[Dict[str, Any]] = []
+
+    def add_diagram(self, diagram: Diagram) -> None:
+        """커밋할 다이어그램을 등록합니다."""
+        self._diagrams.append(diagram)
+
+    def add_chat(self, chat: Chat) -> None:
+        """커밋할 채팅을 등록합니다."""
+        document = chat.model_dump()
+        # 트랜잭션이 재시도되어도 같은 _id로 저장되도록 미리 부여
+        document["_id"] = ObjectId()
+        self._chat_documents.append(document)
+
+    async def commit(self) -> None:
+        """
+        등록된 다이어그램과 채팅을 함께 저장합니다. 하나라도 실패하면 아무것도 저장되지 않습니다.
+        커밋 후 다이어그램 저장소의 저장 후 처리(캐시 무효화, 색인 등)를 실행합니다.
+        """
+        if settings.MONGO_TRANSACTIONS_ENABLED and MongoUnitOfWork._transactions_supported:
+            try:
+                async with await MongoDBConnection.start_session() as session:
+                    inserted = await session.with_transaction(self._write)
+            except OperationFailure as e:
+                if e.code != ILLEGAL_OPERATION:
+                    raise
+                logger.warning(f"MongoDB 트랜잭션을 지원하지 않아 순차 저장으로 전환합니다: {e}")
+                MongoUnitOfWork._transactions_supported = False
+                inserted = await self._write_with_compensation()
+        else:
+            inserted = await self._write_with_compensation()
+
+        for diagram, diagram_inserted in zip(self._diagrams, inserted):
+            await self.diagram_repository.on_saved(diagram, diagram_inserted)
+
+        self._diagrams = []
+        self._chat_documents = []
+
+    async def _write(self, session=None) -> List[bool]:
+        inserted = [await self.diagram_repository.upsert(diagram, session) for diagram in self._diagrams]
+        if self._chat_documents:
+            await self.chat_repository.insert_documents(self._chat_documents, session=session)
+        return inserted
+
+    async def _write_with_compensation(self) -> List[bool]:
+        inserted: List[bool] = []
+        try:
+            for diagram in self._diagrams:
+                inserted.append(await self.diagram_repository.upsert(diagram))
+            if self._chat_documents:
+                await self.chat_repository.insert_documents(self._chat_documents)
+            return inserted
+        except Exception:
+            # 채팅 없이 남는 다이어그램 버전이 없도록 새로 삽입한 다이어그램을 삭제
+            for diagram, diagram_inserted in zip(self._diagrams, inserted):
+                if diagram_inserted:
+                    await self.diagram_repository.delete_by_diagram_id(diagram.diagramId)
+            raise
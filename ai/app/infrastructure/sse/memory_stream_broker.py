@@ -0,0 +1,134 @@
+import logging
+import time
+from typing import AsyncIterator, Dict, Set, Tuple
+
+from app.infrastructure.sse.replay_buffer import ReplayBuffer
+from app.infrastructure.sse.stream_broker import StreamBroker
+from app.infrastructure.sse.stream_queue import StreamQueue, OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryStreamBroker(StreamBroker):
+    """
+    프로세스 내부 딕셔너리에 스트림 큐를 보관하는 기본 브로커
+
+    생산자와 구독자가 같은 워커 프로세스에 있어야 합니다.
+    """
+
+    def __init__(
+            self,
+            max_queue_size: int = 0,
+            overflow_policy: str = OverflowPolicy.DROP_OLDEST,
+            replay_buffer_size: int = 1024,
+    ):
+        """
+        InMemoryStreamBroker 초기화
+
+        Args:
+            max_queue_size: 스트림별 최대 이벤트 수 (0이면 제한 없음)
+            overflow_policy: 큐가 가득 찼을 때의 처리 방식
+            replay_buffer_size: 재연결 시 다시 전송하기 위해 보관할 스트림별 최근 이벤트 수
+        """
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.replay_buffer_size = replay_buffer_size
+        self._streams: Dict[str, StreamQueue] = {}
+        self._buffers: Dict[str, ReplayBuffer] = {}
+        self._connected: Set[str] = set()
+        # 구독자가 없어진 시각 (생성 직후에는 생성 시각)
+        self._detached_at: Dict[str, float] = {}
+        self._reaped_total = 0
+        self._dropped_total = 0
+
+    async def open(self, stream_id: str) -> StreamQueue:
+        queue = StreamQueue(maxsize=self.max_queue_size, overflow_policy=self.overflow_policy)
+        self._streams[stream_id] = queue
+        self._buffers[stream_id] = ReplayBuffer(self.replay_buffer_size)
+        self._detached_at[stream_id] = queue.created_at
+        logger.info(f"현재 sse clients: {self._streams.keys()}")
+        return queue
+
+    async def exists(self, stream_id: str) -> bool:
+        return stream_id in self._streams
+
+    async def subscribe(self, stream_id: str, last_event_id: int = 0) -> AsyncIterator[Tuple[int, str]]:
+        queue = self._streams.get(stream_id)
+        if queue is None:
+            return
+
+        buffer = self._buffers[stream_id]
+        if buffer.is_truncated(last_event_id):
+            logger.warning(f"재전송 버퍼를 넘어선 이벤트는 복구할 수 없습니다: stream_id={stream_id}, "
+                           f"last_event_id={last_event_id}")
+
+        self._connected.add(stream_id)
+        try:
+            # 이전 연결에서 받지 못한 이벤트 재전송
+            for event in buffer.since(last_event_id):
+                yield event
+
+            while not buffer.closed:
+                data = await queue.get()
+
+                # 종료 신호 확인
+                if data is None:
+                    buffer.closed = True
+                    break
+
+                # 응답에 쓰기 전에 버퍼에 기록하여 전송 도중 끊겨도 재전송 가능
+                yield buffer.append(data), data
+        finally:
+            self._connected.discard(stream_id)
+            if stream_id in self._streams:
+                self._detached_at[stream_id] = time.monotonic()
+
+    async def publish_control(self, stream_id: str, control: str) -> None:
+        # 모든 구독자가 이 워커에 있으므로 알릴 대상이 없음
+        return
+
+    async def watch_control(self, stream_id: str) -> AsyncIterator[str]:
+        # 다른 워커가 보내는 제어 메시지가 없으므로 빈 이터레이터
+        return
+        yield
+
+    async def remove(self, stream_id: str) -> None:
+        self._connected.discard(stream_id)
+        self._buffers.pop(stream_id, None)
+        self._detached_at.pop(stream_id, None)
+        queue = self._streams.pop(stream_id, None)
+        if queue is not None:
+            # 구독자가 떠난 뒤 생산자가 넣는 이벤트는 버림
+            self._dropped_total += queue.dropped
+            queue.close()
+
+    async def reap(self, connect_timeout: float, idle_timeout: float) -> int:
+        now = time.monotonic()
+        expired = [
+            stream_id for stream_id, queue in self._streams.items()
+            if (stream_id not in self._connected and now - self._detached_at[stream_id] > connect_timeout)
+            or now - queue.last_activity_at > idle_timeout
+        ]
+
+        for stream_id in expired:
+            queue = self._streams[stream_id]
+            if stream_id in self._connected:
+                # 연결된 구독자는 종료 신호를 받고 스스로 정리
+                queue.put_nowait(None)
+                self._connected.discard(stream_id)
+            else:
+                await self.remove(stream_id)
+            logger.info(f"방치된 SSE 스트림 정리: stream_id={stream_id}")
+
+        self._reaped_total += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "live": len(self._streams),
+            "connected": len(self._connected),
+            "orphaned": len(self._streams.keys() - self._connected),
+            "bufferedEvents": sum(queue.qsize() for queue in self._streams.values()),
+            "droppedEvents": self._dropped_total + sum(queue.dropped for queue in self._streams.values()),
+            "reapedTotal": self._reaped_total,
+        }
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import AsyncIterator, Dict, Tuple
+
+from pymongo.errors import CollectionInvalid
+
+from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+from app.infrastructure.sse.stream_broker import StreamBroker
+from app.infrastructure.sse.stream_queue import StreamQueue, OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class MongoStreamBroker(StreamBroker):
+    """
+    MongoDB capped 컬렉션을 통해 워커 프로세스 간에 스트림 이벤트를 전달하는 브로커
+
+    생산자 워커는 로컬 큐의 이벤트를 순번(seq)과 함께 capped 컬렉션에 삽입하고,
+    구독자 워커는 (streamId, seq) 인덱스로 마지막 순번 이후의 이벤트를 조회합니다.
+    tailable cursor는 인덱스를 사용하지 못하고 컬렉션 전체를 읽으므로 사용하지 않으며,
+    새 이벤트가 없으면 조회 간격을 max_poll_interval까지 늘립니다.
+    생산자 워커가 종료되어 CLOSE 문서가 기록되지 않으면 구독자는 idle_timeout 후 오류 이벤트를 보내고 종료합니다.
+    """
+
+    OPEN = "open"
+    DATA = "data"
+    CLOSE = "close"
+    # remove() 이후 exists()가 False를 반환하도록 기록하는 삭제 표시 (seq가 없어 이벤트 구독에는 포함되지 않음)
+    REMOVED = "removed"
+
+    shared = True
+
+    def __init__(
+            self,
+            collection_name: str,
+            capped_size_bytes: int,
+            max_queue_size: int = 0,
+            overflow_policy: str = OverflowPolicy.DROP_OLDEST,
+            poll_interval: float = 0.05,
+            max_poll_interval: float = 1.0,
+            idle_timeout: float = 0,
+    ):
+        """
+        MongoStreamBroker 초기화
+
+        Args:
+            collection_name: 이벤트를 저장할 capped 컬렉션 이름
+            capped_size_bytes: capped 컬렉션 최대 크기 (바이트)
+            max_queue_size: 생산자 로컬 큐의 최대 이벤트 수 (0이면 제한 없음)
+            overflow_policy: 큐가 가득 찼을 때의 처리 방식
+            poll_interval: 새 이벤트 조회 간격 (초, 이벤트가 있으면 이 간격으로 조회)
+            max_poll_interval: 새 이벤트가 없을 때 늘려 가는 조회 간격의 최대값 (초)
+            idle_timeout: 구독 중 새 문서가 없으면 생산자가 종료된 것으로 보고 구독을 끝낼 시간 (초, 0 이하이면 제한 없음)
+        """
+        self.collection_name = collection_name
+        self.capped_size_bytes = capped_size_bytes
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.idle_timeout = idle_timeout
+        self._collection = None
+        # 실행 중인 전송 태스크 참조 (가비지 컬렉션 방지)
+        self._pumps: Dict[str, asyncio.Task] = {}
+        self._queues: Dict[str, StreamQueue] = {}
+        self._subscribers = 0
+        self._reaped_total = 0
+        self._dropped_total = 0
+
+    async def get_collection(self):
+        """capped 컬렉션 객체 반환 (없으면 생성)"""
+        if self._collection is None:
+            db = await MongoDBConnection.connect()
+            if self.collection_name not in await db.list_collection_names():
+                try:
+                    await db.create_collection(self.collection_name, capped=True, size=self.capped_size_bytes)
+                except CollectionInvalid:
+                    # 다른 워커가 먼저 생성한 경우
+                    pass
+            collection = db[self.collection_name]
+            # 이벤트 조회용 (streamId, seq), exists()와 제어 메시지 집계용 (streamId, type) 인덱스 (이미 있으면 무시됨)
+            await collection.create_index([("streamId", 1), ("seq", 1)])
+            await collection.create_index([("streamId", 1), ("type", 1)])
+            self._collection = collection
+        return self._collection
+
+    async def open(self, stream_id: str) -> asyncio.Queue:
+        collection = await self.get_collection()
+        await collection.insert_one({
+            "streamId": stream_id,
+            "seq": 0,
+            "type": self.OPEN,
+            "createdAt": datetime.utcnow(),
+        })
+
+        queue = StreamQueue(maxsize=self.max_queue_size, overflow_policy=self.overflow_policy)
+        self._queues[stream_id] = queue
+        self._pumps[stream_id] = asyncio.create_task(self._pump(stream_id, queue))
+        return queue
+
+    async def _pump(self, stream_id: str, queue: StreamQueue) -> None:
+        """로컬 큐에 쌓인 이벤트를 모아 capped 컬렉션에 삽입합니다."""
+        collection = await self.get_collection()
+        seq = 0
+        closed = False
+
+        try:
+            while not closed:
+                batch = [await queue.get()]
+                # 이미 쌓여 있는 이벤트는 한 번의 insert_many로 전송
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                documents = []
+                for data in batch:
+                    seq += 1
+                    if data is None:
+                        documents.append({"streamId": stream_id, "seq": seq, "type": self.CLOSE})
+                        closed = True
+                        break
+                    documents.append({"streamId": stream_id, "seq": seq, "type": self.DATA, "data": data})
+
+                await collection.insert_many(documents)
+        except Exception as e:
+            logger.error(f"SSE 이벤트 전송 중 오류 발생: stream_id={stream_id}, error={str(e)}", exc_info=True)
+        finally:
+            self._pumps.pop(stream_id, None)
+            self._queues.pop(stream_id, None)
+            self._dropped_total += queue.dropped
+
+    async def exists(self, stream_id: str) -> bool:
+        collection = await self.get_collection()
+        # remove() 이후에는 삭제 표시가 있으므로 False
+        if await collection.find_one({"streamId": stream_id, "type": self.REMOVED}, {"_id": 1}) is not None:
+            return False
+        return await collection.find_one({"streamId": stream_id, "type": self.OPEN}, {"_id": 1}) is not None
+
+    async def subscribe(self, stream_id: str, last_event_id: int = 0) -> AsyncIterator[Tuple[int, str]]:
+        collection = await self.get_collection()
+        # 문서 순번을 이벤트 ID로 사용하므로 capped 컬렉션에 남아 있는 이벤트는 재전송됨
+        last_seq = last_event_id
+
+        self._subscribers += 1
+        last_received_at = time.monotonic()
+        interval = self.poll_interval
+        try:
+            while True:
+                cursor = collection.find({"streamId": stream_id, "seq": {"$gt": last_seq}}).sort("seq", 1)
+                received = False
+                async for document in cursor:
+                    received = True
+                    last_seq = document["seq"]
+                    if document["type"] == self.CLOSE:
+                        return
+                    yield last_seq, document["data"]
+
+                if received:
+                    last_received_at = time.monotonic()
+                    interval = self.poll_interval
+                elif self._idle(last_received_at):
+                    # 생산자 워커가 종료 이벤트 없이 사라진 경우 구독자가 무한히 대기하지 않도록 종료
+                    # (재연결 시 Last-Event-ID로 건너뛰지 않도록 마지막 이벤트와 다른 ID 사용)
+                    logger.warning(f"SSE 스트림 이벤트 대기 시간 초과: stream_id={stream_id}, last_seq={last_seq}")
+                    error_message = "\n\n오류가 발생했습니다: 응답 생성이 중단되었습니다."
+                    yield last_seq + 1, f"data: {json.dumps({'error': error_message})}\n\n"
+                    yield last_seq + 2, f"data: {json.dumps({'done': True})}\n\n"
+                    yield last_seq + 3, "event: close\ndata: closing\n\n"
+                    return
+                else:
+                    interval = min(interval * 2, self.max_poll_interval)
+
+                await asyncio.sleep(interval)
+        finally:
+            self._subscribers -= 1
+
+    def _idle(self, last_received_at: float) -> bool:
+        return 0 < self.idle_timeout < time.monotonic() - last_received_at
+
+    async def publish_control(self, stream_id: str, control: str) -> None:
+        collection = await self.get_collection()
+        # seq가 없으므로 이벤트 구독 쿼리에는 포함되지 않음
+        await collection.insert_one({"streamId": stream_id, "type": control, "createdAt": datetime.utcnow()})
+
+    async def watch_control(self, stream_id: str) -> AsyncIterator[str]:
+        collection = await self.get_collection()
+        # 메시지 문서를 다시 읽지 않도록 (streamId, type) 인덱스로 유형별 개수만 조회하여 증가분을 전달
+        counts = {self.ATTACH: 0, self.DETACH: 0}
+        interval = self.poll_interval
+
+        while True:
+            changed = False
+            # 연결 후 바로 해제된 구독자도 연결로 먼저 집계되도록 ATTACH부터 전달
+            for control in (self.ATTACH, self.DETACH):
+                count = await collection.count_documents({"streamId": stream_id, "type": control})
+                # capped 컬렉션에서 오래된 메시지가 제거되어 개수가 줄어든 경우는 무시
+                for _ in range(count - counts[control]):
+                    changed = True
+                    yield control
+                counts[control] = count
+
+            interval = self.poll_interval if changed else min(interval * 2, self.max_poll_interval)
+            await asyncio.sleep(interval)
+
+    async def remove(self, stream_id: str) -> None:
+        # capped 컬렉션의 문서는 삭제할 수 없으므로 삭제 표시를 기록하고, 크기 한도에 도달하면 자동으로 제거됩니다
+        collection = await self.get_collection()
+        await collection.insert_one({"streamId": stream_id, "type": self.REMOVED, "createdAt": datetime.utcnow()})
+
+        queue = self._queues.pop(stream_id, None)
+        if queue is not None:
+            # 이 워커가 생산자이면 종료 이벤트를 기록하고 이후 생산자가 넣는 이벤트는 버림
+            queue.put_nowait(None)
+            queue.closed = True
+
+    async def reap(self, connect_timeout: float, idle_timeout: float) -> int:
+        # 구독 여부는 다른 워커에서 결정되므로 생산자 이벤트가 끊긴 스트림만 정리합니다
+        now = time.monotonic()
+        expired = [
+            stream_id for stream_id, queue in self._queues.items()
+            if now - queue.last_activity_at > idle_timeout
+        ]
+
+        for stream_id in expired:
+            queue = self._queues.pop(stream_id)
+            # 종료 이벤트를 기록하여 다른 워커의 구독자도 종료되도록 함
+            queue.put_nowait(None)
+            queue.closed = True
+            logger.info(f"방치된 SSE 스트림 정리: stream_id={stream_id}")
+
+        self._reaped_total += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "live": len(self._pumps),
+            "subscribers": self._subscribers,
+            "bufferedEvents": sum(queue.qsize() for queue in self._queues.values()),
+            "droppedEvents": self._dropped_total + sum(queue.dropped for queue in self._queues.values()),
+            "reapedTotal": self._reaped_total,
+        }
@@ -0,0 +1,52 @@
+from collections import deque
+from typing import Deque, List, Tuple
+
+
+class ReplayBuffer:
+    """
+    스트림별 최근 이벤트를 보관하는 링 버퍼
+
+    이벤트마다 1부터 단조 증가하는 ID를 부여하여, 재연결한 구독자가 Last-Event-ID 이후의
+    이벤트를 다시 받을 수 있도록 합니다. 용량을 넘으면 가장 오래된 이벤트부터 버립니다.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        ReplayBuffer 초기화
+
+        Args:
+            capacity: 보관할 최대 이벤트 수
+        """
+        self._events: Deque[Tuple[int, str]] = deque(maxlen=capacity)
+        self.last_event_id = 0
+        self.closed = False
+
+    def append(self, data: str) -> int:
+        """
+        이벤트를 추가하고 부여된 ID를 반환합니다.
+
+        Args:
+            data: SSE 이벤트 문자열
+
+        Returns:
+            int: 이벤트 ID
+        """
+        self.last_event_id += 1
+        self._events.append((self.last_event_id, data))
+        return self.last_event_id
+
+    def since(self, last_event_id: int) -> List[Tuple[int, str]]:
+        """
+        last_event_id 이후의 이벤트를 반환합니다.
+
+        Args:
+            last_event_id: 구독자가 마지막으로 받은 이벤트 ID
+
+        Returns:
+            List[Tuple[int, str]]: (이벤트 ID, 이벤트) 목록
+        """
+        return [event for event in self._events if event[0] > last_event_id]
+
+    def is_truncated(self, last_event_id: int) -> bool:
+        """last_event_id 다음 이벤트가 이미 버려졌는지 확인합니다."""
+        return bool(self._events) and self._events[0][0] > last_event_id + 1
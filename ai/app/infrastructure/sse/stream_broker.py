@@ -0,0 +1,157 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Tuple
+
+
+class StreamBroker(ABC):
+    """
+    SSE 스트림 이벤트를 생산자(채팅 처리 태스크)에서 구독자(/sse/connect 연결)로 전달하는 브로커 인터페이스
+
+    생산자는 open()이 반환한 큐에 이벤트를 넣고, 종료 시 None을 넣습니다.
+    구독자는 subscribe()로 이벤트를 순서대로 받으며, 생산자가 None을 넣으면 이터레이션이 끝납니다.
+    이벤트에는 스트림별로 단조 증가하는 ID가 부여되어, 재연결 시 마지막으로 받은 ID 이후부터 다시 받을 수 있습니다.
+    """
+
+    # 스트림이 여러 워커 프로세스에 공유되는지 여부 (공유되면 다른 워커의 구독자는 제어 메시지로 알림)
+    shared: bool = False
+
+    # 다른 워커의 구독자 연결/해제를 스트림 작업을 실행하는 워커에 알리는 제어 메시지
+    ATTACH = "attach"
+    DETACH = "detach"
+
+    @abstractmethod
+    async def open(self, stream_id: str) -> asyncio.Queue:
+        """
+        새 스트림을 등록하고 생산자가 이벤트를 넣을 큐를 반환합니다.
+
+        Args:
+            stream_id: 스트림 ID
+
+        Returns:
+            asyncio.Queue: 생산자용 응답 큐
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, stream_id: str) -> bool:
+        """
+        스트림이 등록되어 있는지 확인합니다.
+
+        Args:
+            stream_id: 스트림 ID
+
+        Returns:
+            bool: 스트림 존재 여부
+        """
+        pass
+
+    @abstractmethod
+    def subscribe(self, stream_id: str, last_event_id: int = 0) -> AsyncIterator[Tuple[int, str]]:
+        """
+        스트림의 이벤트를 순서대로 구독합니다.
+
+        Args:
+            stream_id: 스트림 ID
+            last_event_id: 이전 연결에서 마지막으로 받은 이벤트 ID (이후 이벤트부터 전달)
+
+        Returns:
+            AsyncIterator[Tuple[int, str]]: (이벤트 ID, SSE 이벤트 문자열) 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    async def remove(self, stream_id: str) -> None:
+        """
+        스트림을 제거합니다.
+
+        Args:
+            stream_id: 제거할 스트림 ID
+        """
+        pass
+
+    @abstractmethod
+    async def publish_control(self, stream_id: str, control: str) -> None:
+        """
+        구독자 연결(ATTACH)/해제(DETACH)를 스트림 작업을 실행하는 워커에 알립니다.
+        공유되지 않는 브로커는 모든 구독자가 같은 워커에 있으므로 아무것도 하지 않습니다.
+
+        Args:
+            stream_id: 스트림 ID
+            control: 제어 메시지 (ATTACH, DETACH)
+        """
+        pass
+
+    @abstractmethod
+    def watch_control(self, stream_id: str) -> AsyncIterator[str]:
+        """
+        다른 워커에서 보낸 스트림의 제어 메시지를 순서대로 구독합니다.
+        공유되지 않는 브로커는 다른 워커가 없으므로 메시지 없이 바로 끝납니다.
+
+        Args:
+            stream_id: 스트림 ID
+
+        Returns:
+            AsyncIterator[str]: 제어 메시지 (ATTACH, DETACH) 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    async def reap(self, connect_timeout: float, idle_timeout: float) -> int:
+        """
+        연결되지 않았거나 방치된 스트림을 정리합니다.
+
+        Args:
+            connect_timeout: 구독자가 연결되지 않은 스트림(생성 후 또는 연결이 끊긴 후)을 정리할 시간 (초)
+            idle_timeout: 생산자 이벤트가 없는 스트림을 정리할 시간 (초)
+
+        Returns:
+            int: 정리된 스트림 수
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """
+        스트림 현황 지표를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 지표 이름별 값
+        """
+        pass
+
+
+class StreamBrokerFactory:
+    """스트림 브로커 생성 팩토리"""
+
+    @staticmethod
+    def create_broker(backend: str) -> StreamBroker:
+        """설정된 백엔드 유형의 스트림 브로커 생성
+
+        Args:
+            backend: 브로커 백엔드 ("memory", "mongo")
+
+        Returns:
+            StreamBroker 구현체
+        """
+        from app.config.config import settings
+
+        if backend == "memory":
+            from app.infrastructure.sse.memory_stream_broker import InMemoryStreamBroker
+            return InMemoryStreamBroker(
+                max_queue_size=settings.SSE_QUEUE_MAX_SIZE,
+                overflow_policy=settings.SSE_QUEUE_OVERFLOW_POLICY,
+                replay_buffer_size=settings.SSE_REPLAY_BUFFER_SIZE,
+            )
+        elif backend == "mongo":
+            from app.infrastructure.sse.mongo_stream_broker import MongoStreamBroker
+            return MongoStreamBroker(
+                collection_name=settings.SSE_MONGO_COLLECTION,
+                capped_size_bytes=settings.SSE_MONGO_CAPPED_SIZE_BYTES,
+                max_queue_size=settings.SSE_QUEUE_MAX_SIZE,
+                overflow_policy=settings.SSE_QUEUE_OVERFLOW_POLICY,
+                poll_interval=settings.SSE_MONGO_POLL_INTERVAL_SECONDS,
+                max_poll_interval=settings.SSE_MONGO_MAX_POLL_INTERVAL_SECONDS,
+                idle_timeout=settings.SSE_STREAM_IDLE_TIMEOUT_SECONDS,
+            )
+        else:
+            raise ValueError(f"지원되지 않는 SSE 브로커 유형: {backend}")
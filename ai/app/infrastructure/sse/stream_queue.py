@@ -0,0 +1,62 @@
+import asyncio
+import time
+from enum import Enum
+
+
+class OverflowPolicy(str, Enum):
+    """큐가 가득 찼을 때의 처리 방식"""
+    DROP_OLDEST = "drop_oldest"  # 가장 오래된 이벤트를 버리고 새 이벤트 추가
+    DROP_NEWEST = "drop_newest"  # 새 이벤트를 버림
+    BLOCK = "block"  # 비동기 put은 공간이 생길 때까지 대기 (동기 put_nowait는 DROP_OLDEST로 동작하므로 데이터 이벤트는 put 사용)
+
+
+class StreamQueue(asyncio.Queue):
+    """
+    크기가 제한된 SSE 스트림 큐
+
+    큐가 가득 차면 overflow_policy에 따라 이벤트를 버리거나 생산자를 대기시킵니다.
+    스트림 종료 신호(None)는 어떤 정책에서도 버려지지 않습니다.
+    close() 이후의 이벤트는 무시되므로 구독자가 없는 스트림에 이벤트가 쌓이지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
+        """
+        StreamQueue 초기화
+
+        Args:
+            maxsize: 최대 이벤트 수
+            overflow_policy: 큐가 가득 찼을 때의 처리 방식
+        """
+        super().__init__(maxsize=maxsize)
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.created_at = time.monotonic()
+        self.last_activity_at = self.created_at
+        self.dropped = 0
+        self.closed = False
+
+    def put_nowait(self, item) -> None:
+        if self.closed:
+            return
+
+        self.last_activity_at = time.monotonic()
+        if self.full():
+            if item is not None and self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return
+            # 가장 오래된 이벤트를 버려 공간 확보
+            self.get_nowait()
+            self.dropped += 1
+
+        super().put_nowait(item)
+
+    async def put(self, item) -> None:
+        if self.overflow_policy == OverflowPolicy.BLOCK and item is not None:
+            # 공간이 생길 때까지 대기한 뒤 put_nowait 호출
+            return await super().put(item)
+        return self.put_nowait(item)
+
+    def close(self) -> None:
+        """큐를 닫고 남은 이벤트를 비웁니다. 대기 중인 생산자도 깨어나 종료됩니다."""
+        self.closed = True
+        while not self.empty():
+            self.get_nowait()
@@ -8,13 +8,47 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.api_routes import api_router
 from app.api.chat_routes import chat_router
 from app.api.diagram_routes import diagram_router
+from app.core.llm.base_llm import LLMFactory
+from app.core.services.sse_service import SSEService
+from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+from app.infrastructure.mongodb.connection.indexes import IndexCreationError
+from app.infrastructure.mongodb.repository.repository_factory import RepositoryFactory
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="SCRUD project")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청이 연결 및 ping 지연을 부담하지 않도록 시작 시 MongoDB 커넥션 풀 생성
+    try:
+        await MongoDBConnection.connect()
+    except IndexCreationError:
+        # 버전 고유성 등 정합성을 보장할 수 없으므로 시작하지 않음
+        raise
+    except Exception as e:
+        logger.error(f"시작 시 MongoDB 연결 실패, 첫 요청 시 다시 연결합니다: {str(e)}")
+
+    sse_service = SSEService()
+    sse_service.start_reaper()
+    chat_writer = RepositoryFactory.get_chat_writer()
+    if chat_writer is not None:
+        chat_writer.start()
+    yield
+    await sse_service.stop_reaper()
+    # 종료 시 저장 대기 중인 채팅을 MongoDB 연결을 닫기 전에 저장
+    if chat_writer is not None:
+        await chat_writer.stop()
+    # 종료 시 공유 LLM 클라이언트의 HTTP 커넥션 정리
+    await LLMFactory.close()
+    # 종료 시 MongoDB 커넥션 풀 정리
+    await MongoDBConnection.close()
+    RepositoryFactory.reset()
+
+
+app = FastAPI(title="SCRUD project", lifespan=lifespan)
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
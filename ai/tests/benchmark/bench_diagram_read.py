@@ -0,0 +1,106 @@
+"""
+다이어그램 조회 응답 직렬화 벤치마크
+
+기존 경로(dict → Diagram → DiagramResponse → FastAPI 응답 직렬화)와
+RawBSONDocument → DiagramResponse TypeAdapter 경로의 직렬화 시간을 비교합니다.
+MongoDB 왕복 시간은 두 경로가 같으므로 제외하고, 저장된 문서와 같은 BSON에서 시작합니다.
+
+실행: python -m tests.benchmark.bench_diagram_read (ai 디렉터리에서)
+"""
+
+import json
+import timeit
+import uuid
+from datetime import datetime
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from fastapi.encoders import jsonable_encoder
+
+from app.api.dto.diagram_dto import DiagramResponse
+from app.core.diagram.diagram_service import DiagramService
+from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
+
+METHODS_PER_COMPONENT = 6
+METHOD_BODY = "\n".join(f"    int value{i} = repository.findById(id).map(Entity::getValue).orElse({i});"
+                        for i in range(30))
+
+
+def build_diagram_document(component_count: int) -> dict:
+    """component_count개의 컴포넌트를 가진 다이어그램 문서를 생성합니다."""
+    components = []
+    for c in range(component_count):
+        components.append({
+            "componentId": str(uuid.uuid4()),
+            "type": "CLASS",
+            "name": f"Component{c}",
+            "description": "컴포넌트 설명",
+            "positionX": float(c * 10),
+            "positionY": float(c * 20),
+            "methods": [{
+                "methodId": str(uuid.uuid4()),
+                "name": f"method{m}",
+                "signature": f"public int method{m}(Long id)",
+                "body": METHOD_BODY,
+                "description": "메서드 설명",
+            } for m in range(METHODS_PER_COMPONENT)],
+        })
+
+    method_ids = [m["methodId"] for c in components for m in c["methods"]]
+    return {
+        "projectId": "project",
+        "apiId": "api",
+        "diagramId": str(uuid.uuid4()),
+        "components": components,
+        "connections": [{
+            "connectionId": str(uuid.uuid4()),
+            "sourceMethodId": source,
+            "targetMethodId": target,
+            "type": "SOLID",
+        } for source, target in zip(method_ids, method_ids[1:])],
+        "dto": [{
+            "dtoId": str(uuid.uuid4()),
+            "name": f"Dto{d}",
+            "description": "DTO 설명",
+            "body": "public record Dto(Long id, String name) {}",
+        } for d in range(10)],
+        "metadata": {
+            "metadataId": str(uuid.uuid4()),
+            "version": 1,
+            "lastModified": datetime(2025, 1, 1),
+            "name": "name",
+            "description": "설명",
+        },
+    }
+
+
+def model_path(raw: RawBSONDocument) -> bytes:
+    """기존 경로: 문서 디코딩 → Diagram → DiagramResponse → 응답 모델 검증 및 JSON 인코딩"""
+    document = bson.decode(raw.raw)
+    diagram = Diagram(**document)
+    response = DiagramResponse.model_validate(diagram)
+    # FastAPI는 반환 타입으로 응답을 한 번 더 검증한 뒤 jsonable_encoder로 변환
+    response = DiagramResponse.model_validate(response)
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False).encode()
+
+
+def raw_path(raw: RawBSONDocument) -> bytes:
+    """RawBSONDocument 경로: TypeAdapter로 한 번 검증하여 바로 JSON 직렬화"""
+    return DiagramService.serialize_raw_diagram(raw)
+
+
+def main():
+    print(f"{'components':>10} {'size(KB)':>9} {'model(ms)':>10} {'raw(ms)':>8} {'speedup':>8}")
+    for component_count in (10, 50, 100, 200):
+        raw = RawBSONDocument(bson.encode(build_diagram_document(component_count)))
+        number = 50
+
+        model_ms = min(timeit.repeat(lambda: model_path(raw), number=number, repeat=5)) / number * 1000
+        raw_ms = min(timeit.repeat(lambda: raw_path(raw), number=number, repeat=5)) / number * 1000
+
+        print(f"{component_count:>10} {len(raw.raw) / 1024:>9.1f} {model_ms:>10.2f} {raw_ms:>8.2f} "
+              f"{model_ms / raw_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
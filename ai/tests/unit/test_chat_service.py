@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.core.services.chat_service import ChatService, encode_chat_cursor, decode_chat_cursor
+
+
+def _chat_document(index: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "chatId": f"chat_{index}",
+        "createdAt": datetime(2025, 1, 1, 12, 0, index, 123000),
+        "userChat": {"tag": "EXPLAIN", "promptType": "BODY", "message": f"질문 {index}", "targetMethods": []},
+        "systemChat": {"status": "EXPLANATION", "message": f"답변 {index}"},
+    }
+
+
+class FakeChatRepository:
+    """(createdAt, _id) 순으로 정렬된 채팅 문서를 반환하는 저장소 대용"""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def iter_prompts(self, project_id, api_id, after=None, limit=0):
+        documents = [d for d in self.documents if after is None or (d["createdAt"], d["_id"]) > after]
+        for document in documents[:limit or None]:
+            yield document
+
+
+class TestChatService:
+    """ChatService 채팅 기록 조회 테스트 클래스"""
+
+    def test_cursor_round_trip(self):
+        """커서가 (createdAt, _id)를 밀리초 단위로 그대로 복원하는지 테스트"""
+        document = _chat_document(1)
+
+        assert decode_chat_cursor(encode_chat_cursor(document)) == (document["createdAt"], document["_id"])
+        with pytest.raises(ValueError):
+            decode_chat_cursor("invalid")
+
+    @pytest.mark.asyncio
+    async def test_get_prompt_page_follows_cursor(self):
+        """nextCursor를 따라가면 모든 채팅을 중복 없이 한 번씩 조회하는지 테스트"""
+        documents = [_chat_document(i) for i in range(5)]
+        chat_service = ChatService(chat_repository=FakeChatRepository(documents))
+
+        chat_ids = []
+        cursor = None
+        pages = 0
+        while True:
+            page = await chat_service.get_prompt_page("project", "api", cursor, limit=2)
+            chat_ids.extend(chat.chatId for chat in page.content)
+            pages += 1
+            if page.nextCursor is None:
+                break
+            cursor = page.nextCursor
+
+        assert chat_ids == [f"chat_{i}" for i in range(5)]
+        assert pages == 3
+
+    @pytest.mark.asyncio
+    async def test_stream_prompts(self):
+        """스트리밍 조회가 커서 이후의 채팅을 순서대로 반환하는지 테스트"""
+        documents = [_chat_document(i) for i in range(3)]
+        chat_service = ChatService(chat_repository=FakeChatRepository(documents))
+
+        chats = [chat async for chat in chat_service.stream_prompts("project", "api", encode_chat_cursor(documents[0]))]
+
+        assert [chat.chatId for chat in chats] == ["chat_1", "chat_2"]
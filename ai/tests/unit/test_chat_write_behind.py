@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from pymongo.errors import AutoReconnect, BulkWriteError
+
+from app.infrastructure.mongodb.repository.chat_write_behind import ChatWriteBehind, DUPLICATE_KEY_ERROR
+from app.infrastructure.mongodb.repository.model.diagram_model import Chat
+
+
+def _chat(index: int) -> Chat:
+    return Chat(chatId=f"chat_{index}", projectId="project", apiId="api", createdAt=datetime(2025, 1, 1))
+
+
+class FakeChatRepository:
+    """insert_documents 호출을 기록하고, 지정한 오류를 차례로 발생시키는 저장소 대용"""
+
+    def __init__(self, errors=None):
+        self.errors = list(errors or [])
+        self.batches = []
+        self.stored = {}
+
+    async def insert_documents(self, documents):
+        self.batches.append([document["chatId"] for document in documents])
+        if self.errors:
+            error = self.errors.pop(0)
+            if isinstance(error, BulkWriteError):
+                failed = {e["index"] for e in error.details["writeErrors"]}
+                for index, document in enumerate(documents):
+                    if index not in failed:
+                        self.stored[document["_id"]] = document
+            raise error
+        for document in documents:
+            self.stored[document["_id"]] = document
+
+
+def _writer(repository, **kwargs) -> ChatWriteBehind:
+    options = dict(max_size=100, batch_size=10, flush_interval=0.05, max_retries=2, retry_backoff=0)
+    options.update(kwargs)
+    return ChatWriteBehind(repository, **options)
+
+
+class TestChatWriteBehind:
+    """ChatWriteBehind 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_batches_chats(self):
+        """짧은 시간에 들어온 채팅을 한 번의 insert로 저장하는지 테스트"""
+        repository = FakeChatRepository()
+        writer = _writer(repository)
+
+        for index in range(3):
+            await writer.enqueue(_chat(index))
+        await asyncio.sleep(0.1)
+
+        assert repository.batches == [["chat_0", "chat_1", "chat_2"]]
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_retries_only_failed_documents(self):
+        """일부 실패한 배치는 실패한 문서만 재시도하고, 중복 키 오류는 저장된 것으로 처리하는지 테스트"""
+        repository = FakeChatRepository(errors=[
+            AutoReconnect("connection reset"),
+            BulkWriteError({"writeErrors": [
+                {"index": 0, "code": DUPLICATE_KEY_ERROR},
+                {"index": 2, "code": 91},
+            ]}),
+        ])
+        writer = _writer(repository)
+
+        for index in range(3):
+            await writer.enqueue(_chat(index))
+        await writer.stop()
+
+        assert repository.batches[-1] == ["chat_2"]
+        assert sorted(document["chatId"] for document in repository.stored.values()) == ["chat_1", "chat_2"]
+        assert writer.stats()["dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self):
+        """종료 시 flush_interval을 기다리지 않고 대기 중인 채팅을 모두 저장하는지 테스트"""
+        repository = FakeChatRepository()
+        writer = _writer(repository, batch_size=2, flush_interval=60)
+
+        for index in range(5):
+            await writer.enqueue(_chat(index))
+        await writer.stop()
+
+        assert sorted(document["chatId"] for document in repository.stored.values()) == [
+            f"chat_{index}" for index in range(5)
+        ]
+        assert writer.stats()["pending"] == 0
@@ -0,0 +1,89 @@
+import copy
+
+from app.infrastructure.mongodb.repository.diagram_delta import diff_diagram, apply_diagram_delta, \
+    component_positions, apply_component_positions
+
+
+def _method(method_id: str, body: str = "{}") -> dict:
+    return {"methodId": method_id, "name": method_id, "signature": f"void {method_id}()", "body": body}
+
+
+def _component(component_id: str, methods: list, x: float = 0.0, y: float = 0.0) -> dict:
+    return {
+        "componentId": component_id,
+        "type": "CLASS",
+        "name": component_id,
+        "positionX": x,
+        "positionY": y,
+        "methods": methods,
+    }
+
+
+class TestDiagramDelta:
+    """다이어그램 델타 계산 및 적용 테스트 클래스"""
+
+    def _base(self) -> dict:
+        return {
+            "components": [
+                _component("comp_1", [_method("m_1"), _method("m_2")], 10.0, 20.0),
+                _component("comp_2", [_method("m_3")], 30.0, 40.0),
+            ],
+            "connections": [{"connectionId": "c_1", "sourceMethodId": "m_1", "targetMethodId": "m_3"}],
+            "dto": [{"dtoId": "d_1", "name": "UserDto", "body": "record UserDto() {}"}],
+        }
+
+    def test_round_trip(self):
+        """컴포넌트와 메서드의 추가, 삭제, 수정, 순서 변경이 델타 적용 후 그대로 복원되는지 테스트"""
+        base = self._base()
+        target = copy.deepcopy(base)
+        target["components"][0]["methods"][1]["body"] = "{ return; }"
+        target["components"][0]["methods"].append(_method("m_4"))
+        del target["components"][1]
+        target["components"].insert(0, _component("comp_3", [_method("m_5")]))
+        target["dto"].append({"dtoId": "d_2", "name": "OrderDto", "body": "record OrderDto() {}"})
+        snapshot = copy.deepcopy(base)
+
+        delta = diff_diagram(base, target)
+
+        assert apply_diagram_delta(base, delta) == {key: target[key] for key in ("components", "connections", "dto")}
+        # 델타 적용은 기준 문서를 변경하지 않음
+        assert base == snapshot
+
+    def test_unchanged_items_are_not_stored(self):
+        """변경된 메서드만 델타에 저장되는지 테스트"""
+        base = self._base()
+        target = copy.deepcopy(base)
+        target["components"][0]["methods"][0]["body"] = "{ changed(); }"
+
+        delta = diff_diagram(base, target)
+
+        assert [entry["component"]["componentId"] for entry in delta["components"]["set"]] == ["comp_1"]
+        assert delta["components"]["set"][0]["methods"]["set"] == [target["components"][0]["methods"][0]]
+        assert delta["connections"]["set"] == []
+        assert delta["dto"]["set"] == []
+
+    def test_items_without_keys_are_stored_whole(self):
+        """키가 없는 커넥션 목록은 목록 전체를 저장하는지 테스트"""
+        base = self._base()
+        target = copy.deepcopy(base)
+        target["connections"] = [{"connectionId": None, "sourceMethodId": "m_2", "targetMethodId": "m_3"}]
+
+        delta = diff_diagram(base, target)
+
+        assert delta["connections"] == {"items": target["connections"]}
+        assert apply_diagram_delta(base, delta)["connections"] == target["connections"]
+
+    def test_positions_are_pinned(self):
+        """기준 버전의 좌표가 바뀌어도 저장된 좌표로 복원되는지 테스트"""
+        previous = self._base()
+        head = copy.deepcopy(previous)
+        positions = component_positions(previous)
+        delta = diff_diagram(head, previous)
+
+        # 최신 버전에서 캔버스 좌표만 이동
+        head["components"][0]["positionX"] = 500.0
+        components = apply_diagram_delta(head, delta)["components"]
+
+        restored = apply_component_positions(components, positions)
+        assert restored == previous["components"]
+        assert head["components"][0]["positionX"] == 500.0
@@ -0,0 +1,316 @@
+import copy
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.infrastructure.mongodb.repository.diagram_delta import diff_diagram, component_positions
+from app.infrastructure.mongodb.repository import diagram_repository_impl
+from app.infrastructure.mongodb.repository.diagram_repository_impl import DiagramRepositoryImpl, DELTA_STORAGE_TYPE
+from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
+
+
+def _get_path(document: dict, path: str):
+    for part in path.split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(part)
+    return document
+
+
+def _evaluate(expression, document: dict, variables: dict):
+    """파이프라인 업데이트에 사용하는 집계 연산자만 계산"""
+    if isinstance(expression, str) and expression.startswith("$$"):
+        name, _, path = expression[2:].partition(".")
+        return _get_path(variables[name], path) if path else variables[name]
+    if isinstance(expression, str) and expression.startswith("$"):
+        head, _, rest = expression[1:].partition(".")
+        value = document.get(head)
+        # 배열 필드의 하위 경로는 각 원소의 값 목록
+        if rest and isinstance(value, list):
+            return [_get_path(item, rest) for item in value]
+        return _get_path(value, rest) if rest else value
+    if isinstance(expression, list):
+        return [_evaluate(item, document, variables) for item in expression]
+    if not isinstance(expression, dict):
+        return expression
+
+    operator, args = next(iter(expression.items()))
+    if operator == "$literal":
+        return args
+    if operator == "$cond":
+        condition, then, otherwise = args
+        return _evaluate(then if _evaluate(condition, document, variables) else otherwise, document, variables)
+    if operator == "$setIsSubset":
+        subset, superset = _evaluate(args, document, variables)
+        return set(subset) <= set(superset)
+    if operator == "$eq":
+        left, right = _evaluate(args, document, variables)
+        return left == right
+    if operator == "$mergeObjects":
+        merged = {}
+        for item in _evaluate(args, document, variables):
+            merged.update(item)
+        return merged
+    if operator == "$map":
+        return [
+            _evaluate(args["in"], document, {**variables, args["as"]: item})
+            for item in _evaluate(args["input"], document, variables)
+        ]
+    if operator == "$switch":
+        for branch in args["branches"]:
+            if _evaluate(branch["case"], document, variables):
+                return _evaluate(branch["then"], document, variables)
+        return _evaluate(args["default"], document, variables)
+    return {key: _evaluate(value, document, variables) for key, value in expression.items()}
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction=None):
+        for path, order in reversed(key if isinstance(key, list) else [(key, direction)]):
+            self.documents.sort(key=lambda d: _get_path(d, path), reverse=order < 0)
+        return self
+
+    def limit(self, count):
+        self.documents = self.documents[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return self.documents[:length]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.documents:
+            raise StopAsyncIteration
+        return self.documents.pop(0)
+
+
+class FakeDiagramCollection:
+    """단순 비교 필터 조회와 find_one_and_update의 파이프라인 $set만 처리하는 컬렉션 대용"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.updates = 0
+
+    def _matches(self, document: dict, filter_dict: dict) -> bool:
+        for path, condition in filter_dict.items():
+            value = _get_path(document, path)
+            if isinstance(condition, dict):
+                if "$gt" in condition and not (value is not None and value > condition["$gt"]):
+                    return False
+                if "$ne" in condition and value == condition["$ne"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def find(self, filter_dict, projection=None):
+        documents = [copy.deepcopy(d) for d in self.documents if self._matches(d, filter_dict)]
+        if projection and projection.get("_id") == 0:
+            for document in documents:
+                document.pop("_id", None)
+        return FakeCursor(documents)
+
+    async def find_one(self, filter_dict, projection=None, sort=None):
+        documents = self.find(filter_dict, projection)
+        if sort:
+            documents.sort(sort)
+        return documents.documents[0] if documents.documents else None
+
+    async def find_one_and_update(self, filter_dict, update, sort=None, projection=None, **kwargs):
+        self.updates += 1
+        documents = [d for d in self.documents if self._matches(d, filter_dict)]
+        for path, order in reversed(sort or []):
+            documents.sort(key=lambda d: _get_path(d, path), reverse=order < 0)
+        if not documents:
+            return None
+
+        document = documents[0]
+        for stage in update:
+            values = {path: _evaluate(expression, document, {}) for path, expression in stage["$set"].items()}
+            for path, value in values.items():
+                *parents, field = path.split(".")
+                target = document
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[field] = value
+        return copy.deepcopy(document)
+
+
+def _full_document(version: int, body: str, method_id: str = "m_1") -> dict:
+    return {
+        "_id": f"id-{version}",
+        "projectId": "project",
+        "apiId": "api",
+        "diagramId": f"diagram-{version}",
+        "components": [{
+            "componentId": "comp_1",
+            "type": "CLASS",
+            "name": "UserService",
+            "positionX": 0.0,
+            "positionY": 0.0,
+            "methods": [{"methodId": method_id, "name": "find", "signature": "void find()", "body": body}],
+        }],
+        "connections": [],
+        "dto": [],
+        "metadata": {"metadataId": f"meta-{version}", "version": version, "lastModified": datetime(2026, 1, version)},
+    }
+
+
+def _delta_document(previous: dict, head: dict) -> dict:
+    """_compact_previous와 같은 방식으로 만든 역방향 델타 문서"""
+    return {
+        "_id": previous["_id"],
+        "projectId": previous["projectId"],
+        "apiId": previous["apiId"],
+        "diagramId": previous["diagramId"],
+        "metadata": previous["metadata"],
+        "storageType": DELTA_STORAGE_TYPE,
+        "baseVersion": head["metadata"]["version"],
+        "delta": diff_diagram(head, previous),
+        "positions": component_positions(previous),
+    }
+
+
+def _document(version: int, component_ids) -> dict:
+    return {
+        "projectId": "project",
+        "apiId": "api",
+        "metadata": {"version": version, "lastModified": datetime(2026, 1, 1)},
+        "components": [
+            {"componentId": component_id, "positionX": 0.0, "positionY": 0.0} for component_id in component_ids
+        ],
+    }
+
+
+class TestDiagramRepositoryImpl:
+    """DiagramRepositoryImpl 테스트 클래스"""
+
+    @pytest.fixture
+    def repository(self):
+        return DiagramRepositoryImpl()
+
+    @pytest.mark.asyncio
+    async def test_update_component_positions(self, repository):
+        """최신 버전의 컴포넌트 좌표만 업데이트하고 반환하는지 테스트"""
+        documents = [_document(1, ["comp_1", "comp_2"]), _document(2, ["comp_1", "comp_2"])]
+        repository.repository._collection = FakeDiagramCollection(documents)
+
+        updated = await repository.update_component_positions("project", "api", {"comp_1": (10.0, 20.0)})
+
+        assert updated == [{"componentId": "comp_1", "positionX": 10.0, "positionY": 20.0}]
+        assert documents[0]["components"][0]["positionX"] == 0.0
+        # 최신 버전 선택과 저장을 한 번의 요청으로 처리
+        assert repository.repository._collection.updates == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_component_writes_nothing(self, repository):
+        """찾을 수 없는 컴포넌트가 하나라도 있으면 어떤 좌표도 저장하지 않는지 테스트"""
+        documents = [_document(2, ["comp_1", "comp_2"])]
+        before = copy.deepcopy(documents)
+        repository.repository._collection = FakeDiagramCollection(documents)
+        repository._invalidate_latest = AsyncMock()
+
+        updated = await repository.update_component_positions(
+            "project", "api", {"comp_1": (10.0, 20.0), "unknown": (1.0, 2.0)}
+        )
+
+        assert updated is None
+        assert documents == before
+        repository._invalidate_latest.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_find_many_materializes_delta_versions(self, repository):
+        """find_many가 델타로 저장된 이전 버전을 전체 문서로 복원해 반환하는지 테스트"""
+        versions = [_full_document(version, f"{{ v{version}(); }}") for version in (1, 2, 3)]
+        documents = [versions[0], _delta_document(versions[1], versions[2]), versions[2]]
+        repository.repository._collection = FakeDiagramCollection(documents)
+
+        diagrams = await repository.find_many({"projectId": "project", "apiId": "api"}, [("metadata.version", 1)])
+
+        assert [diagram.model_dump(by_alias=True) for diagram in diagrams] == [
+            Diagram(**version).model_dump(by_alias=True) for version in versions
+        ]
+        one = await repository.find_one({"metadata.version": 2})
+        assert one.find_method("m_1").body == "{ v2(); }"
+
+    @pytest.mark.asyncio
+    async def test_save_evicts_materialized_version(self, repository):
+        """델타로 저장된 버전을 덮어쓰면 복원해 둔 문서를 제거하는지 테스트"""
+        head = _full_document(3, "{ v3(); }")
+        documents = [_delta_document(_full_document(2, "{ v2(); }"), head), head]
+        repository.repository._collection = FakeDiagramCollection(documents)
+        repository._index_methods = AsyncMock()
+
+        await repository.find_by_project_api_version("project", "api", 2)
+        assert ("project", "api", 2) in repository._materialized
+
+        await repository.on_saved(Diagram(**_full_document(2, "{ edited(); }")), inserted=False)
+
+        assert ("project", "api", 2) not in repository._materialized
+
+    @pytest.mark.asyncio
+    async def test_method_fallback_stops_at_first_snapshot(self, repository, monkeypatch):
+        """methodId 색인에 없는 메서드는 최신 버전과 첫 스냅샷 사이의 델타 버전만 복원하여 찾는지 테스트"""
+        versions = [_full_document(version, "{}", method_id=f"m_v{version}") for version in range(1, 6)]
+        # 버전 2는 스냅샷이므로 전체 문서로 유지되고, 버전 1은 스냅샷보다 오래된 델타
+        documents = [
+            _delta_document(versions[0], versions[1]),
+            versions[1],
+            _delta_document(versions[2], versions[3]),
+            _delta_document(versions[3], versions[4]),
+            versions[4],
+        ]
+        repository.repository._collection = FakeDiagramCollection(documents)
+        repository.find_latest_by_project_api = AsyncMock(return_value=Diagram(**versions[4]))
+        repository._index_methods = AsyncMock()
+
+        class EmptyIndex:
+            async def find_one(self, *args, **kwargs):
+                return None
+
+        monkeypatch.setattr(
+            diagram_repository_impl.MongoDBConnection, "connect",
+            AsyncMock(return_value={repository.method_index_collection_name: EmptyIndex()}),
+        )
+        # 전체 문서의 $elemMatch 검색에서는 찾지 못한 경우
+        repository.repository.find_one = AsyncMock(return_value=None)
+        restore = repository.find_by_project_api_version
+        repository.find_by_project_api_version = AsyncMock(side_effect=restore)
+
+        diagram = await repository.find_diagram_by_method_id("project", "api", "m_v3")
+        assert diagram.metadata.version == 3
+
+        repository.find_by_project_api_version.reset_mock()
+        with pytest.raises(ValueError):
+            await repository.find_diagram_by_method_id("project", "api", "m_v1")
+        # 버전 4, 3만 복원하고 스냅샷(버전 2)에서 멈춤
+        assert [call.args[2] for call in repository.find_by_project_api_version.await_args_list] == [4, 3]
+
+    @pytest.mark.asyncio
+    async def test_index_methods_uses_single_bulk_write(self, repository, monkeypatch):
+        """methodId 색인을 한 번의 bulk_write로 갱신하고 새 diagramId면 삭제를 생략하는지 테스트"""
+        index = AsyncMock()
+        monkeypatch.setattr(
+            diagram_repository_impl.MongoDBConnection, "connect",
+            AsyncMock(return_value={repository.method_index_collection_name: index}),
+        )
+        diagram = Diagram(**_full_document(1, "{}"))
+
+        await repository._index_methods(diagram, remove_stale=False)
+        operations = index.bulk_write.await_args.args[0]
+        assert [type(operation) for operation in operations] == [diagram_repository_impl.UpdateOne]
+        assert operations[0]._filter == {"diagramId": "diagram-1", "methodId": "m_1"}
+
+        await repository._index_methods(diagram)
+        operations = index.bulk_write.await_args.args[0]
+        assert type(operations[-1]) is diagram_repository_impl.DeleteMany
+        assert operations[-1]._filter == {"diagramId": "diagram-1", "methodId": {"$nin": ["m_1"]}}
+        assert index.bulk_write.await_count == 2
+        index.delete_many.assert_not_awaited()
+        index.insert_many.assert_not_awaited()
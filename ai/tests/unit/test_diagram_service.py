@@ -0,0 +1,113 @@
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+from fastapi import HTTPException
+
+from app.api.dto.diagram_dto import PositionRequest, ComponentPositionBatchRequest, ComponentPositionRequest, \
+    DiagramResponse
+from app.core.diagram.diagram_service import DiagramService
+from app.infrastructure.mongodb.repository.model.diagram_model import Diagram
+
+
+class TestDiagramService:
+    """DiagramService의 테스트 클래스"""
+
+    @pytest.fixture
+    def diagram_repository(self):
+        """
+        테스트를 위한 DiagramRepository mock 설정
+        """
+        return MagicMock()
+
+    @pytest.mark.asyncio
+    async def test_update_component_positions(self, diagram_repository):
+        """여러 컴포넌트 위치를 한 번의 저장소 호출로 업데이트하고 좌표만 반환하는지 테스트"""
+        diagram_repository.update_component_positions = AsyncMock(return_value=[
+            {"componentId": "comp_1", "positionX": 10.0, "positionY": 20.0},
+            {"componentId": "comp_2", "positionX": 30.0, "positionY": 40.0},
+        ])
+        diagram_service = DiagramService(diagram_repository=diagram_repository)
+
+        response = await diagram_service.update_component_positions(
+            "project", "api",
+            ComponentPositionBatchRequest(positions=[
+                ComponentPositionRequest(componentId="comp_1", x=10.0, y=20.0),
+                ComponentPositionRequest(componentId="comp_2", x=30.0, y=40.0),
+            ])
+        )
+
+        diagram_repository.update_component_positions.assert_awaited_once_with(
+            "project", "api", {"comp_1": (10.0, 20.0), "comp_2": (30.0, 40.0)}
+        )
+        assert [c.componentId for c in response.content] == ["comp_1", "comp_2"]
+        assert response.content[1].positionY == 40.0
+
+    @pytest.mark.asyncio
+    async def test_update_unknown_component_position(self, diagram_repository):
+        """찾을 수 없는 컴포넌트의 위치를 업데이트하면 404 오류가 발생하는지 테스트"""
+        diagram_repository.update_component_positions = AsyncMock(return_value=None)
+        diagram_service = DiagramService(diagram_repository=diagram_repository)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await diagram_service.update_component_position("project", "api", "unknown", PositionRequest(x=1, y=2))
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_validate_exist_diagram_uses_exists(self, diagram_repository):
+        """다이어그램 존재 확인 시 문서를 조회하지 않고 exists 경로를 사용하는지 테스트"""
+        diagram_repository.exists = AsyncMock(return_value=True)
+        diagram_repository.find_many = AsyncMock()
+        diagram_service = DiagramService(diagram_repository=diagram_repository)
+
+        with pytest.raises(ValueError):
+            await diagram_service.validate_exist_diagram("project", "api")
+
+        diagram_repository.exists.assert_awaited_once_with({"projectId": "project", "apiId": "api"})
+        diagram_repository.find_many.assert_not_awaited()
+
+    def test_serialize_raw_diagram(self):
+        """RawBSONDocument 직렬화 결과가 Diagram 모델을 거친 응답과 같은지 테스트"""
+        document = {
+            "projectId": "project",
+            "apiId": "api",
+            "diagramId": "diagram",
+            "components": [{
+                "componentId": "comp_1",
+                "type": "CLASS",
+                "name": "UserService",
+                "positionX": 100.0,
+                "positionY": 200.0,
+                "methods": [{"methodId": "m_1", "name": "getUser", "signature": "User getUser()", "body": "{}"}],
+            }],
+            "connections": [{"connectionId": "c_1", "sourceMethodId": "m_1", "targetMethodId": "m_1", "type": "SOLID"}],
+            "dto": [{"dtoId": "d_1", "name": "UserDto", "body": "record UserDto() {}"}],
+            "metadata": {"metadataId": "meta", "version": 3, "lastModified": datetime(2025, 1, 1, 12, 30)},
+        }
+        raw_diagram = RawBSONDocument(bson.encode(document))
+
+        expected = DiagramResponse.model_validate(Diagram(**document)).model_dump(mode="json")
+
+        assert json.loads(DiagramService.serialize_raw_diagram(raw_diagram)) == expected
+
+    def test_find_method_by_location(self):
+        """methodId 위치 색인으로 메서드를 찾고, 같은 ID가 반복되면 첫 번째 위치를 사용하는지 테스트"""
+        diagram = Diagram(**{
+            "diagramId": "diagram",
+            "components": [
+                {"componentId": "comp_1", "type": "CLASS", "name": "A", "positionX": 0, "positionY": 0,
+                 "methods": [{"methodId": "m_1", "name": "a", "signature": "void a()"}]},
+                {"componentId": "comp_2", "type": "CLASS", "name": "B", "positionX": 0, "positionY": 0,
+                 "methods": [{"methodId": "m_2", "name": "b", "signature": "void b()"},
+                             {"methodId": "m_1", "name": "c", "signature": "void c()"}]},
+            ],
+            "metadata": {"metadataId": "meta", "version": 1, "lastModified": datetime(2025, 1, 1)},
+        })
+
+        assert diagram.method_locations() == {"m_1": (0, 0), "m_2": (1, 0)}
+        assert diagram.find_method("m_2").name == "b"
+        assert diagram.find_method("m_1").name == "a"
+        assert diagram.find_method("unknown") is None
@@ -0,0 +1,57 @@
+import pytest
+from pymongo.errors import OperationFailure
+
+from app.infrastructure.mongodb.connection.indexes import INDEXES, IndexCreationError, ensure_indexes
+
+
+class FakeIndexCollection:
+    def __init__(self, name, db):
+        self.name = name
+        self.db = db
+
+    async def create_indexes(self, indexes):
+        names = [index.document["name"] for index in indexes]
+        if any(f"{self.name}.{name}" in self.db.conflicts for name in names):
+            raise OperationFailure("Index build failed: E11000 duplicate key error")
+        self.db.created.extend(f"{self.name}.{name}" for name in names)
+        return names
+
+
+class FakeIndexDatabase:
+    """지정한 인덱스 생성만 실패시키는 데이터베이스 대용"""
+
+    def __init__(self, conflicts):
+        self.conflicts = set(conflicts)
+        self.created = []
+
+    def __getitem__(self, name):
+        return FakeIndexCollection(name, self)
+
+
+def _all_index_keys():
+    return {f"{collection}.{index.document['name']}" for collection, indexes in INDEXES.items() for index in indexes}
+
+
+class TestEnsureIndexes:
+    """ensure_indexes 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_conflict_does_not_block_other_indexes(self):
+        """한 인덱스가 기존 데이터와 충돌해도 같은 컬렉션의 나머지 인덱스는 생성하는지 테스트"""
+        db = FakeIndexDatabase(["diagrams.components_methods_methodId"])
+
+        failures = await ensure_indexes(db)
+
+        assert list(failures) == ["diagrams.components_methods_methodId"]
+        assert set(db.created) == _all_index_keys() - {"diagrams.components_methods_methodId"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("index_key", ["diagrams.projectId_apiId_version", "diagrams.diagramId_unique"])
+    async def test_required_index_failure_raises(self, index_key):
+        """필수 인덱스를 생성하지 못하면 나머지 인덱스를 생성한 뒤 IndexCreationError를 발생시키는지 테스트"""
+        db = FakeIndexDatabase([index_key])
+
+        with pytest.raises(IndexCreationError, match=index_key):
+            await ensure_indexes(db)
+
+        assert set(db.created) == _all_index_keys() - {index_key}
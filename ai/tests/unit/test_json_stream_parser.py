@@ -0,0 +1,76 @@
+import json
+
+from app.core.generator.json_stream_parser import StreamingJsonFieldExtractor
+
+
+def _feed_all(extractor: StreamingJsonFieldExtractor, tokens) -> dict:
+    values = {}
+    for token in tokens:
+        for path, text in extractor.feed(token):
+            values[path] = values.get(path, "") + text
+    return values
+
+
+class TestStreamingJsonFieldExtractor:
+    """StreamingJsonFieldExtractor의 테스트 클래스"""
+
+    def test_extract_message_split_across_tokens(self):
+        """토큰 경계와 무관하게 message 값만 증분으로 추출되는지 테스트"""
+        document = json.dumps({"status": "EXPLANATION", "message": "메서드 설명입니다"}, ensure_ascii=False)
+        extractor = StreamingJsonFieldExtractor()
+
+        deltas = [extractor.feed(char) for char in document]
+
+        assert "".join(text for delta in deltas for _, text in delta) == "메서드 설명입니다"
+        assert all(path == "message" for delta in deltas for path, _ in delta)
+
+    def test_decode_escapes(self):
+        """\\n, \\", \\uXXXX, 서로게이트 쌍 이스케이프가 디코딩되는지 테스트"""
+        message = 'public void run() {\n    log("ok\\\\");\n}\t😀 é'
+        document = json.dumps({"message": message}, ensure_ascii=True)
+        extractor = StreamingJsonFieldExtractor()
+
+        # 이스케이프 시퀀스가 토큰 경계에서 잘리도록 3글자씩 입력
+        tokens = [document[i:i + 3] for i in range(0, len(document), 3)]
+
+        assert _feed_all(extractor, tokens) == {"message": message}
+
+    def test_extract_nested_field_paths(self):
+        """중첩 객체와 배열 인덱스 경로의 값을 추출하는지 테스트"""
+        document = json.dumps({
+            "status": "MODIFIED",
+            "message": "top",
+            "detail": {"message": "nested", "count": 3, "flags": [True, None]},
+            "items": [{"name": "first"}, {"name": "second"}, []],
+        })
+        extractor = StreamingJsonFieldExtractor(["detail.message", "items.1.name"])
+
+        assert _feed_all(extractor, [document]) == {"detail.message": "nested", "items.1.name": "second"}
+
+    def test_ignore_code_fence_and_keys(self):
+        """코드 펜스와 키 이름에 있는 "message" 문자열을 값으로 오인하지 않는지 테스트"""
+        extractor = StreamingJsonFieldExtractor()
+        tokens = ['```json\n{"note": "\\"message\\": fake", ', '"message"', ': "real"}\n```']
+
+        assert _feed_all(extractor, tokens) == {"message": "real"}
+
+    def test_linear_cost_for_long_message(self):
+        """긴 응답을 토큰 단위로 입력해도 이전 토큰을 다시 파싱하지 않고 각 문자를 한 번만 처리하는지 테스트"""
+
+        class CountingExtractor(StreamingJsonFieldExtractor):
+            consumed = 0
+
+            def _consume_string_char(self, char, deltas):
+                self.consumed += 1
+                super()._consume_string_char(char, deltas)
+
+        for length in (5_000, 50_000):
+            message = "a\nb" * length
+            document = json.dumps({"message": message})
+            extractor = CountingExtractor()
+
+            values = _feed_all(extractor, [document[i:i + 4] for i in range(0, len(document), 4)])
+
+            assert values == {"message": message}
+            # 문자열 밖에서 처리되는 '{', ':', ' ', '}'와 키/값의 여는 따옴표를 제외한 각 문자를 정확히 한 번 처리
+            assert extractor.consumed == len(document) - 6
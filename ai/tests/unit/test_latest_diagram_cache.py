@@ -0,0 +1,130 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.infrastructure.cache.latest_diagram_cache import LatestDiagramCache, CacheGenerationStore
+from app.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from app.infrastructure.mongodb.repository.model.diagram_model import Diagram, Metadata
+
+
+def _diagram(version: int) -> Diagram:
+    return Diagram(
+        projectId="project",
+        apiId="api",
+        diagramId=f"diagram_{version}",
+        metadata=Metadata(metadataId="meta", version=version, lastModified=datetime(2025, 1, 1)),
+    )
+
+
+class FakeGenerationStore(CacheGenerationStore):
+    """다른 워커와 공유되는 세대 번호 저장소 대용"""
+
+    def __init__(self):
+        self.generations = {}
+
+    async def get_generation(self, key: str) -> int:
+        return self.generations.get(key, 0)
+
+    async def bump(self, key: str) -> None:
+        self.generations[key] = self.generations.get(key, 0) + 1
+
+
+class TestTTLLRUCache:
+    """TTLLRUCache 테스트 클래스"""
+
+    def test_evicts_least_recently_used(self):
+        """최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 테스트"""
+        cache = TTLLRUCache(max_size=2, ttl_seconds=0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_expires_after_ttl(self):
+        """만료 시간이 지난 항목은 미적중으로 처리되는지 테스트"""
+        now = [0.0]
+        cache = TTLLRUCache(max_size=10, ttl_seconds=5, clock=lambda: now[0])
+        cache.put("a", 1)
+
+        now[0] = 4.9
+        assert cache.get("a") == 1
+        now[0] = 5.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+
+class TestLatestDiagramCache:
+    """LatestDiagramCache 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_read_through_and_invalidate(self):
+        """두 번째 조회는 캐시에서 반환하고, 무효화 후에는 다시 조회하는지 테스트"""
+        cache = LatestDiagramCache(max_size=10, ttl_seconds=60)
+        loader = AsyncMock(side_effect=[_diagram(1), _diagram(2)])
+
+        assert (await cache.get_or_load("project", "api", loader)).metadata.version == 1
+        assert (await cache.get_or_load("project", "api", loader)).metadata.version == 1
+        await cache.invalidate("project", "api")
+        assert (await cache.get_or_load("project", "api", loader)).metadata.version == 2
+
+        assert loader.await_count == 2
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+
+    @pytest.mark.asyncio
+    async def test_invalidated_during_load_is_not_cached(self):
+        """조회 중에 저장이 일어나면 조회 결과를 캐시하지 않는지 테스트"""
+        cache = LatestDiagramCache(max_size=10, ttl_seconds=60)
+
+        async def _load_while_saving():
+            await cache.invalidate("project", "api")
+            return _diagram(1)
+
+        await cache.get_or_load("project", "api", _load_while_saving)
+        loader = AsyncMock(return_value=_diagram(2))
+
+        assert (await cache.get_or_load("project", "api", loader)).metadata.version == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_generation_detects_other_worker(self):
+        """다른 워커가 세대 번호를 올리면 캐시된 다이어그램을 버리는지 테스트"""
+        store = FakeGenerationStore()
+        worker_a = LatestDiagramCache(max_size=10, ttl_seconds=60, shared=store)
+        worker_b = LatestDiagramCache(max_size=10, ttl_seconds=60, shared=store)
+        loader = AsyncMock(side_effect=[_diagram(1), _diagram(2)])
+
+        await worker_a.get_or_load("project", "api", loader)
+        await worker_b.invalidate("project", "api")
+
+        assert (await worker_a.get_or_load("project", "api", loader)).metadata.version == 2
+        assert worker_a.stats()["stale"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_generation_is_kept_locally(self):
+        """공유 세대 번호를 보관 시간 동안 워커에 두어 적중 시 공유 계층을 조회하지 않는지 테스트"""
+        now = [0.0]
+        store = FakeGenerationStore()
+        store.get_generation = AsyncMock(side_effect=store.get_generation)
+        worker_a = LatestDiagramCache(max_size=10, ttl_seconds=60, shared=store, generation_ttl_seconds=1,
+                                      clock=lambda: now[0])
+        worker_b = LatestDiagramCache(max_size=10, ttl_seconds=60, shared=store)
+        loader = AsyncMock(side_effect=[_diagram(1), _diagram(2), _diagram(3)])
+
+        await worker_a.get_or_load("project", "api", loader)
+        await worker_a.get_or_load("project", "api", loader)
+        assert store.get_generation.await_count == 1
+
+        # 다른 워커의 변경은 보관 시간이 지난 뒤 반영
+        await worker_b.invalidate("project", "api")
+        assert (await worker_a.get_or_load("project", "api", loader)).metadata.version == 1
+        now[0] = 1.0
+        assert (await worker_a.get_or_load("project", "api", loader)).metadata.version == 2
+
+        # 이 워커의 변경은 바로 반영
+        await worker_a.invalidate("project", "api")
+        assert (await worker_a.get_or_load("project", "api", loader)).metadata.version == 3
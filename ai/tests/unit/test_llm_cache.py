@@ -0,0 +1,61 @@
+import pytest
+from langchain_core.language_models import FakeListChatModel
+
+from app.core.llm.llm_cache import LLMResponseCache, llm_cache_key
+from app.infrastructure.cache.llm_cache_store import SQLiteLLMCacheStore
+
+
+class TestLLMResponseCache:
+    """LLMResponseCache 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_uses_cache(self):
+        """같은 프롬프트는 LLM을 다시 호출하지 않고 캐시된 응답을 반환하는지 테스트"""
+        cache = LLMResponseCache(max_size=10, ttl_seconds=0)
+        llm = FakeListChatModel(responses=["첫 번째", "두 번째"], cache=cache)
+
+        assert (await llm.ainvoke("같은 프롬프트")).content == "첫 번째"
+        assert (await llm.ainvoke("같은 프롬프트")).content == "첫 번째"
+        assert (await llm.ainvoke("다른 프롬프트")).content == "두 번째"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sqlite_store_survives_restart(self, tmp_path):
+        """메모리 계층이 비어 있어도 SQLite 영속 계층에 저장된 응답을 사용하는지 테스트"""
+        path = str(tmp_path / "llm_cache.sqlite3")
+        first = LLMResponseCache(max_size=10, ttl_seconds=0, store=SQLiteLLMCacheStore(path, 0, 100))
+        responses = ["저장된 응답", "새 응답"]
+        await FakeListChatModel(responses=responses, cache=first).ainvoke("프롬프트")
+
+        # 같은 모델 설정으로 재시작한 워커 (LLM이 호출되면 "새 응답"을 반환)
+        second = LLMResponseCache(max_size=10, ttl_seconds=0, store=SQLiteLLMCacheStore(path, 0, 100))
+        result = await FakeListChatModel(responses=responses, i=1, cache=second).ainvoke("프롬프트")
+
+        assert result.content == "저장된 응답"
+        assert second.stats()["store_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_corrupt_store_entry_is_a_miss(self, tmp_path):
+        """영속 계층의 값을 복원할 수 없으면 예외 없이 미적중으로 처리하고 영속 계층 오류로 집계하는지 테스트"""
+        store = SQLiteLLMCacheStore(str(tmp_path / "llm_cache.sqlite3"), 0, 100)
+        cache = LLMResponseCache(max_size=10, ttl_seconds=0, store=store)
+        await store.put(llm_cache_key("프롬프트", "모델 설정"), "{손상된 값")
+
+        assert await cache.alookup("프롬프트", "모델 설정") is None
+        assert cache.stats()["store_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_store_limits_size(self, tmp_path):
+        """SQLite 영속 계층이 최대 크기를 넘으면 가장 오래 사용되지 않은 값을 제거하는지 테스트"""
+        store = SQLiteLLMCacheStore(str(tmp_path / "llm_cache.sqlite3"), 0, 2)
+        await store.put("a", "1")
+        await store.put("b", "2")
+        await store.get("a")
+        await store.put("c", "3")
+
+        assert await store.get("a") == "1"
+        assert await store.get("b") is None
+        assert await store.get("c") == "3"
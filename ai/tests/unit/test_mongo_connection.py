@@ -0,0 +1,50 @@
+import pytest
+from pymongo.errors import ConnectionFailure
+
+from app.infrastructure.mongodb.connection import connection
+from app.infrastructure.mongodb.connection.connection import MongoDBConnection
+
+
+class FailingAdmin:
+    async def command(self, name):
+        raise ConnectionFailure("ping 실패")
+
+
+class FakeMotorClient:
+    """ping이 항상 실패하는 MongoDB 클라이언트 대용"""
+
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.admin = FailingAdmin()
+        self.closed = False
+        FakeMotorClient.instances.append(self)
+
+    def __getitem__(self, name):
+        return object()
+
+    def close(self):
+        self.closed = True
+
+
+class TestMongoDBConnection:
+    """MongoDBConnection 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_can_retry(self, monkeypatch):
+        """ping에 실패하면 클라이언트를 닫고 초기화하여 다음 connect()에서 다시 연결하는지 테스트"""
+        FakeMotorClient.instances = []
+        monkeypatch.setattr(connection, "AsyncIOMotorClient", FakeMotorClient)
+        monkeypatch.setattr(MongoDBConnection, "_client", None)
+        monkeypatch.setattr(MongoDBConnection, "_db", None)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionFailure):
+                await MongoDBConnection.connect()
+            assert MongoDBConnection._client is None
+            assert MongoDBConnection._db is None
+
+        assert len(FakeMotorClient.instances) == 2
+        assert all(client.closed for client in FakeMotorClient.instances)
+        with pytest.raises(ConnectionError):
+            MongoDBConnection.get_database()
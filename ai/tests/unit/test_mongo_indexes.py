@@ -0,0 +1,90 @@
+import os
+import uuid
+from typing import Any, List
+
+import pytest
+import pytest_asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError
+
+from app.infrastructure.mongodb.connection.indexes import ensure_indexes
+
+# 실행 계획 검사는 실제 MongoDB가 필요하므로 MONGO_TEST_URI가 설정된 경우에만 실행
+MONGO_TEST_URI = os.getenv("MONGO_TEST_URI")
+
+# 저장소에서 자주 실행되는 쿼리 (컬렉션, 필터, 정렬)
+HOT_QUERIES = [
+    # DiagramRepositoryImpl.find_latest_by_project_api
+    ("diagrams", {"projectId": "p", "apiId": "a"}, [("metadata.version", -1)]),
+    # DiagramRepositoryImpl.find_by_project_api_version
+    ("diagrams", {"projectId": "p", "apiId": "a", "metadata.version": 1}, None),
+    # DiagramRepositoryImpl.find_diagram_by_method_id
+    ("diagram_method_index", {"projectId": "p", "apiId": "a", "methodId": "m"}, [("version", -1)]),
+    # DiagramRepositoryImpl.find_diagram_by_method_id (methodId 색인이 없는 경우)
+    ("diagrams", {
+        "projectId": "p",
+        "apiId": "a",
+        "components": {"$elemMatch": {"methods": {"$elemMatch": {"methodId": "m"}}}},
+    }, None),
+    # DiagramRepositoryImpl.save
+    ("diagrams", {"diagramId": "d"}, None),
+    # ChatRepositoryImpl.get_prompts
+    ("chats", {"projectId": "p", "apiId": "a"}, [("createdAt", 1)]),
+]
+
+
+def _plan_stages(plan: Any) -> List[str]:
+    """실행 계획에 포함된 모든 stage 이름을 반환합니다."""
+    if isinstance(plan, dict):
+        stages = [plan["stage"]] if "stage" in plan else []
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+        return stages
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _plan_stages(item)]
+    return []
+
+
+@pytest_asyncio.fixture
+async def index_test_db():
+    client = AsyncIOMotorClient(MONGO_TEST_URI)
+    db = client[f"scrud_index_test_{uuid.uuid4().hex[:8]}"]
+    await ensure_indexes(db)
+    yield db
+    await client.drop_database(db.name)
+    client.close()
+
+
+class TestMongoIndexes:
+    """MongoDB 인덱스 정의의 테스트 클래스"""
+
+    def test_plan_stages_detects_collscan(self):
+        """중첩된 실행 계획에서 COLLSCAN 단계를 찾아내는지 테스트"""
+        plan = {"stage": "SORT", "inputStage": {"stage": "FETCH", "inputStage": {"stage": "COLLSCAN"}}}
+
+        assert _plan_stages(plan) == ["SORT", "FETCH", "COLLSCAN"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not MONGO_TEST_URI, reason="MONGO_TEST_URI가 설정되지 않았습니다")
+    @pytest.mark.parametrize("collection_name, query, sort", HOT_QUERIES)
+    async def test_hot_query_uses_index(self, index_test_db, collection_name, query, sort):
+        """자주 실행되는 쿼리가 컬렉션 전체 스캔(COLLSCAN) 없이 인덱스를 사용하는지 테스트"""
+        cursor = index_test_db[collection_name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+
+        plan = await cursor.explain()
+        stages = _plan_stages(plan["queryPlanner"]["winningPlan"])
+
+        assert "COLLSCAN" not in stages
+        assert "SORT" not in stages
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not MONGO_TEST_URI, reason="MONGO_TEST_URI가 설정되지 않았습니다")
+    async def test_duplicate_version_is_rejected(self, index_test_db):
+        """같은 (projectId, apiId, metadata.version)의 다이어그램은 저장되지 않는지 테스트"""
+        diagrams = index_test_db["diagrams"]
+        await diagrams.insert_one({"projectId": "p", "apiId": "a", "diagramId": "d1", "metadata": {"version": 1}})
+
+        with pytest.raises(DuplicateKeyError):
+            await diagrams.insert_one({"projectId": "p", "apiId": "a", "diagramId": "d2", "metadata": {"version": 1}})
@@ -0,0 +1,37 @@
+from app.core.models.global_setting_model import GlobalFileListChainPayload
+from app.utils.prompt_builder import PromptBuilder
+
+GlobalFile = GlobalFileListChainPayload.GlobalFileChainPayload
+
+
+def _global_files(*files: GlobalFile) -> GlobalFileListChainPayload:
+    return GlobalFileListChainPayload(
+        project=GlobalFileListChainPayload.ScrudProjectChainPayload(title="프로젝트"),
+        content=list(files),
+    )
+
+
+class TestGlobalFileListPrompt:
+    """글로벌 파일 프롬프트 테스트 클래스"""
+
+    def test_file_number_follows_position(self):
+        """파일 순서가 바뀌면 파일 번호가 새 위치를 따르는지 테스트"""
+        erd = GlobalFile(globalFileId=101, fileName="erd.sql", fileType="ERD", fileContent="CREATE TABLE a;")
+        security = GlobalFile(globalFileId=102, fileName="jwt", fileType="SECURITY_DEFAULT_JWT", fileContent="jwt")
+
+        PromptBuilder.build_global_file_list_prompt(_global_files(erd, security))
+        prompt = PromptBuilder.build_global_file_list_prompt(_global_files(security, erd))
+
+        assert "파일 1\n파일명: jwt\n파일 유형: SECURITY_DEFAULT_JWT (JWT 기반 기본 보안 설정 파일)" in prompt
+        assert "파일 2\n파일명: erd.sql\n파일 유형: ERD (Database Entity Table)" in prompt
+
+    def test_changed_content_is_rendered_again(self):
+        """같은 globalFileId와 길이라도 내용이 바뀌면 새 내용으로 프롬프트를 만드는지 테스트"""
+        before = GlobalFile(globalFileId=201, fileName="req.md", fileType="REQUIREMENTS", fileContent="v1")
+        after = before.model_copy(update={"fileContent": "v2"})
+
+        assert "\nv1\n" in PromptBuilder.build_global_file_list_prompt(_global_files(before))
+        prompt = PromptBuilder.build_global_file_list_prompt(_global_files(after))
+
+        assert "\nv2\n" in prompt
+        assert "\nv1\n" not in prompt
@@ -0,0 +1,97 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.dto.diagram_dto import UserChatRequest
+from app.core.llm.prompt_service import PromptService
+from app.core.models.user_chat_model import SystemChatChainPayload
+from app.infrastructure.cache.response_cache import ResponseCache
+from app.infrastructure.http.client.api_client import GlobalFileList
+from app.infrastructure.mongodb.repository.model.diagram_model import Diagram, Metadata
+
+SCOPE = ResponseCache.make_scope("project", "api", 1, ("method",), "EXPLAIN", "BODY")
+
+
+async def _embed(message: str):
+    """'설명'이 들어간 메시지끼리 같은 방향의 벡터를 반환하는 임베딩 대용"""
+    return [1.0, 0.0] if "설명" in message else [0.0, 1.0]
+
+
+class TestResponseCache:
+    """ResponseCache 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_uses_normalized_message(self):
+        """공백과 대소문자만 다른 메시지가 같은 응답에 적중하는지 테스트"""
+        cache = ResponseCache(max_size=10, ttl_seconds=0)
+        await cache.put(SCOPE, "Explain  this method", "answer")
+
+        assert await cache.get(SCOPE, "  explain this METHOD ") == "answer"
+        assert await cache.get(SCOPE[:2] + (2,) + SCOPE[3:], "explain this method") is None
+
+    @pytest.mark.asyncio
+    async def test_similar_hit(self):
+        """임베딩 유사도가 기준 이상이면 같은 범위의 다른 메시지 응답을 사용하는지 테스트"""
+        cache = ResponseCache(max_size=10, ttl_seconds=0, embedder=_embed, similarity_threshold=0.9)
+        await cache.put(SCOPE, "이 메서드 설명해줘", "answer")
+
+        assert await cache.get(SCOPE, "메서드 설명 부탁해") == "answer"
+        assert await cache.get(SCOPE, "테스트 작성해줘") is None
+        assert cache.stats()["similar_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_removes_api_responses(self):
+        """invalidate가 해당 API의 응답만 제거하는지 테스트"""
+        cache = ResponseCache(max_size=10, ttl_seconds=0, embedder=_embed, similarity_threshold=0.9)
+        other_scope = ResponseCache.make_scope("project", "other", 1)
+        await cache.put(SCOPE, "설명해줘", "answer")
+        await cache.put(other_scope, "설명해줘", "other")
+
+        assert cache.invalidate("project", "api") == 1
+        assert await cache.get(SCOPE, "설명 부탁해") is None
+        assert await cache.get(other_scope, "설명해줘") == "other"
+
+
+class TestPromptServiceResponseCache:
+    """PromptService 응답 캐시 사용 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_replays_cached_response(self, monkeypatch):
+        """같은 요청을 다시 보내면 LLM을 호출하지 않고 캐시된 메시지를 SSE 토큰으로 다시 보내는지 테스트"""
+        monkeypatch.setattr("app.core.llm.prompt_service.settings.RESPONSE_CACHE_REPLAY_CHUNK_SIZE", 4)
+        monkeypatch.setattr("app.core.llm.prompt_service.settings.RESPONSE_CACHE_REPLAY_DELAY_SECONDS", 0)
+        payload = SystemChatChainPayload(
+            status=SystemChatChainPayload.PromptResponseEnum.EXPLANATION,
+            message="캐시된 설명 메시지",
+        )
+        user_chat_chain = MagicMock()
+        user_chat_chain.predict = AsyncMock(return_value=payload)
+        prompt_service = PromptService(
+            user_chat_chain=user_chat_chain,
+            create_diagram_chain=MagicMock(),
+            response_cache=ResponseCache(max_size=10, ttl_seconds=0),
+        )
+        monkeypatch.setattr("app.core.llm.prompt_service.convert_chat_payload", lambda **kwargs: None)
+        monkeypatch.setattr("app.core.llm.prompt_service.DiagramChainPayload.model_validate", lambda diagram: None)
+        chat_request = UserChatRequest(tag="EXPLAIN", promptType="BODY", message="설명해줘", targetMethods=[])
+        diagram = Diagram(
+            projectId="project",
+            apiId="api",
+            diagramId="diagram",
+            metadata=Metadata(metadataId="meta", version=1, lastModified=datetime(2025, 1, 1)),
+        )
+
+        await prompt_service.process_chat_flow(chat_request, GlobalFileList(), diagram)
+        queue = asyncio.Queue()
+        result = await prompt_service.process_chat_flow(chat_request, GlobalFileList(), diagram, queue)
+
+        user_chat_chain.predict.assert_awaited_once()
+        assert result.message == payload.message
+        tokens = []
+        while not queue.empty():
+            tokens.append(json.loads(queue.get_nowait()[len("data: "):])["token"])
+        assert "".join(tokens) == payload.message
+        assert len(tokens) == 3
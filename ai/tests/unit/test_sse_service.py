@@ -0,0 +1,295 @@
+import asyncio
+import json
+
+import pytest
+
+from app.config.config import settings
+from app.core.services.sse_service import SSEService
+from app.infrastructure.sse.memory_stream_broker import InMemoryStreamBroker
+from app.infrastructure.sse.mongo_stream_broker import MongoStreamBroker
+from app.infrastructure.sse.stream_broker import StreamBrokerFactory
+
+
+class SharedMemoryStreamBroker(InMemoryStreamBroker):
+    """여러 워커가 공유하는 브로커 대용 (제어 메시지를 프로세스 내 큐로 전달)"""
+
+    shared = True
+
+    def __init__(self):
+        super().__init__()
+        self.controls = {}
+
+    async def publish_control(self, stream_id, control):
+        self.controls.setdefault(stream_id, asyncio.Queue()).put_nowait(control)
+
+    async def watch_control(self, stream_id):
+        queue = self.controls.setdefault(stream_id, asyncio.Queue())
+        while True:
+            yield await queue.get()
+
+
+def _matches(document, filter_dict) -> bool:
+    for field, condition in filter_dict.items():
+        value = document.get(field)
+        if isinstance(condition, dict):
+            if "$gt" in condition and not (value is not None and value > condition["$gt"]):
+                return False
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, field, direction):
+        self.documents.sort(key=lambda d: d[field], reverse=direction < 0)
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.documents:
+            raise StopAsyncIteration
+        return self.documents.pop(0)
+
+
+class FakeCappedCollection:
+    """MongoStreamBroker가 사용하는 삽입과 조회만 처리하는 capped 컬렉션 대용"""
+
+    def __init__(self):
+        self.documents = []
+
+    async def insert_one(self, document):
+        self.documents.append(document)
+
+    async def insert_many(self, documents):
+        self.documents.extend(documents)
+
+    def find(self, filter_dict):
+        return FakeCursor([d for d in self.documents if _matches(d, filter_dict)])
+
+    async def find_one(self, filter_dict, projection=None):
+        return next((d for d in self.documents if _matches(d, filter_dict)), None)
+
+    async def count_documents(self, filter_dict):
+        return sum(1 for d in self.documents if _matches(d, filter_dict))
+
+
+def _worker(monkeypatch, broker) -> SSEService:
+    """싱글톤을 우회하여 같은 브로커를 공유하는 별도 워커의 SSEService를 생성"""
+    monkeypatch.setattr(SSEService, "_instance", None)
+    return SSEService(broker)
+
+
+class TestInMemoryStreamBroker:
+    """InMemoryStreamBroker의 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_until_close(self):
+        """생산자가 넣은 이벤트를 종료 신호까지 순서대로 구독하는지 테스트"""
+        broker = InMemoryStreamBroker()
+        queue = await broker.open("stream-1")
+
+        queue.put_nowait("data: 1")
+        queue.put_nowait("data: 2")
+        queue.put_nowait(None)
+
+        assert await broker.exists("stream-1")
+        assert [event async for event in broker.subscribe("stream-1")] == [(1, "data: 1"), (2, "data: 2")]
+
+        await broker.remove("stream-1")
+        assert not await broker.exists("stream-1")
+
+    @pytest.mark.asyncio
+    async def test_subscribe_unknown_stream(self):
+        """존재하지 않는 스트림 구독 시 이벤트 없이 종료되는지 테스트"""
+        broker = InMemoryStreamBroker()
+
+        assert [event async for event in broker.subscribe("unknown")] == []
+
+    @pytest.mark.asyncio
+    async def test_resume_with_last_event_id(self):
+        """연결이 끊긴 뒤 Last-Event-ID 이후의 이벤트를 재전송하고 실시간 구독을 이어가는지 테스트"""
+        broker = InMemoryStreamBroker()
+        queue = await broker.open("stream-1")
+        queue.put_nowait("data: 1")
+        queue.put_nowait("data: 2")
+
+        # 두 번째 이벤트를 응답에 쓰기 전에 연결이 끊긴 경우 (클라이언트는 1번까지 수신)
+        subscription = broker.subscribe("stream-1")
+        assert await subscription.__anext__() == (1, "data: 1")
+        assert await subscription.__anext__() == (2, "data: 2")
+        await subscription.aclose()
+        assert await broker.exists("stream-1")
+
+        queue.put_nowait("data: 3")
+        queue.put_nowait(None)
+
+        events = [event async for event in broker.subscribe("stream-1", last_event_id=1)]
+        assert events == [(2, "data: 2"), (3, "data: 3")]
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_drops_oldest(self):
+        """큐가 가득 차면 가장 오래된 이벤트를 버리고 종료 신호는 유지하는지 테스트"""
+        broker = InMemoryStreamBroker(max_queue_size=2, overflow_policy="drop_oldest")
+        queue = await broker.open("stream-1")
+
+        for i in range(4):
+            queue.put_nowait(f"data: {i}")
+        queue.put_nowait(None)
+
+        assert [event async for event in broker.subscribe("stream-1")] == [(1, "data: 3")]
+        assert broker.stats()["droppedEvents"] == 3
+
+    @pytest.mark.asyncio
+    async def test_reap_orphaned_stream(self):
+        """구독자가 연결되지 않은 스트림이 정리되고 이후 이벤트가 버려지는지 테스트"""
+        broker = InMemoryStreamBroker()
+        queue = await broker.open("orphan")
+        queue.put_nowait("data: 1")
+
+        assert broker.stats()["orphaned"] == 1
+        assert await broker.reap(connect_timeout=0, idle_timeout=60) == 1
+        assert not await broker.exists("orphan")
+
+        queue.put_nowait("data: 2")
+        assert queue.qsize() == 0
+        assert broker.stats()["reapedTotal"] == 1
+
+    @pytest.mark.asyncio
+    async def test_control_messages_are_noops(self):
+        """공유되지 않는 브로커의 제어 메시지 전송과 구독은 아무것도 하지 않는지 테스트"""
+        broker = InMemoryStreamBroker()
+
+        await broker.publish_control("stream-1", InMemoryStreamBroker.DETACH)
+
+        assert [control async for control in broker.watch_control("stream-1")] == []
+
+    def test_create_unsupported_broker(self):
+        """지원하지 않는 브로커 유형 요청 시 ValueError 발생 테스트"""
+        with pytest.raises(ValueError):
+            StreamBrokerFactory.create_broker("unknown")
+
+    @pytest.mark.asyncio
+    async def test_sse_service_stream_round_trip(self):
+        """SSEService를 통한 스트림 생성, 전송, 구독 테스트"""
+        sse_service = SSEService()
+        stream_id, queue = await sse_service.create_stream()
+
+        await sse_service.send_progress(queue, "진행 중")
+        await sse_service.close_stream(queue)
+
+        events = [event async for event in sse_service.subscribe(stream_id)]
+        assert len(events) == 1
+        event_id, data = events[0].split("\n", 1)
+        assert event_id == "id: 1"
+        assert json.loads(data) == {"type": "progress", "data": "진행 중"}
+
+    @pytest.mark.asyncio
+    async def test_cancel_stream_task_on_disconnect(self, monkeypatch):
+        """구독자 연결이 끊기고 유예 시간 내에 재연결하지 않으면 스트림 작업이 취소되는지 테스트"""
+        monkeypatch.setattr(settings, "SSE_DISCONNECT_GRACE_SECONDS", 0)
+        sse_service = SSEService()
+        stream_id, queue = await sse_service.create_stream()
+
+        async def _long_running_chain():
+            await sse_service.send_progress(queue, "진행 중")
+            await asyncio.Event().wait()
+
+        task = sse_service.run_stream_task(stream_id, queue, _long_running_chain())
+
+        subscription = sse_service.subscribe(stream_id)
+        await subscription.__anext__()
+        await subscription.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_cancel_stream_task_on_remote_disconnect(self, monkeypatch):
+        """다른 워커에 연결된 구독자의 연결이 끊겨도 스트림 작업을 실행하는 워커에서 작업이 취소되는지 테스트"""
+        monkeypatch.setattr(settings, "SSE_DISCONNECT_GRACE_SECONDS", 0)
+        broker = SharedMemoryStreamBroker()
+        owner = _worker(monkeypatch, broker)
+        subscriber = _worker(monkeypatch, broker)
+        stream_id, queue = await owner.create_stream()
+
+        async def _long_running_chain():
+            await owner.send_progress(queue, "진행 중")
+            await asyncio.Event().wait()
+
+        task = owner.run_stream_task(stream_id, queue, _long_running_chain())
+
+        subscription = subscriber.subscribe(stream_id)
+        await subscription.__anext__()
+        await asyncio.sleep(0)
+        assert owner._remote_subscribers[stream_id] == 1
+        await subscription.aclose()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 1)
+
+
+class TestMongoStreamBroker:
+    """MongoStreamBroker의 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_ends_when_producer_disappears(self):
+        """생산자가 종료 이벤트 없이 사라지면 대기 시간 후 오류 이벤트를 보내고 구독이 끝나는지 테스트"""
+        broker = MongoStreamBroker("sse_events", 0, poll_interval=0.01, max_poll_interval=0.02, idle_timeout=0.05)
+        broker._collection = FakeCappedCollection()
+        await broker._collection.insert_many([
+            {"streamId": "stream-1", "seq": 0, "type": MongoStreamBroker.OPEN},
+            {"streamId": "stream-1", "seq": 1, "type": MongoStreamBroker.DATA, "data": "data: 1"},
+        ])
+
+        events = [event async for event in broker.subscribe("stream-1")]
+
+        assert events[0] == (1, "data: 1")
+        # 재연결 시 Last-Event-ID로 건너뛰지 않도록 종료 이벤트는 새 ID를 사용
+        assert [event_id for event_id, _ in events] == [1, 2, 3, 4]
+        assert "error" in json.loads(events[1][1].removeprefix("data: "))
+        assert events[-1][1].startswith("event: close")
+        assert broker.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_remove_writes_tombstone(self):
+        """remove() 후 다른 워커에서도 스트림이 없는 것으로 보이고 생산자 전송이 종료되는지 테스트"""
+        broker = MongoStreamBroker("sse_events", 0)
+        broker._collection = FakeCappedCollection()
+        queue = await broker.open("stream-1")
+        assert await broker.exists("stream-1")
+
+        await broker.remove("stream-1")
+        queue.put_nowait("data: late")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert not await broker.exists("stream-1")
+        assert broker.stats()["live"] == 0
+        assert [d["type"] for d in broker._collection.documents if "seq" in d] == [
+            MongoStreamBroker.OPEN, MongoStreamBroker.CLOSE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_watch_control_yields_new_messages(self):
+        """제어 메시지를 다시 읽지 않고 새로 기록된 연결/해제 메시지만 전달하는지 테스트"""
+        broker = MongoStreamBroker("sse_events", 0, poll_interval=0.01, max_poll_interval=0.01)
+        broker._collection = FakeCappedCollection()
+        controls = broker.watch_control("stream-1")
+
+        await broker.publish_control("stream-1", MongoStreamBroker.ATTACH)
+        await broker.publish_control("stream-1", MongoStreamBroker.DETACH)
+        await broker.publish_control("other", MongoStreamBroker.ATTACH)
+        assert [await controls.__anext__(), await controls.__anext__()] == [
+            MongoStreamBroker.ATTACH, MongoStreamBroker.DETACH,
+        ]
+
+        await broker.publish_control("stream-1", MongoStreamBroker.ATTACH)
+        assert await asyncio.wait_for(controls.__anext__(), 1) == MongoStreamBroker.ATTACH
+        await controls.aclose()
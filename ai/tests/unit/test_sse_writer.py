@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.core.services.sse_writer import SSEBatchWriter
+
+
+async def _events(items, delay: float = 0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+class TestSSEBatchWriter:
+    """SSEBatchWriter의 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_coalesce_burst_into_single_chunk(self):
+        """시간 창 안에 도착한 이벤트를 하나의 청크로 묶는지 테스트"""
+        writer = SSEBatchWriter(flush_interval=0.05, max_batch_bytes=8192, heartbeat_interval=1)
+
+        chunks = [chunk async for chunk in writer.write(_events(["data: 1", "data: 2", "data: 3"]))]
+
+        assert chunks == ["data: 1\n\ndata: 2\n\ndata: 3\n\n"]
+
+    @pytest.mark.asyncio
+    async def test_flush_on_max_batch_bytes(self):
+        """크기 한도에 도달하면 시간 창과 관계없이 청크를 나누는지 테스트"""
+        writer = SSEBatchWriter(flush_interval=10, max_batch_bytes=20, heartbeat_interval=1)
+
+        chunks = [chunk async for chunk in writer.write(_events(["data: 111111", "data: 222222", "data: 3"]))]
+
+        assert chunks == ["data: 111111\n\ndata: 222222\n\n", "data: 3\n\n"]
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_when_idle(self):
+        """이벤트가 없는 동안 heartbeat 주석을 보내는지 테스트"""
+        writer = SSEBatchWriter(flush_interval=0.001, max_batch_bytes=8192, heartbeat_interval=0.01)
+
+        chunks = [chunk async for chunk in writer.write(_events(["data: 1"], delay=0.05))]
+
+        assert SSEBatchWriter.HEARTBEAT in chunks
+        assert chunks[-1] == "data: 1\n\n"
+
+    @pytest.mark.asyncio
+    async def test_bounded_buffer_stops_reading_events(self):
+        """응답 청크를 읽지 않는 동안 버퍼 크기 이상으로 이벤트를 읽지 않는지 테스트"""
+        writer = SSEBatchWriter(flush_interval=10, max_batch_bytes=1, heartbeat_interval=1, max_buffered_events=2)
+        consumed = []
+
+        async def events():
+            for i in range(10):
+                consumed.append(i)
+                yield f"data: {i}"
+
+        chunks = writer.write(events())
+        assert await chunks.__anext__() == "data: 0\n\n"
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # 응답으로 쓴 이벤트 1개 + 버퍼 2개 + put 대기 중인 1개
+        assert len(consumed) == 4
+        assert [chunk async for chunk in chunks] == [f"data: {i}\n\n" for i in range(1, 10)]
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from app.core.pipeline.stage_graph import StageGraph
+
+
+class TestStageGraph:
+    """StageGraph의 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        """선행 단계가 끝난 뒤 독립적인 단계들이 동시에 실행되는지 테스트"""
+        running = 0
+        max_running = 0
+
+        async def stage(value):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return value
+
+        graph = StageGraph(max_concurrency=3)
+        graph.add_stage("components", lambda results: stage(["component"]))
+        graph.add_stage("dtos", lambda results: stage(results["components"] + ["dto"]), depends_on=["components"])
+        graph.add_stage("connections", lambda results: stage(results["components"] + ["connection"]),
+                        depends_on=["components"])
+
+        results = await graph.run()
+
+        assert results["dtos"] == ["component", "dto"]
+        assert results["connections"] == ["component", "connection"]
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        """동시 실행 수가 max_concurrency를 넘지 않는지 테스트"""
+        running = 0
+        max_running = 0
+
+        async def stage():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        graph = StageGraph(max_concurrency=2)
+        for idx in range(5):
+            graph.add_stage(f"stage-{idx}", lambda results: stage())
+
+        await graph.run()
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_cancels_other_stages(self):
+        """단계 타임아웃 시 TimeoutError가 발생하고 나머지 단계가 취소되는지 테스트"""
+        cancelled = asyncio.Event()
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        async def long_running():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        graph = StageGraph(max_concurrency=2)
+        graph.add_stage("slow", lambda results: slow(), timeout=0.01)
+        graph.add_stage("long", lambda results: long_running())
+
+        with pytest.raises(TimeoutError):
+            await graph.run()
+
+        assert cancelled.is_set()
+
+    def test_unknown_dependency(self):
+        """등록되지 않은 선행 단계를 지정하면 ValueError가 발생하는지 테스트"""
+        graph = StageGraph(max_concurrency=1)
+
+        with pytest.raises(ValueError):
+            graph.add_stage("dtos", lambda results: None, depends_on=["components"])
@@ -0,0 +1,71 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pymongo.errors import AutoReconnect
+
+from app.config.config import settings
+from app.infrastructure.mongodb.repository.model.diagram_model import Chat, Diagram, Metadata
+from app.infrastructure.mongodb.repository.unit_of_work import MongoUnitOfWork
+
+
+def _diagram() -> Diagram:
+    return Diagram(
+        projectId="project",
+        apiId="api",
+        diagramId="diagram",
+        metadata=Metadata(metadataId="meta", version=2, lastModified=datetime(2025, 1, 1)),
+    )
+
+
+def _chat() -> Chat:
+    return Chat(chatId="chat", projectId="project", apiId="api", createdAt=datetime(2025, 1, 1))
+
+
+class TestMongoUnitOfWork:
+    """트랜잭션을 사용하지 않는 경우의 MongoUnitOfWork 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def disable_transactions(self, monkeypatch):
+        monkeypatch.setattr(settings, "MONGO_TRANSACTIONS_ENABLED", False)
+
+    @pytest.fixture
+    def diagram_repository(self):
+        repository = MagicMock()
+        repository.upsert = AsyncMock(return_value=True)
+        repository.on_saved = AsyncMock()
+        repository.delete_by_diagram_id = AsyncMock()
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_commit(self, diagram_repository):
+        """다이어그램 upsert와 채팅 insert 후 저장 후 처리가 실행되는지 테스트"""
+        chat_repository = MagicMock()
+        chat_repository.insert_documents = AsyncMock()
+        unit_of_work = MongoUnitOfWork(diagram_repository, chat_repository)
+        unit_of_work.add_diagram(_diagram())
+        unit_of_work.add_chat(_chat())
+
+        await unit_of_work.commit()
+
+        diagram_repository.upsert.assert_awaited_once()
+        documents = chat_repository.insert_documents.await_args.args[0]
+        assert [document["chatId"] for document in documents] == ["chat"]
+        assert "_id" in documents[0]
+        diagram_repository.on_saved.assert_awaited_once()
+        diagram_repository.delete_by_diagram_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_chat_failure_removes_inserted_diagram(self, diagram_repository):
+        """채팅 저장에 실패하면 새로 삽입한 다이어그램을 삭제하여 고아 버전을 남기지 않는지 테스트"""
+        chat_repository = MagicMock()
+        chat_repository.insert_documents = AsyncMock(side_effect=AutoReconnect("connection reset"))
+        unit_of_work = MongoUnitOfWork(diagram_repository, chat_repository)
+        unit_of_work.add_diagram(_diagram())
+        unit_of_work.add_chat(_chat())
+
+        with pytest.raises(AutoReconnect):
+            await unit_of_work.commit()
+
+        diagram_repository.delete_by_diagram_id.assert_awaited_once_with("diagram")
+        diagram_repository.on_saved.assert_not_awaited()
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from app.core.generator.streaming_handler import SSEStreamingHandler
+from app.core.llm.chains.user_chat_chain import UserChatChain
+from app.core.models.diagram_model import DiagramChainPayload
+from app.core.models.global_setting_model import GlobalFileListChainPayload
+from app.core.models.user_chat_model import UserChatChainPayload
+from app.infrastructure.sse.stream_queue import OverflowPolicy, StreamQueue
+
+
+class StreamingFakeChatModel(GenericFakeChatModel):
+    """항상 토큰 단위 스트리밍으로 응답하는 테스트용 LLM"""
+
+    def _should_stream(self, **kwargs) -> bool:
+        return True
+
+
+def _drain_tokens(queue: asyncio.Queue) -> str:
+    tokens = []
+    while not queue.empty():
+        event = queue.get_nowait()
+        tokens.append(json.loads(event.removeprefix("data: "))["token"])
+    return "".join(tokens)
+
+
+class TestUserChatChain:
+    """UserChatChain의 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_streams_on_shared_llm(self):
+        """하나의 LLM을 공유하는 동시 요청의 토큰이 각자의 SSE 큐로만 전달되는지 테스트"""
+        llm = StreamingFakeChatModel(messages=iter([
+            AIMessage(content=json.dumps({"status": "EXPLANATION", "message": "first answer"})),
+            AIMessage(content=json.dumps({"status": "EXPLANATION", "message": "second answer"})),
+        ]))
+        chain = UserChatChain(llm)
+        queues = [asyncio.Queue(), asyncio.Queue()]
+
+        async def predict(queue: asyncio.Queue):
+            return await chain.predict(
+                chat_data=UserChatChainPayload(message="설명해주세요"),
+                global_files=GlobalFileListChainPayload(),
+                current_diagram=DiagramChainPayload(),
+                callbacks=[SSEStreamingHandler(response_queue=queue)],
+            )
+
+        results = await asyncio.gather(predict(queues[0]), predict(queues[1]))
+
+        for result, queue in zip(results, queues):
+            assert _drain_tokens(queue) == result.message
+        assert not llm.callbacks
+
+    @pytest.mark.asyncio
+    async def test_full_queue_delays_tokens_instead_of_dropping(self):
+        """큐가 가득 차도 토큰을 버리지 않고 구독자가 읽을 때까지 LLM 스트림을 대기시키는지 테스트"""
+        message = "slow subscriber " * 20
+        llm = StreamingFakeChatModel(messages=iter([
+            AIMessage(content=json.dumps({"status": "EXPLANATION", "message": message})),
+        ]))
+        queue = StreamQueue(maxsize=2, overflow_policy=OverflowPolicy.BLOCK)
+        tokens = []
+
+        async def subscribe():
+            while (event := await queue.get()) is not None:
+                tokens.append(json.loads(event.removeprefix("data: "))["token"])
+                await asyncio.sleep(0)
+
+        subscriber = asyncio.create_task(subscribe())
+        result = await UserChatChain(llm).predict(
+            chat_data=UserChatChainPayload(message="설명해주세요"),
+            global_files=GlobalFileListChainPayload(),
+            current_diagram=DiagramChainPayload(),
+            callbacks=[SSEStreamingHandler(response_queue=queue)],
+        )
+        await queue.put(None)
+        await subscriber
+
+        assert "".join(tokens) == result.message == message
+        assert queue.dropped == 0